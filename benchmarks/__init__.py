@@ -0,0 +1,5 @@
+"""
+Пакет, содержащий бенчмарки репозиториев.
+
+Бенчмарки запускаются как модули, например: `python -m benchmarks.validation`.
+"""
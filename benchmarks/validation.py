@@ -0,0 +1,105 @@
+"""
+Модуль, содержащий бенчмарк приведения результатов чтения к схемам.
+
+Сравниваются режимы:
+- поштучная проверка `model_validate`;
+- пакетная проверка с помощью `TypeAdapter`;
+- создание схем без проверки `model_construct` (`trusted_read`).
+
+Каждый режим измеряется для моделей SQLAlchemy (`from_attributes`) и для строк запроса `core_read`.
+База данных не требуется.
+"""
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+from tests.repositories.models import CrudChildAModel, CrudParentModel
+from tests.repositories.repositories import ModelDbRepository
+from tests.repositories.schemas import CrudChildAModelReadSchema, CrudParentModelReadSchema
+
+READ_SCHEMAS_MAPPING: dict[type[CrudParentModel], type[BaseModel]] = {
+    CrudParentModel: CrudParentModelReadSchema,
+    CrudChildAModel: CrudChildAModelReadSchema,
+}
+
+
+def make_models(rows: int) -> list[CrudParentModel]:
+    """
+    Создаем модели SQLAlchemy без сохранения.
+    """
+    return [
+        CrudChildAModel(id=uuid.uuid4(), str_column=f'model{i}', int_column=i, float_column=i / 2, type='child_a')
+        if i % 2
+        else CrudParentModel(id=uuid.uuid4(), str_column=f'model{i}', int_column=i, type='parent')
+        for i in range(rows)
+    ]
+
+
+def measure(name: str, func: Callable[[], Sequence[Any]], rows: int, repeat: int) -> None:
+    """
+    Измеряем количество строк в секунду по лучшему из запусков.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f'{name:<40} {rows / best:>14,.0f} rows/sec')
+
+
+def run(rows: int, repeat: int) -> None:
+    """
+    Запускаем бенчмарк.
+    """
+    models = make_models(rows)
+    model_types = [type(model) for model in models]
+    mappings = [
+        {
+            field: getattr(model, field)
+            for field in READ_SCHEMAS_MAPPING[type(model)].model_fields
+            if hasattr(model, field)
+        }
+        for model in models
+    ]
+
+    measure('orm: model_validate', lambda: [ModelDbRepository.model_validate(model) for model in models], rows, repeat)
+    measure(
+        'orm: TypeAdapter',
+        lambda: ModelDbRepository.validate_many(model_types, models, from_attributes=True),
+        rows,
+        repeat,
+    )
+    ModelDbRepository.trusted_read = True
+    measure(
+        'orm: model_construct',
+        lambda: ModelDbRepository.validate_many(model_types, models, from_attributes=True),
+        rows,
+        repeat,
+    )
+    ModelDbRepository.trusted_read = False
+
+    measure(
+        'core: model_validate',
+        lambda: [
+            READ_SCHEMAS_MAPPING[model_type].model_validate(mapping)
+            for model_type, mapping in zip(model_types, mappings, strict=True)
+        ],
+        rows,
+        repeat,
+    )
+    measure('core: TypeAdapter', lambda: ModelDbRepository.validate_many(model_types, mappings), rows, repeat)
+    ModelDbRepository.trusted_read = True
+    measure('core: model_construct', lambda: ModelDbRepository.validate_many(model_types, mappings), rows, repeat)
+    ModelDbRepository.trusted_read = False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,53 @@
+"""
+Модуль, содержащий метрики пулов соединений с базой данных.
+"""
+
+from collections.abc import Mapping
+
+from aioprometheus import Counter, Gauge
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fast_clean.db import MonitoredAsyncAdaptedQueuePool, get_async_engines
+
+POOL_METRICS: dict[str, Counter | Gauge] = {
+    'size': Gauge('db_pool_size', 'Размер пула соединений.'),
+    'checked_in': Gauge('db_pool_checked_in', 'Количество свободных соединений пула.'),
+    'checked_out': Gauge('db_pool_checked_out', 'Количество занятых соединений пула.'),
+    'overflow': Gauge('db_pool_overflow', 'Количество соединений сверх размера пула.'),
+    'checkouts': Counter('db_pool_checkouts_total', 'Количество получений соединений из пула.'),
+    'checkout_time': Counter('db_pool_checkout_seconds_total', 'Суммарное время получения соединений из пула.'),
+    'max_checkout_time': Gauge('db_pool_checkout_seconds_max', 'Максимальное время получения соединения из пула.'),
+    'waits': Counter('db_pool_waits_total', 'Количество ожиданий соединения при исчерпанном пуле.'),
+    'wait_time': Counter('db_pool_wait_seconds_total', 'Суммарное время ожидания соединения при исчерпанном пуле.'),
+}
+
+async_engines: dict[str, AsyncEngine] = {}
+
+
+def register_pool_metrics(engines: Mapping[str, AsyncEngine]) -> None:
+    """
+    Регистрируем движки, метрики пулов которых отдаются в `/metrics`.
+    """
+    async_engines.update(engines)
+
+
+async def use_pool_metrics(container: AsyncContainer) -> None:
+    """
+    Регистрируем движки основной базы данных и реплик из контейнера зависимостей.
+
+    Вызывается при запуске приложения.
+    """
+    register_pool_metrics(await get_async_engines(container))
+
+
+def update_pool_metrics() -> None:
+    """
+    Обновляем метрики пулов соединений.
+    """
+    for name, async_engine in async_engines.items():
+        pool = async_engine.pool
+        if not isinstance(pool, MonitoredAsyncAdaptedQueuePool):
+            continue
+        for key, value in pool.get_status().items():
+            POOL_METRICS[key].set({'engine': name}, value)
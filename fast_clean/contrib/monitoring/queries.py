@@ -0,0 +1,226 @@
+"""
+Модуль, содержащий метрики запросов к базе данных и журнал медленных запросов.
+
+Обработчики событий `before_cursor_execute` и `after_cursor_execute` движка SQLAlchemy
+измеряют время выполнения и количество строк каждого запроса. Запросы размечаются классом
+репозитория и названием метода, см. `fast_clean.repositories.crud.instrumentation`.
+"""
+
+import logging
+import random
+import time
+from collections.abc import Mapping
+from typing import Any, Self
+
+import sqlalchemy as sa
+from aioprometheus import Counter, Histogram
+from dishka import AsyncContainer
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fast_clean.db import get_async_engines
+from fast_clean.repositories.crud.instrumentation import get_query_tag
+from fast_clean.settings import CoreDbSettingsSchema
+
+QUERY_DURATION = Histogram('db_query_duration_seconds', 'Время выполнения запросов к базе данных.')
+QUERY_ROWS = Counter('db_query_rows_total', 'Количество строк, полученных или измененных запросами.')
+SLOW_QUERIES = Counter('db_slow_queries_total', 'Количество медленных запросов к базе данных.')
+
+logger = logging.getLogger(__name__)
+
+
+class QueryInstrumentation:
+    """
+    Обработчики событий движка, собирающие метрики запросов.
+
+    Запросы дольше `slow_query_threshold` секунд записываются в журнал с вероятностью
+    `slow_query_sample_rate`. При `slow_query_explain` для запросов `SELECT` в журнал добавляется
+    план `EXPLAIN ANALYZE`. План получается повторным выполнением запроса в точке сохранения,
+    поэтому увеличивает нагрузку на базу данных и не должен включаться с высокой частотой.
+    """
+
+    START_TIME_KEY = 'fast_clean_query_start_time'
+    EXPLAIN_SAVEPOINT = 'fast_clean_explain'
+
+    def __init__(
+        self,
+        engine_name: str,
+        *,
+        slow_query_threshold: float | None = None,
+        slow_query_sample_rate: float = 1.0,
+        slow_query_explain: bool = False,
+    ) -> None:
+        self.engine_name = engine_name
+        self.slow_query_threshold = slow_query_threshold
+        self.slow_query_sample_rate = slow_query_sample_rate
+        self.slow_query_explain = slow_query_explain
+
+    def register(self: Self, async_engine: AsyncEngine) -> None:
+        """
+        Регистрируем обработчики событий движка.
+        """
+        sync_engine = async_engine.sync_engine
+        sa.event.listen(sync_engine, 'before_cursor_execute', self.before_cursor_execute)
+        sa.event.listen(sync_engine, 'after_cursor_execute', self.after_cursor_execute)
+        sa.event.listen(sync_engine, 'handle_error', self.handle_error)
+
+    def unregister(self: Self, async_engine: AsyncEngine) -> None:
+        """
+        Удаляем обработчики событий движка.
+        """
+        sync_engine = async_engine.sync_engine
+        sa.event.remove(sync_engine, 'before_cursor_execute', self.before_cursor_execute)
+        sa.event.remove(sync_engine, 'after_cursor_execute', self.after_cursor_execute)
+        sa.event.remove(sync_engine, 'handle_error', self.handle_error)
+
+    def before_cursor_execute(
+        self: Self,
+        conn: sa.Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """
+        Запоминаем время начала выполнения запроса.
+        """
+        conn.info.setdefault(self.START_TIME_KEY, []).append(time.perf_counter())
+
+    def after_cursor_execute(
+        self: Self,
+        conn: sa.Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """
+        Записываем метрики выполненного запроса.
+        """
+        duration = time.perf_counter() - conn.info[self.START_TIME_KEY].pop()
+        labels = self.get_labels()
+        QUERY_DURATION.observe(labels, duration)
+        if cursor.rowcount > 0:
+            QUERY_ROWS.add(labels, cursor.rowcount)
+        if self.slow_query_threshold is None or duration < self.slow_query_threshold:
+            return
+        SLOW_QUERIES.inc(labels)
+        if random.random() >= self.slow_query_sample_rate:
+            return
+        plan = None
+        if self.slow_query_explain and not executemany and self.is_explainable(statement, context):
+            plan = self.explain_analyze(conn, statement, parameters)
+        logger.warning(
+            'Slow query %.3fs %s.%s: %s',
+            duration,
+            labels['repository'],
+            labels['method'],
+            statement,
+            extra={'duration': duration, 'parameters': parameters, 'plan': plan, **labels},
+        )
+
+    def handle_error(self: Self, exception_context: sa.engine.ExceptionContext) -> None:
+        """
+        Удаляем время начала выполнения запроса, завершившегося ошибкой.
+        """
+        if exception_context.connection is not None:
+            exception_context.connection.info.pop(self.START_TIME_KEY, None)
+
+    def get_labels(self: Self) -> dict[str, str]:
+        """
+        Получаем метки метрик запроса.
+        """
+        tag = get_query_tag()
+        return {
+            'engine': self.engine_name,
+            'repository': tag.repository if tag is not None else '',
+            'method': tag.method if tag is not None else '',
+        }
+
+    @staticmethod
+    def is_explainable(statement: str, context: ExecutionContext | None) -> bool:
+        """
+        Проверяем, можно ли повторно выполнить запрос для получения плана.
+
+        Повторно выполняются только запросы на чтение без серверного курсора.
+        """
+        if context is not None and context.execution_options.get('stream_results', False):
+            return False
+        return statement.lstrip().upper().startswith('SELECT')
+
+    @classmethod
+    def explain_analyze(cls, conn: sa.Connection, statement: str, parameters: Any) -> str | None:
+        """
+        Получаем план выполнения запроса.
+
+        Запрос выполняется в точке сохранения, чтобы ошибка не прерывала транзакцию.
+        """
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f'SAVEPOINT {cls.EXPLAIN_SAVEPOINT}')
+            try:
+                cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {statement}', parameters)
+                plan = '\n'.join(row[0] for row in cursor.fetchall())
+            except Exception:
+                cursor.execute(f'ROLLBACK TO SAVEPOINT {cls.EXPLAIN_SAVEPOINT}')
+                logger.exception('Failed to explain slow query')
+                return None
+            cursor.execute(f'RELEASE SAVEPOINT {cls.EXPLAIN_SAVEPOINT}')
+            return plan
+        finally:
+            cursor.close()
+
+
+query_instrumentations: dict[str, tuple[AsyncEngine, QueryInstrumentation]] = {}
+
+
+def register_query_metrics(
+    engines: Mapping[str, AsyncEngine],
+    *,
+    slow_query_threshold: float | None = None,
+    slow_query_sample_rate: float = 1.0,
+    slow_query_explain: bool = False,
+) -> None:
+    """
+    Регистрируем движки, метрики запросов которых отдаются в `/metrics`.
+    """
+    for name, async_engine in engines.items():
+        unregister_query_metrics(name)
+        instrumentation = QueryInstrumentation(
+            name,
+            slow_query_threshold=slow_query_threshold,
+            slow_query_sample_rate=slow_query_sample_rate,
+            slow_query_explain=slow_query_explain,
+        )
+        instrumentation.register(async_engine)
+        query_instrumentations[name] = (async_engine, instrumentation)
+
+
+def unregister_query_metrics(name: str) -> None:
+    """
+    Удаляем обработчики событий движка.
+    """
+    registered = query_instrumentations.pop(name, None)
+    if registered is not None:
+        async_engine, instrumentation = registered
+        instrumentation.unregister(async_engine)
+
+
+async def use_query_metrics(container: AsyncContainer) -> None:
+    """
+    Регистрируем движки основной базы данных и реплик из контейнера зависимостей.
+
+    Настройки журнала медленных запросов берутся из `CoreDbSettingsSchema`. Вызывается при запуске приложения.
+    """
+    from fast_clean.repositories import SettingsRepositoryProtocol
+
+    settings_repository = await container.get(SettingsRepositoryProtocol)
+    db_settings = await settings_repository.get(CoreDbSettingsSchema)
+    register_query_metrics(
+        await get_async_engines(container),
+        slow_query_threshold=db_settings.slow_query_threshold,
+        slow_query_sample_rate=db_settings.slow_query_sample_rate,
+        slow_query_explain=db_settings.slow_query_explain,
+    )
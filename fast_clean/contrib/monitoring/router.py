@@ -1,6 +1,15 @@
 from aioprometheus.asgi.starlette import metrics
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+
+from .pool import update_pool_metrics
 
 router = APIRouter(tags=['Monitoring'])
 
-router.get('/metrics')(metrics)
+
+@router.get('/metrics')
+async def get_metrics(request: Request) -> Response:
+    """
+    Получаем метрики приложения.
+    """
+    update_pool_metrics()
+    return await metrics(request)
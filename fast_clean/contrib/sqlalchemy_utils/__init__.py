@@ -0,0 +1,4 @@
+from .utils import create_search_indexes as create_search_indexes
+from .utils import drop_search_indexes as drop_search_indexes
+from .utils import get_search_index_name as get_search_index_name
+from .utils import render_item as render_item
@@ -1,8 +1,12 @@
+from collections.abc import Sequence
 from typing import Any
 
 import sqlalchemy_utils
+from alembic import op
 from alembic.autogenerate.api import AutogenContext
 
+from fast_clean.repositories.crud.search import SearchBackendProtocol
+
 
 def render_item(type_: str, obj: Any, autogen_context: AutogenContext):
     """
@@ -24,3 +28,56 @@ def render_item(type_: str, obj: Any, autogen_context: AutogenContext):
 
     # Default rendering for other objects
     return False
+
+
+def get_search_index_name(table_name: str, column_name: str, search_backend: SearchBackendProtocol) -> str:
+    """
+    Get the name of the search index.
+    """
+    return f'ix_{table_name}_{column_name}_{search_backend.index_suffix}'
+
+
+def create_search_indexes(
+    table_name: str,
+    column_names: Sequence[str],
+    search_backend: SearchBackendProtocol,
+    *,
+    schema: str | None = None,
+    concurrently: bool = False,
+) -> None:
+    """
+    Create GIN indexes matching the search backend of the repository.
+
+    Should be called inside an alembic migration. Required extensions are created if missing.
+    """
+    for extension in search_backend.extensions:
+        op.execute(f'CREATE EXTENSION IF NOT EXISTS {extension}')
+    for column_name in column_names:
+        op.create_index(
+            get_search_index_name(table_name, column_name, search_backend),
+            table_name,
+            [search_backend.get_index_expression(column_name)],
+            schema=schema,
+            postgresql_using='gin',
+            postgresql_concurrently=concurrently,
+        )
+
+
+def drop_search_indexes(
+    table_name: str,
+    column_names: Sequence[str],
+    search_backend: SearchBackendProtocol,
+    *,
+    schema: str | None = None,
+    concurrently: bool = False,
+) -> None:
+    """
+    Drop GIN indexes created by `create_search_indexes`.
+    """
+    for column_name in column_names:
+        op.drop_index(
+            get_search_index_name(table_name, column_name, search_backend),
+            table_name=table_name,
+            schema=schema,
+            postgresql_concurrently=concurrently,
+        )
@@ -4,12 +4,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import time
 import uuid
-from collections.abc import AsyncIterator
+import warnings
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, AsyncContextManager, Protocol, Self
+from weakref import WeakKeyDictionary
 
+import psycopg
 import sqlalchemy as sa
+from dishka import AsyncContainer
+from fastapi import FastAPI
+from psycopg.abc import Params, Query
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
@@ -18,8 +28,11 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.sql import func
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+from sqlalchemy.sql import ClauseElement, Executable, func
+from sqlalchemy.sql.compiler import SQLCompiler
 from sqlalchemy_utils.types import UUIDType
 
 from .settings import CoreDbSettingsSchema, CoreSettingsSchema
@@ -37,6 +50,8 @@ POSTGRES_INDEXES_NAMING_CONVENTION = {
 
 metadata = MetaData(naming_convention=POSTGRES_INDEXES_NAMING_CONVENTION)
 
+PGBOUNCER_LIBPQ_VERSION = 170000
+
 
 def make_async_engine(
     db_dsn: str,
@@ -45,19 +60,73 @@ def make_async_engine(
     echo: bool = False,
     pool_pre_ping: bool = True,
     disable_prepared_statements: bool = True,
+    prepare_threshold: int = 5,
+    prepared_max: int = 100,
+    pgbouncer: bool = False,
+    pipeline: bool = False,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle: int = -1,
+    pool_timeout: float = 30.0,
+    pool_use_lifo: bool = False,
 ) -> AsyncEngine:
     """
     Создаем асинхронный движок.
+
+    Пул соединений собирает метрики получения соединений, см. `MonitoredAsyncAdaptedQueuePool`.
+
+    Подготовленные выражения создаются после `prepare_threshold` выполнений запроса, на соединении
+    хранится не более `prepared_max` выражений. За PgBouncer (`pgbouncer=True`) подготовленные выражения
+    поддерживаются PgBouncer 1.22+ в режиме транзакций при libpq 17+, т.к. только с ней psycopg удаляет
+    выражения на уровне протокола, а не запросом `DEALLOCATE`. С более старой libpq подготовленные
+    выражения отключаются.
+
+    При `pipeline=True` запросы с отложенными результатами отправляются в режиме конвейера psycopg
+    вместе со следующим запросом, см. `deferred_results`. Режим конвейера требует libpq 14+,
+    с более старой libpq он отключается.
     """
+    if not disable_prepared_statements and pgbouncer and psycopg.pq.version() < PGBOUNCER_LIBPQ_VERSION:
+        warnings.warn(
+            'Prepared statements behind PgBouncer require libpq 17+, prepared statements are disabled',
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        disable_prepared_statements = True
+    if pipeline and not psycopg.AsyncPipeline.is_supported():
+        warnings.warn('Pipeline mode requires libpq 14+, pipeline mode is disabled', RuntimeWarning, stacklevel=2)
+        pipeline = False
     connect_args: dict[str, Any] = {}
+    if pipeline:
+        connect_args['cursor_factory'] = PipelineCursor
     if disable_prepared_statements:
         connect_args['prepare_threshold'] = None
-    return create_async_engine(
+    else:
+        connect_args['prepare_threshold'] = prepare_threshold
+    async_engine = create_async_engine(
         db_dsn,
         echo=echo,
         pool_pre_ping=pool_pre_ping,
         connect_args=connect_args,
+        poolclass=MonitoredAsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_timeout=pool_timeout,
+        pool_use_lifo=pool_use_lifo,
     )
+    if not disable_prepared_statements:
+
+        @sa.event.listens_for(async_engine.sync_engine, 'connect')
+        def set_prepared_max(dbapi_connection: Any, connection_record: Any) -> None:
+            dbapi_connection.driver_connection.prepared_max = prepared_max
+
+    if pipeline:
+
+        @sa.event.listens_for(async_engine.sync_engine, 'connect')
+        def set_server_cursor_factory(dbapi_connection: Any, connection_record: Any) -> None:
+            dbapi_connection.driver_connection.server_cursor_factory = PipelineServerCursor
+
+    return async_engine
 
 
 def make_async_session_factory(
@@ -67,6 +136,15 @@ def make_async_session_factory(
     echo: bool = False,
     pool_pre_ping: bool = True,
     disable_prepared_statements: bool = True,
+    prepare_threshold: int = 5,
+    prepared_max: int = 100,
+    pgbouncer: bool = False,
+    pipeline: bool = False,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle: int = -1,
+    pool_timeout: float = 30.0,
+    pool_use_lifo: bool = False,
 ) -> async_sessionmaker[AsyncSession]:
     """
     Создаем фабрику асинхронных сессий.
@@ -77,10 +155,238 @@ def make_async_session_factory(
         echo=echo,
         pool_pre_ping=pool_pre_ping,
         disable_prepared_statements=disable_prepared_statements,
+        prepare_threshold=prepare_threshold,
+        prepared_max=prepared_max,
+        pgbouncer=pgbouncer,
+        pipeline=pipeline,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_timeout=pool_timeout,
+        pool_use_lifo=pool_use_lifo,
     )
     return async_sessionmaker(asyncio_engine, expire_on_commit=False, autoflush=False)
 
 
+async def prewarm_async_engine(async_engine: AsyncEngine, connections: int) -> None:
+    """
+    Открываем соединения пула заранее, чтобы первые запросы не ожидали установки соединения.
+
+    Количество соединений ограничено размером пула, т.к. соединения сверх него закрываются
+    при возврате в пул.
+    """
+    if isinstance(async_engine.pool, QueuePool):
+        connections = min(connections, async_engine.pool.size())
+    if connections <= 0:
+        return
+    async with contextlib.AsyncExitStack() as stack:
+        await asyncio.gather(*(stack.enter_async_context(async_engine.connect()) for _ in range(connections)))
+
+
+pipelines: WeakKeyDictionary[psycopg.AsyncConnection[Any], AsyncContextManager[psycopg.AsyncPipeline]] = (
+    WeakKeyDictionary()
+)
+deferred_results_var: ContextVar[bool] = ContextVar('deferred_results', default=False)
+
+
+async def enter_pipeline(connection: psycopg.AsyncConnection[Any]) -> None:
+    """
+    Переводим соединение в режим конвейера.
+    """
+    if connection not in pipelines:
+        active_pipeline = connection.pipeline()
+        await active_pipeline.__aenter__()
+        pipelines[connection] = active_pipeline
+
+
+async def exit_pipeline(connection: psycopg.AsyncConnection[Any], error: BaseException | None = None) -> None:
+    """
+    Выводим соединение из режима конвейера, получая результаты отправленных запросов.
+
+    Если выход вызван ошибкой `error`, ошибки отправленных запросов не выбрасываются.
+    """
+    active_pipeline = pipelines.pop(connection, None)
+    if active_pipeline is not None:
+        await active_pipeline.__aexit__(type(error) if error else None, error, error.__traceback__ if error else None)
+
+
+class PipelineCursor(psycopg.AsyncCursor[Any]):
+    """
+    Курсор, отправляющий запросы с отложенными результатами в режиме конвейера.
+
+    Перед запросом с отложенными результатами (см. `deferred_results`) соединение переводится в режим конвейера,
+    и запрос отправляется без ожидания ответа. SQLAlchemy читает результат сразу после выполнения запроса,
+    поэтому остальные запросы выводят соединение из режима конвейера. Отправленные запросы и текущий запрос
+    выполняются за один сетевой обмен.
+    """
+
+    async def execute(
+        self: Self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool | None = None,
+    ) -> Self:
+        """
+        Выполняем запрос.
+        """
+        deferred = deferred_results_var.get()
+        if deferred:
+            await enter_pipeline(self.connection)
+        elif self.connection not in pipelines:
+            return await super().execute(query, params, prepare=prepare, binary=binary)
+        try:
+            await super().execute(query, params, prepare=prepare, binary=binary)
+        except BaseException as error:
+            await exit_pipeline(self.connection, error)
+            raise
+        if not deferred:
+            await exit_pipeline(self.connection)
+        return self
+
+
+class PipelineServerCursor(psycopg.AsyncServerCursor[Any]):
+    """
+    Серверный курсор для соединений с режимом конвейера.
+
+    Серверные курсоры не поддерживаются в режиме конвейера, поэтому перед выполнением запроса
+    соединение выводится из него.
+    """
+
+    async def execute(
+        self: Self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        binary: bool | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Выполняем запрос.
+        """
+        await exit_pipeline(self.connection)
+        return await super().execute(query, params, binary=binary, **kwargs)
+
+
+@asynccontextmanager
+async def deferred_results(session: AsyncSession) -> AsyncIterator[None]:
+    """
+    Откладываем получение результатов запросов сессии.
+
+    Для движков с `pipeline=True` запросы блока отправляются в режиме конвейера без ожидания ответа,
+    поэтому их результаты недоступны, а ошибки возникают при следующем запросе или в `sync_pipeline`.
+    Для остальных движков запросы выполняются как обычно. Соединение сессии получается заранее,
+    чтобы запросы при подключении не выполнялись с отложенными результатами.
+    """
+    await session.connection()
+    token = deferred_results_var.set(True)
+    try:
+        yield
+    finally:
+        deferred_results_var.reset(token)
+
+
+async def sync_pipeline(session: AsyncSession) -> None:
+    """
+    Получаем результаты запросов сессии с отложенными результатами.
+
+    Ошибки запросов преобразуются в исключения SQLAlchemy, как при выполнении запроса.
+    """
+    if not pipelines:
+        return
+    connection = (await (await session.connection()).get_raw_connection()).driver_connection
+    if not isinstance(connection, psycopg.AsyncConnection):
+        return
+    try:
+        await exit_pipeline(connection)
+    except psycopg.Error as error:
+        raise sa.exc.DBAPIError.instance(None, None, error, psycopg.Error) from error
+
+
+class PoolMetrics:
+    """
+    Метрики получения соединений из пула.
+
+    Ожиданием считается получение соединения при исчерпанном пуле.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_time = 0.0
+        self.max_checkout_time = 0.0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def observe_checkout(self: Self, duration: float, waited: bool) -> None:
+        """
+        Учитываем получение соединения.
+        """
+        self.checkouts += 1
+        self.checkout_time += duration
+        self.max_checkout_time = max(self.max_checkout_time, duration)
+        if waited:
+            self.waits += 1
+            self.wait_time += duration
+
+
+class MonitoredAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Асинхронный пул соединений с метриками получения соединений.
+    """
+
+    def __init__(self, creator: Any, pool_size: int = 5, max_overflow: int = 10, **kwargs: Any) -> None:
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.metrics = PoolMetrics()
+
+    def connect(self: Self) -> PoolProxiedConnection:
+        """
+        Получаем соединение из пула.
+        """
+        waited = self.checkedin() == 0 and -1 < self.max_overflow <= self.overflow()
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.metrics.observe_checkout(time.perf_counter() - start, waited)
+
+    def get_status(self: Self) -> dict[str, float]:
+        """
+        Получаем состояние пула и метрики получения соединений.
+        """
+        return {
+            'size': self.size(),
+            'checked_in': self.checkedin(),
+            'checked_out': self.checkedout(),
+            'overflow': self.overflow(),
+            'checkouts': self.metrics.checkouts,
+            'checkout_time': self.metrics.checkout_time,
+            'max_checkout_time': self.metrics.max_checkout_time,
+            'waits': self.metrics.waits,
+            'wait_time': self.metrics.wait_time,
+        }
+
+
+class Explain(Executable, ClauseElement):
+    """
+    Запрос плана выполнения в формате JSON.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: sa.Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    """
+    Компилируем запрос плана выполнения.
+    """
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}'
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     """
     Базовая родительская модель.
@@ -154,23 +460,126 @@ class SessionFactory:
         """
         settings = await settings_repository.get(CoreSettingsSchema)
         db_settings = await settings_repository.get(CoreDbSettingsSchema)
+        return SessionFactory.make_async_session_factory_with_settings(db_settings.dsn, settings, db_settings)
+
+    @staticmethod
+    def make_async_session_factory_with_settings(
+        db_dsn: str, settings: CoreSettingsSchema, db_settings: CoreDbSettingsSchema
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Создаем фабрику асинхронных сессий по настройкам.
+        """
         return make_async_session_factory(
-            db_settings.dsn,
+            db_dsn,
             scheme=db_settings.scheme,
             echo=settings.debug,
             pool_pre_ping=db_settings.pool_pre_ping,
             disable_prepared_statements=db_settings.disable_prepared_statements,
+            prepare_threshold=db_settings.prepare_threshold,
+            prepared_max=db_settings.prepared_max,
+            pgbouncer=db_settings.pgbouncer,
+            pipeline=db_settings.pipeline,
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_recycle=db_settings.pool_recycle,
+            pool_timeout=db_settings.pool_timeout,
+            pool_use_lifo=db_settings.pool_use_lifo,
+        )
+
+    @staticmethod
+    async def make_replica_pool(settings_repository: SettingsRepositoryProtocol) -> ReplicaPool:
+        """
+        Создаем пул сессий реплик базы данных.
+        """
+        settings = await settings_repository.get(CoreSettingsSchema)
+        db_settings = await settings_repository.get(CoreDbSettingsSchema)
+        return ReplicaPool(
+            [
+                SessionFactory.make_async_session_factory_with_settings(replica_dsn, settings, db_settings)
+                for replica_dsn in db_settings.replica_dsns
+            ],
+            max_lag=db_settings.replica_max_lag,
+            lag_check_interval=db_settings.replica_lag_check_interval,
+            read_your_writes_window=db_settings.read_your_writes_window,
         )
 
 
+class ReplicaPool:
+    """
+    Пул сессий реплик базы данных.
+
+    Реплики выбираются по очереди. Если задан `max_lag`, реплика используется только при
+    отставании от основной базы данных не более `max_lag` секунд. Отставание проверяется
+    не чаще одного раза в `lag_check_interval` секунд, недоступная реплика не используется
+    в течение `lag_check_interval` секунд.
+    """
+
+    LAG_STATEMENT = sa.text(
+        'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+        'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+    )
+
+    def __init__(
+        self,
+        session_factories: Sequence[async_sessionmaker[AsyncSession]],
+        *,
+        max_lag: float | None = None,
+        lag_check_interval: float = 5.0,
+        read_your_writes_window: float | None = None,
+    ) -> None:
+        self.session_factories = list(session_factories)
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.read_your_writes_window = read_your_writes_window
+        self.lags: dict[int, tuple[float, float]] = {}
+        self.next_index = 0
+
+    def get_indexes(self: Self) -> list[int]:
+        """
+        Получаем индексы реплик в порядке их выбора.
+        """
+        count = len(self.session_factories)
+        if count == 0:
+            return []
+        start, self.next_index = self.next_index, (self.next_index + 1) % count
+        return [(start + i) % count for i in range(count)]
+
+    async def check_lag(self: Self, index: int, session: AsyncSession) -> bool:
+        """
+        Проверяем, что реплика доступна и ее отставание допустимо.
+
+        Соединение с репликой получается до выполнения запросов вызывающего кода, поэтому
+        недоступная реплика обнаруживается заранее. Пул проверяет соединение при выдаче (`pool_pre_ping`).
+        """
+        now = time.monotonic()
+        checked_at, lag = self.lags.get(index, (-float('inf'), 0.0))
+        if now - checked_at > self.lag_check_interval:
+            lag = 0.0
+            if self.max_lag is not None:
+                lag = float((await session.execute(self.LAG_STATEMENT)).scalar_one())
+                self.lags[index] = (now, lag)
+        if lag == float('inf'):
+            return False
+        await session.connection()
+        return self.max_lag is None or lag <= self.max_lag
+
+    def mark_unavailable(self: Self, index: int) -> None:
+        """
+        Помечаем реплику недоступной до следующей проверки отставания.
+        """
+        self.lags[index] = (time.monotonic(), float('inf'))
+
+
 class SessionManagerProtocol(Protocol):
     """
     Протокол менеджера сессий.
     """
 
-    def get_session(self: Self, immediate: bool = True) -> AsyncContextManager[AsyncSession]:
+    def get_session(self: Self, immediate: bool = True, read_only: bool = False) -> AsyncContextManager[AsyncSession]:
         """
         Получаем сессию для выполнения запроса.
+
+        Запросы только на чтение (`read_only`) могут выполняться на реплике.
         """
         ...
 
@@ -184,14 +593,145 @@ class SessionManagerImpl:
         self.session = session
 
     @asynccontextmanager
-    async def get_session(self: Self, immediate: bool = True) -> AsyncIterator[AsyncSession]:
+    async def get_session(self: Self, immediate: bool = True, read_only: bool = False) -> AsyncIterator[AsyncSession]:
         """
         Получаем сессию для выполнения запроса.
+
+        Результат `SET CONSTRAINTS` откладывается, поэтому в режиме конвейера он отправляется вместе
+        с первым запросом транзакции. Перед завершением транзакции получаются результаты всех
+        отложенных запросов, см. `deferred_results`.
         """
         if self.session.in_transaction():
             yield self.session
         else:
             async with self.session.begin():
                 if immediate:
-                    await self.session.execute(sa.text('SET CONSTRAINTS ALL IMMEDIATE'))
-                yield self.session
+                    async with deferred_results(self.session):
+                        await self.session.execute(sa.text('SET CONSTRAINTS ALL IMMEDIATE'))
+                try:
+                    yield self.session
+                except BaseException:
+                    with contextlib.suppress(sa.exc.SQLAlchemyError):
+                        await sync_pipeline(self.session)
+                    raise
+                await sync_pipeline(self.session)
+
+
+class ReplicaSessionManagerImpl(SessionManagerImpl):
+    """
+    Реализация менеджера сессий с чтением из реплик.
+
+    Запросы только на чтение выполняются на реплике, если основная сессия не находится
+    в транзакции и с последней записи прошло больше `read_your_writes_window` секунд.
+    При `read_your_writes_window=None` после записи все запросы выполняются на основной
+    базе данных. Если подходящей реплики нет, используется основная база данных.
+    """
+
+    def __init__(self, session: AsyncSession, replica_pool: ReplicaPool) -> None:
+        super().__init__(session)
+        self.replica_pool = replica_pool
+        self.replica_sessions: dict[int, AsyncSession] = {}
+        self.last_write_at: float | None = None
+
+    @asynccontextmanager
+    async def get_session(self: Self, immediate: bool = True, read_only: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Получаем сессию для выполнения запроса.
+
+        Вложенный запрос на чтение выполняется в уже начатой транзакции реплики.
+        """
+        if read_only and not self.session.in_transaction() and not self.is_read_your_writes():
+            active_session = next((rs for rs in self.replica_sessions.values() if rs.in_transaction()), None)
+            if active_session is not None:
+                yield active_session
+                return
+            used = False
+            for index in self.replica_pool.get_indexes():
+                replica_session = self.get_replica_session(index)
+                try:
+                    async with replica_session.begin():
+                        if await self.replica_pool.check_lag(index, replica_session):
+                            used = True
+                            yield replica_session
+                            return
+                except sa.exc.DBAPIError:
+                    if used:
+                        raise
+                    self.replica_pool.mark_unavailable(index)
+        try:
+            async with super().get_session(immediate, read_only) as session:
+                yield session
+        finally:
+            if not read_only:
+                self.last_write_at = time.monotonic()
+
+    def is_read_your_writes(self: Self) -> bool:
+        """
+        Проверяем, должны ли запросы на чтение видеть последнюю запись.
+        """
+        if self.last_write_at is None:
+            return False
+        window = self.replica_pool.read_your_writes_window
+        return window is None or time.monotonic() - self.last_write_at < window
+
+    def get_replica_session(self: Self, index: int) -> AsyncSession:
+        """
+        Получаем сессию реплики.
+        """
+        replica_session = self.replica_sessions.get(index)
+        if replica_session is None:
+            replica_session = self.replica_sessions[index] = self.replica_pool.session_factories[index]()
+        return replica_session
+
+    async def close(self: Self) -> None:
+        """
+        Закрываем сессии реплик.
+        """
+        for replica_session in self.replica_sessions.values():
+            await replica_session.close()
+        self.replica_sessions.clear()
+
+
+async def get_async_engines(container: AsyncContainer) -> dict[str, AsyncEngine]:
+    """
+    Получаем асинхронные движки основной базы данных и реплик из контейнера зависимостей.
+    """
+    session_factory = await container.get(async_sessionmaker[AsyncSession])
+    replica_pool = await container.get(ReplicaPool)
+    async_engines: dict[str, AsyncEngine] = {'primary': session_factory.kw['bind']}
+    for index, replica_session_factory in enumerate(replica_pool.session_factories):
+        async_engines[f'replica_{index}'] = replica_session_factory.kw['bind']
+    return async_engines
+
+
+async def prewarm_db_pools(container: AsyncContainer) -> None:
+    """
+    Открываем `pool_prewarm` соединений в пулах основной базы данных и реплик.
+
+    Вызывается при запуске приложения, для FastAPI см. `use_prewarm_db_pools`.
+    """
+    from .repositories import SettingsRepositoryProtocol
+
+    settings_repository = await container.get(SettingsRepositoryProtocol)
+    db_settings = await settings_repository.get(CoreDbSettingsSchema)
+    async_engines = await get_async_engines(container)
+    await asyncio.gather(
+        *(prewarm_async_engine(async_engine, db_settings.pool_prewarm) for async_engine in async_engines.values())
+    )
+
+
+def use_prewarm_db_pools(app: FastAPI) -> None:
+    """
+    Открываем соединения пулов при запуске приложения FastAPI.
+
+    Используется контейнер зависимостей приложения, см. `ContainerManager.init_for_fastapi`.
+    """
+    lifespan_context = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[Any]:
+        await prewarm_db_pools(app.state.dishka_container)
+        async with lifespan_context(app) as state:
+            yield state
+
+    app.router.lifespan_context = lifespan
@@ -15,10 +15,12 @@ from starlette.datastructures import FormData
 from stringcase import snakecase
 
 from .broker import BrokerFactory
-from .db import SessionFactory, SessionManagerImpl, SessionManagerProtocol
+from .db import ReplicaPool, ReplicaSessionManagerImpl, SessionFactory, SessionManagerImpl, SessionManagerProtocol
 from .repositories import (
+    CachedCrudRepositoryFactory,
     CacheManager,
     CacheRepositoryProtocol,
+    CrudDataLoader,
     LocalStorageParamsSchema,
     S3StorageParamsSchema,
     SettingsRepositoryFactoryImpl,
@@ -91,6 +93,7 @@ class CoreProvider(Provider):
     storage_repository_factory = provide(
         StorageRepositoryFactoryImpl, provides=StorageRepositoryFactoryProtocol, scope=Scope.APP
     )
+    crud_data_loader = provide(CrudDataLoader)
 
     @provide(scope=Scope.APP)
     @staticmethod
@@ -136,6 +139,14 @@ class CoreProvider(Provider):
         cache_settings = await settings_repository.get(CoreCacheSettingsSchema)
         return CacheManager.init(cache_settings)
 
+    @provide(scope=Scope.APP)
+    @staticmethod
+    def get_cached_crud_repository_factory(cache_repository: CacheRepositoryProtocol) -> CachedCrudRepositoryFactory:
+        """
+        Получаем фабрику репозиториев с кешированием чтения.
+        """
+        return CachedCrudRepositoryFactory(cache_repository)
+
     @provide
     @staticmethod
     async def get_storage_repository(
@@ -180,13 +191,32 @@ class CoreProvider(Provider):
         async with session_maker() as session:
             yield session
 
+    @provide(scope=Scope.APP)
+    @staticmethod
+    async def get_replica_pool(settings_repository: SettingsRepositoryProtocol) -> ReplicaPool:
+        """
+        Получаем пул сессий реплик базы данных.
+        """
+        return await SessionFactory.make_replica_pool(settings_repository)
+
     @provide
     @staticmethod
-    def get_session_manager(session: AsyncSession) -> SessionManagerProtocol:
+    async def get_session_manager(
+        session: AsyncSession, replica_pool: ReplicaPool
+    ) -> AsyncIterator[SessionManagerProtocol]:
         """
         Получаем менеджер сессий.
+
+        При наличии реплик запросы на чтение выполняются на них.
         """
-        return SessionManagerImpl(session)
+        if not replica_pool.session_factories:
+            yield SessionManagerImpl(session)
+            return
+        session_manager = ReplicaSessionManagerImpl(session, replica_pool)
+        try:
+            yield session_manager
+        finally:
+            await session_manager.close()
 
     # --- services ---
 
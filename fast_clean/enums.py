@@ -37,3 +37,34 @@ class ModelActionEnum(StrEnum):
     UPDATE = auto()
     UPSERT = auto()
     DELETE = auto()
+
+
+class CountStrategyEnum(StrEnum):
+    """
+    Способ подсчета количества моделей при пагинации.
+    """
+
+    EXACT = auto()
+    ESTIMATED = auto()
+    NONE = auto()
+
+
+class PolymorphicLoadingEnum(StrEnum):
+    """
+    Способ загрузки полей наследников при чтении моделей.
+    """
+
+    SELECTIN = auto()
+    JOINED = auto()
+    AUTO = auto()
+
+
+class AggregateFunctionEnum(StrEnum):
+    """
+    Агрегатная функция над полем моделей.
+    """
+
+    COUNT = auto()
+    SUM = auto()
+    MIN = auto()
+    MAX = auto()
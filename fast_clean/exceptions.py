@@ -210,6 +210,48 @@ class SortingFieldNotFoundError(BusinessLogicException):
         return f'Не удалось найти поле для сортировки: {self.field}'
 
 
+class ProjectionFieldNotFoundError(BusinessLogicException):
+    """
+    Ошибка, возникающая при невозможности найти поле для проекции.
+    """
+
+    def __init__(self, field: str, *args: object) -> None:
+        super().__init__(*args)
+        self.field = field
+
+    @property
+    def msg(self: Self) -> str:
+        return f'Не удалось найти поле для проекции: {self.field}'
+
+
+class AggregateFieldNotFoundError(BusinessLogicException):
+    """
+    Ошибка, возникающая при невозможности найти поле для агрегации.
+    """
+
+    def __init__(self, field: str, *args: object) -> None:
+        super().__init__(*args)
+        self.field = field
+
+    @property
+    def msg(self: Self) -> str:
+        return f'Не удалось найти поле для агрегации: {self.field}'
+
+
+class InvalidCursorError(BusinessLogicException):
+    """
+    Ошибка, возникающая при передаче некорректного курсора пагинации.
+    """
+
+    def __init__(self, cursor: str, *args: object) -> None:
+        super().__init__(*args)
+        self.cursor = cursor
+
+    @property
+    def msg(self: Self) -> str:
+        return f'Некорректный курсор пагинации: {self.cursor}'
+
+
 async def business_logic_exception_handler(
     settings: CoreSettingsSchema, request: Request, exception: BusinessLogicException
 ) -> Response:
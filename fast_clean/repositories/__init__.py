@@ -6,10 +6,17 @@ from .cache import CacheManager as CacheManager
 from .cache import CacheRepositoryProtocol as CacheRepositoryProtocol
 from .cache import InMemoryCacheRepository as InMemoryCacheRepository
 from .cache import RedisCacheRepository as RedisCacheRepository
+from .crud import CachedCrudRepository as CachedCrudRepository
+from .crud import CachedCrudRepositoryFactory as CachedCrudRepositoryFactory
+from .crud import CrudDataLoader as CrudDataLoader
 from .crud import CrudRepositoryIntProtocol as CrudRepositoryIntProtocol
 from .crud import CrudRepositoryProtocol as CrudRepositoryProtocol
 from .crud import DbCrudRepository as DbCrudRepository
 from .crud import DbCrudRepositoryInt as DbCrudRepositoryInt
+from .crud import FullTextSearchBackend as FullTextSearchBackend
+from .crud import IlikeSearchBackend as IlikeSearchBackend
+from .crud import SearchBackendProtocol as SearchBackendProtocol
+from .crud import TrigramSearchBackend as TrigramSearchBackend
 from .settings import EnvSettingsRepository as EnvSettingsRepository
 from .settings import SettingsRepositoryError as SettingsRepositoryError
 from .settings import SettingsRepositoryFactoryImpl as SettingsRepositoryFactoryImpl
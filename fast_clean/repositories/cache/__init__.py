@@ -6,6 +6,7 @@
 - Redis
 """
 
+from collections.abc import Sequence
 from typing import ClassVar, Protocol, Self, cast
 
 from fastapi_cache import FastAPICache
@@ -28,6 +29,12 @@ class CacheRepositoryProtocol(Protocol):
         """
         ...
 
+    async def get_many(self: Self, keys: Sequence[str]) -> list[str | None]:
+        """
+        Получаем несколько значений.
+        """
+        ...
+
     async def set(self: Self, key: str, value: str, expire: int | None = None, nx: bool = False) -> None:
         """
         Устанавливаем значение.
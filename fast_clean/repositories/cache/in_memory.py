@@ -2,7 +2,8 @@
 Модуль, содержащий репозиторий кеша в памяти.
 """
 
-from typing import Self
+from collections.abc import Sequence
+from typing import Self, cast
 
 from fastapi_cache.backends.inmemory import InMemoryBackend, Value
 from overrides import override
@@ -28,6 +29,16 @@ class InMemoryCacheRepository(InMemoryBackend):
                 del self._store[key]
         return None
 
+    async def get_many(self: Self, keys: Sequence[str]) -> list[str | None]:
+        """
+        Получаем несколько значений.
+        """
+        values: list[str | None] = []
+        for key in keys:
+            v = self._get(key)
+            values.append(cast(str, v.data) if v else None)
+        return values
+
     @override(check_signature=False)
     async def set(self: Self, key: str, value: str, expire: int | None = None, nx: bool = False) -> None:
         """
@@ -42,6 +53,23 @@ class InMemoryCacheRepository(InMemoryBackend):
             if not nx or existing_value is None:
                 self._store[key] = Value(value, ttl_ts)  # type: ignore
 
+    @override(check_signature=False)
+    async def clear(self: Self, namespace: str | None = None, key: str | None = None) -> int:
+        """
+        Удаляем значение.
+
+        Родительский метод выбрасывает `KeyError` при удалении отсутствующего ключа,
+        а `RedisBackend` возвращает `0`.
+        """
+        if namespace:
+            keys = [k for k in self._store if k.startswith(namespace)]
+            for k in keys:
+                del self._store[k]
+            return len(keys)
+        elif key:
+            return int(self._store.pop(key, None) is not None)
+        return 0
+
     async def incr(self: Self, key: str, amount: int = 1) -> int:
         """
         Инкремент значения.
@@ -2,6 +2,7 @@
 Модуль, содержащий репозиторий кеша с помощью Redis.
 """
 
+from collections.abc import Sequence
 from typing import Self
 
 from fastapi_cache.backends.redis import RedisBackend
@@ -18,6 +19,14 @@ class RedisCacheRepository(RedisBackend):
         super().__init__(redis)
         self.redis: Redis
 
+    async def get_many(self: Self, keys: Sequence[str]) -> list[str | None]:
+        """
+        Получаем несколько значений одним запросом.
+        """
+        if not keys:
+            return []
+        return await self.redis.mget(keys)
+
     @override(check_signature=False)
     async def set(self: Self, key: str, value: str, expire: int | None = None, nx: bool = False) -> None:
         """
@@ -7,15 +7,28 @@
 """
 
 import uuid
-from collections.abc import Iterable, Sequence
-from typing import Protocol, Self
-
-from fast_clean.schemas import PaginationResultSchema, PaginationSchema
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence, Set
+from typing import Any, Protocol, Self, overload
+
+from fast_clean.enums import AggregateFunctionEnum, CountStrategyEnum
+from fast_clean.schemas import (
+    CursorPaginationResultSchema,
+    CursorPaginationSchema,
+    PaginationResultSchema,
+    PaginationSchema,
+)
 
+from .cached import CachedCrudRepository as CachedCrudRepository
+from .cached import CachedCrudRepositoryFactory as CachedCrudRepositoryFactory
 from .db import DbCrudRepository as DbCrudRepository
 from .db import DbCrudRepositoryInt as DbCrudRepositoryInt
 from .in_memory import InMemoryCrudRepository as InMemoryCrudRepository
 from .in_memory import InMemoryCrudRepositoryInt as InMemoryCrudRepositoryInt
+from .loader import CrudDataLoader as CrudDataLoader
+from .search import FullTextSearchBackend as FullTextSearchBackend
+from .search import IlikeSearchBackend as IlikeSearchBackend
+from .search import SearchBackendProtocol as SearchBackendProtocol
+from .search import TrigramSearchBackend as TrigramSearchBackend
 from .type_vars import (
     CreateSchemaBaseType,
     CreateSchemaIntType,
@@ -23,6 +36,7 @@ from .type_vars import (
     IdTypeContravariant,
     ReadSchemaBaseType,
     ReadSchemaIntType,
+    SchemaType,
     UpdateSchemaBaseType,
     UpdateSchemaIntType,
     UpdateSchemaType,
@@ -41,9 +55,18 @@ class CrudRepositoryBaseProtocol(
     Протокол базового репозитория для выполнения CRUD операций над моделями.
     """
 
-    async def get(self: Self, id: IdTypeContravariant) -> ReadSchemaBaseType:
+    @overload
+    async def get(self: Self, id: IdTypeContravariant) -> ReadSchemaBaseType: ...
+
+    @overload
+    async def get(self: Self, id: IdTypeContravariant, *, projection: type[SchemaType]) -> SchemaType: ...
+
+    @overload
+    async def get(self: Self, id: IdTypeContravariant, *, projection: Set[str]) -> dict[str, Any]:
         """
         Получаем модель по идентификатору.
+
+        При передаче проекции возвращаются только ее поля.
         """
         ...
 
@@ -53,9 +76,20 @@ class CrudRepositoryBaseProtocol(
         """
         ...
 
+    @overload
     async def get_by_ids(
         self: Self, ids: Sequence[IdTypeContravariant], *, exact: bool = False
-    ) -> list[ReadSchemaBaseType]:
+    ) -> list[ReadSchemaBaseType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdTypeContravariant], *, exact: bool = False, projection: type[SchemaType]
+    ) -> list[SchemaType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdTypeContravariant], *, exact: bool = False, projection: Set[str]
+    ) -> list[dict[str, Any]]:
         """
         Получаем список моделей по идентификаторам.
         """
@@ -67,6 +101,21 @@ class CrudRepositoryBaseProtocol(
         """
         ...
 
+    @overload
+    def stream_all(self: Self, *, batch_size: int = 1000) -> AsyncIterator[list[ReadSchemaBaseType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: type[SchemaType]
+    ) -> AsyncIterator[list[SchemaType]]: ...
+
+    @overload
+    def stream_all(self: Self, *, batch_size: int = 1000, projection: Set[str]) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Получаем все модели пачками.
+        """
+        ...
+
     async def paginate(
         self: Self,
         pagination: PaginationSchema,
@@ -74,12 +123,51 @@ class CrudRepositoryBaseProtocol(
         search: str | None = None,
         search_by: Iterable[str] | None = None,
         sorting: Iterable[str] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
     ) -> PaginationResultSchema[ReadSchemaBaseType]:
         """
         Получаем список моделей с пагинацией, поиском и сортировкой.
         """
         ...
 
+    async def paginate_by_cursor(
+        self: Self,
+        pagination: CursorPaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией по курсору, поиском и сортировкой.
+        """
+        ...
+
+    async def count(self: Self, *, search: str | None = None, search_by: Iterable[str] | None = None) -> int:
+        """
+        Получаем количество моделей с поиском.
+        """
+        ...
+
+    async def exists(self: Self, *, search: str | None = None, search_by: Iterable[str] | None = None) -> bool:
+        """
+        Проверяем наличие моделей с поиском.
+        """
+        ...
+
+    async def aggregate(
+        self: Self,
+        aggregates: Mapping[str, tuple[AggregateFunctionEnum, str]],
+        *,
+        group_by: Sequence[str] = (),
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Получаем агрегаты полей моделей с группировкой и поиском.
+        """
+        ...
+
     async def create(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Создаем модель.
@@ -104,12 +192,26 @@ class CrudRepositoryBaseProtocol(
         """
         ...
 
+    async def bulk_update_returning(self: Self, update_objects: list[UpdateSchemaBaseType]) -> list[ReadSchemaBaseType]:
+        """
+        Обновляем несколько моделей и получаем обновленные модели.
+        """
+        ...
+
     async def upsert(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Создаем или обновляем модель.
         """
         ...
 
+    async def bulk_upsert(
+        self: Self, create_objects: list[CreateSchemaBaseType], *, index_elements: Sequence[str] | None = None
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Создаем или обновляем несколько моделей.
+        """
+        ...
+
     async def delete(self: Self, ids: Sequence[IdTypeContravariant]) -> None:
         """
         Удаляем модели.
@@ -0,0 +1,399 @@
+"""
+Модуль, содержащий репозиторий для выполнения CRUD операций над моделями с кешированием чтения.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence, Set
+from typing import TYPE_CHECKING, Any, Generic, Self, cast, overload
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.util import await_only
+
+from fast_clean.db import SessionManagerImpl
+from fast_clean.enums import AggregateFunctionEnum, CountStrategyEnum
+from fast_clean.exceptions import ModelNotFoundError
+from fast_clean.repositories.cache import CacheRepositoryProtocol
+from fast_clean.schemas import (
+    CursorPaginationResultSchema,
+    CursorPaginationSchema,
+    PaginationResultSchema,
+    PaginationSchema,
+)
+
+from .projection import Projection
+from .type_vars import (
+    CreateSchemaBaseType,
+    IdType,
+    ReadSchemaBaseType,
+    SchemaType,
+    UpdateSchemaBaseType,
+)
+
+if TYPE_CHECKING:
+    from . import CrudRepositoryBaseProtocol
+
+
+class CachedCrudRepository(Generic[ReadSchemaBaseType, CreateSchemaBaseType, UpdateSchemaBaseType, IdType]):
+    """
+    Репозиторий для выполнения CRUD операций над моделями с кешированием чтения.
+
+    Оборачивает любой репозиторий, реализующий `CrudRepositoryBaseProtocol`. Модели, полученные
+    методами `get`, `get_or_none` и `get_by_ids`, сохраняются в кеш на `ttl` секунд, а изменение
+    и удаление моделей удаляет их из кеша. Остальные методы вызываются без кеширования.
+
+    Если сессия оборачиваемого репозитория находится в транзакции, чтение выполняется без кеша,
+    а модели удаляются из кеша после завершения транзакции. Иначе в кеш могут попасть
+    незафиксированные данные или данные, прочитанные до фиксации изменений.
+    """
+
+    PENDING_INVALIDATION_KEY = 'fast_clean_pending_invalidation'
+
+    ttl: int | None = 60
+
+    def __init__(
+        self,
+        repository: CrudRepositoryBaseProtocol[ReadSchemaBaseType, CreateSchemaBaseType, UpdateSchemaBaseType, IdType],
+        cache_repository: CacheRepositoryProtocol,
+        read_schema_types: Sequence[type[ReadSchemaBaseType]],
+        *,
+        ttl: int | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        self.repository = repository
+        self.cache_repository = cache_repository
+        self.read_schema_types_mapping = {
+            read_schema_type.__name__: read_schema_type for read_schema_type in read_schema_types
+        }
+        if ttl is not None:
+            self.ttl = ttl
+        self.namespace = namespace or f'crud:{read_schema_types[0].__name__}'
+
+    @overload
+    async def get(self: Self, id: IdType) -> ReadSchemaBaseType: ...
+
+    @overload
+    async def get(self: Self, id: IdType, *, projection: type[SchemaType]) -> SchemaType: ...
+
+    @overload
+    async def get(self: Self, id: IdType, *, projection: Set[str]) -> dict[str, Any]: ...
+
+    async def get(self: Self, id: IdType, *, projection: Projection | None = None) -> Any:
+        """
+        Получаем модель по идентификатору.
+
+        Проекции не кешируются.
+        """
+        if projection is not None or self.get_transaction_session() is not None:
+            return await self.repository.get(id, projection=cast(Any, projection))
+        value = await self.cache_repository.get(self.make_key(id))
+        if value is not None:
+            return self.loads(value)
+        model = await self.repository.get(id)
+        await self.cache_models([model])
+        return model
+
+    async def get_or_none(self: Self, id: IdType) -> ReadSchemaBaseType | None:
+        """
+        Получаем модель или None по идентификатору.
+        """
+        with contextlib.suppress(ModelNotFoundError):
+            return await self.get(id)
+        return None
+
+    @overload
+    async def get_by_ids(self: Self, ids: Sequence[IdType], *, exact: bool = False) -> list[ReadSchemaBaseType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdType], *, exact: bool = False, projection: type[SchemaType]
+    ) -> list[SchemaType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdType], *, exact: bool = False, projection: Set[str]
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdType], *, exact: bool = False, projection: Projection | None = None
+    ) -> list[Any]:
+        """
+        Получаем список моделей по идентификаторам.
+
+        Закешированные модели получаются одним запросом к кешу, остальные - одним запросом
+        к оборачиваемому репозиторию.
+        """
+        if projection is not None or self.get_transaction_session() is not None:
+            return await self.repository.get_by_ids(ids, exact=exact, projection=cast(Any, projection))
+        values = await self.cache_repository.get_many([self.make_key(id) for id in ids])
+        models: dict[IdType, ReadSchemaBaseType] = {}
+        for id, value in zip(ids, values, strict=True):
+            if value is not None:
+                models[id] = self.loads(value)
+        missing_ids = [id for id in dict.fromkeys(ids) if id not in models]
+        if missing_ids:
+            missing_models = await self.repository.get_by_ids(missing_ids, exact=exact)
+            await self.cache_models(missing_models)
+            models.update((cast(IdType, model.id), model) for model in missing_models)
+        return [models[id] for id in dict.fromkeys(ids) if id in models]
+
+    async def get_all(self: Self) -> list[ReadSchemaBaseType]:
+        """
+        Получаем все модели.
+        """
+        return await self.repository.get_all()
+
+    @overload
+    def stream_all(self: Self, *, batch_size: int = 1000) -> AsyncIterator[list[ReadSchemaBaseType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: type[SchemaType]
+    ) -> AsyncIterator[list[SchemaType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: Set[str]
+    ) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    async def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: Projection | None = None
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Получаем все модели пачками.
+        """
+        async for models in self.repository.stream_all(batch_size=batch_size, projection=cast(Any, projection)):
+            yield models
+
+    async def paginate(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+    ) -> PaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией, поиском и сортировкой.
+        """
+        return await self.repository.paginate(
+            pagination, search=search, search_by=search_by, sorting=sorting, count_strategy=count_strategy
+        )
+
+    async def paginate_by_cursor(
+        self: Self,
+        pagination: CursorPaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией по курсору, поиском и сортировкой.
+        """
+        return await self.repository.paginate_by_cursor(pagination, search=search, search_by=search_by, sorting=sorting)
+
+    async def count(self: Self, *, search: str | None = None, search_by: Iterable[str] | None = None) -> int:
+        """
+        Получаем количество моделей с поиском.
+        """
+        return await self.repository.count(search=search, search_by=search_by)
+
+    async def exists(self: Self, *, search: str | None = None, search_by: Iterable[str] | None = None) -> bool:
+        """
+        Проверяем наличие моделей с поиском.
+        """
+        return await self.repository.exists(search=search, search_by=search_by)
+
+    async def aggregate(
+        self: Self,
+        aggregates: Mapping[str, tuple[AggregateFunctionEnum, str]],
+        *,
+        group_by: Sequence[str] = (),
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Получаем агрегаты полей моделей с группировкой и поиском.
+        """
+        return await self.repository.aggregate(aggregates, group_by=group_by, search=search, search_by=search_by)
+
+    async def create(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
+        """
+        Создаем модель.
+        """
+        return await self.repository.create(create_object)
+
+    async def bulk_create(self: Self, create_objects: list[CreateSchemaBaseType]) -> list[ReadSchemaBaseType]:
+        """
+        Создаем несколько моделей.
+        """
+        return await self.repository.bulk_create(create_objects)
+
+    async def update(self: Self, update_object: UpdateSchemaBaseType) -> ReadSchemaBaseType:
+        """
+        Обновляем модель.
+        """
+        try:
+            return await self.repository.update(update_object)
+        finally:
+            await self.invalidate_after_transaction([cast(IdType, update_object.id)])
+
+    async def bulk_update(self: Self, update_objects: list[UpdateSchemaBaseType]) -> None:
+        """
+        Обновляем несколько моделей.
+        """
+        try:
+            await self.repository.bulk_update(update_objects)
+        finally:
+            await self.invalidate_after_transaction(
+                [cast(IdType, update_object.id) for update_object in update_objects]
+            )
+
+    async def bulk_update_returning(self: Self, update_objects: list[UpdateSchemaBaseType]) -> list[ReadSchemaBaseType]:
+        """
+        Обновляем несколько моделей и получаем обновленные модели.
+        """
+        try:
+            return await self.repository.bulk_update_returning(update_objects)
+        finally:
+            await self.invalidate_after_transaction(
+                [cast(IdType, update_object.id) for update_object in update_objects]
+            )
+
+    async def upsert(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
+        """
+        Создаем или обновляем модель.
+        """
+        model = await self.repository.upsert(create_object)
+        await self.invalidate_after_transaction([cast(IdType, model.id)])
+        return model
+
+    async def bulk_upsert(
+        self: Self, create_objects: list[CreateSchemaBaseType], *, index_elements: Sequence[str] | None = None
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Создаем или обновляем несколько моделей.
+        """
+        models = await self.repository.bulk_upsert(create_objects, index_elements=index_elements)
+        await self.invalidate_after_transaction([cast(IdType, model.id) for model in models])
+        return models
+
+    async def delete(self: Self, ids: Sequence[IdType]) -> None:
+        """
+        Удаляем модели.
+        """
+        try:
+            await self.repository.delete(ids)
+        finally:
+            await self.invalidate_after_transaction(ids)
+
+    async def invalidate(self: Self, ids: Sequence[IdType]) -> None:
+        """
+        Удаляем модели из кеша.
+        """
+        await asyncio.gather(*(self.cache_repository.clear(key=self.make_key(id)) for id in dict.fromkeys(ids)))
+
+    async def invalidate_after_transaction(self: Self, ids: Sequence[IdType]) -> None:
+        """
+        Удаляем модели из кеша после завершения транзакции сессии оборачиваемого репозитория.
+
+        Вне транзакции модели удаляются сразу.
+        """
+        session = self.get_transaction_session()
+        if session is None:
+            return await self.invalidate(ids)
+        sync_session = session.sync_session
+        if not sa.event.contains(sync_session, 'after_transaction_end', self.invalidate_pending):
+            sa.event.listen(sync_session, 'after_transaction_end', self.invalidate_pending)
+        pending: dict[CachedCrudRepository[Any, Any, Any, Any], dict[Any, None]] = sync_session.info.setdefault(
+            self.PENDING_INVALIDATION_KEY, {}
+        )
+        pending.setdefault(self, {}).update(dict.fromkeys(ids))
+
+    @classmethod
+    def invalidate_pending(cls, session: sa.orm.Session, transaction: sa.orm.SessionTransaction) -> None:
+        """
+        Удаляем из кеша модели, измененные в завершившейся транзакции.
+
+        Обработчик события вызывается из SQLAlchemy внутри гринлета асинхронной сессии.
+        Модели удаляются и при откате транзакции, т.к. это не нарушает согласованности кеша.
+        """
+        if transaction.parent is not None:
+            return
+        pending: dict[CachedCrudRepository[Any, Any, Any, Any], dict[Any, None]] = session.info.pop(
+            cls.PENDING_INVALIDATION_KEY, {}
+        )
+        for cached_repository, ids in pending.items():
+            await_only(cached_repository.invalidate(list(ids)))
+
+    def get_transaction_session(self: Self) -> AsyncSession | None:
+        """
+        Получаем сессию оборачиваемого репозитория, если она находится в транзакции.
+
+        Репозитории, не использующие `SessionManagerImpl`, считаются работающими вне транзакции.
+        """
+        session_manager = getattr(self.repository, 'session_manager', None)
+        if isinstance(session_manager, SessionManagerImpl) and session_manager.session.in_transaction():
+            return session_manager.session
+        return None
+
+    async def cache_models(self: Self, models: Sequence[ReadSchemaBaseType]) -> None:
+        """
+        Сохраняем модели в кеш.
+        """
+        await asyncio.gather(
+            *(
+                self.cache_repository.set(self.make_key(cast(IdType, model.id)), self.dumps(model), expire=self.ttl)
+                for model in models
+            )
+        )
+
+    def make_key(self: Self, id: IdType) -> str:
+        """
+        Получаем ключ модели в кеше.
+        """
+        return f'{self.namespace}:{id}'
+
+    @staticmethod
+    def dumps(model: ReadSchemaBaseType) -> str:
+        """
+        Сериализуем модель вместе с названием ее схемы.
+        """
+        return json.dumps({'schema': type(model).__name__, 'data': model.model_dump(mode='json')})
+
+    def loads(self: Self, value: str) -> ReadSchemaBaseType:
+        """
+        Десериализуем модель с помощью сохраненного названия схемы.
+        """
+        payload = json.loads(value)
+        return cast(
+            ReadSchemaBaseType, self.read_schema_types_mapping[payload['schema']].model_validate(payload['data'])
+        )
+
+
+class CachedCrudRepositoryFactory:
+    """
+    Фабрика репозиториев с кешированием чтения.
+    """
+
+    def __init__(self, cache_repository: CacheRepositoryProtocol) -> None:
+        self.cache_repository = cache_repository
+
+    def make(
+        self: Self,
+        repository: CrudRepositoryBaseProtocol[ReadSchemaBaseType, CreateSchemaBaseType, UpdateSchemaBaseType, IdType],
+        read_schema_types: Sequence[type[ReadSchemaBaseType]],
+        *,
+        ttl: int | None = None,
+        namespace: str | None = None,
+    ) -> CachedCrudRepository[ReadSchemaBaseType, CreateSchemaBaseType, UpdateSchemaBaseType, IdType]:
+        """
+        Создаем репозиторий с кешированием чтения.
+        """
+        return CachedCrudRepository(repository, self.cache_repository, read_schema_types, ttl=ttl, namespace=namespace)
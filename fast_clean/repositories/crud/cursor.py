@@ -0,0 +1,57 @@
+"""
+Модуль, содержащий функционал курсоров для пагинации по ключам сортировки.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from fast_clean.exceptions import InvalidCursorError, SortingFieldNotFoundError
+
+
+def get_cursor_fields(sorting: Iterable[str], schema_type: type[BaseModel]) -> list[tuple[str, bool]]:
+    """
+    Получаем поля курсора и признак сортировки по убыванию.
+
+    Идентификатор добавляется последним полем с направлением последней сортировки, чтобы порядок
+    моделей был строгим.
+    """
+    fields = [(st[1:], True) if st[0] == '-' else (st, False) for st in sorting]
+    if all(field != 'id' for field, _ in fields):
+        fields.append(('id', fields[-1][1] if fields else False))
+    for field, _ in fields:
+        if field not in schema_type.model_fields:
+            raise SortingFieldNotFoundError(field)
+    return fields
+
+
+def encode_cursor(model: BaseModel, fields: Sequence[tuple[str, bool]]) -> str:
+    """
+    Кодируем курсор по значениям полей модели.
+    """
+    payload = {
+        'fields': [field for field, _ in fields],
+        'values': to_jsonable_python([getattr(model, field) for field, _ in fields]),
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, fields: Sequence[tuple[str, bool]], schema_type: type[BaseModel]) -> list[Any]:
+    """
+    Декодируем значения полей из курсора.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload['fields'] != [field for field, _ in fields]:
+            raise InvalidCursorError(cursor)
+        return [
+            TypeAdapter(schema_type.model_fields[field].annotation).validate_python(value)
+            for (field, _), value in zip(fields, payload['values'], strict=True)
+        ]
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError) as error:
+        raise InvalidCursorError(cursor) from error
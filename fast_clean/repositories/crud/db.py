@@ -6,26 +6,42 @@ from __future__ import annotations
 
 import contextlib
 import uuid
-from collections.abc import Callable, Iterable, Sequence
-from itertools import groupby
-from typing import Any, Generic, Self, cast, get_args
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Collection, Hashable, Iterable, Iterator, Mapping, Sequence, Set
+from typing import Any, Generic, Self, cast, get_args, overload
 
+import psycopg
 import sqlalchemy as sa
+from psycopg import sql
+from pydantic import TypeAdapter
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectin_polymorphic
+from sqlalchemy.orm import selectin_polymorphic, with_polymorphic
 from sqlalchemy.sql.expression import func
 
-from fast_clean.db import SessionManagerProtocol
-from fast_clean.enums import ModelActionEnum
+from fast_clean.db import Explain, SessionManagerProtocol, deferred_results, sync_pipeline
+from fast_clean.enums import AggregateFunctionEnum, CountStrategyEnum, ModelActionEnum, PolymorphicLoadingEnum
 from fast_clean.exceptions import (
+    AggregateFieldNotFoundError,
     ModelIntegrityError,
     ModelNotFoundError,
+    ProjectionFieldNotFoundError,
     SortingFieldNotFoundError,
 )
-from fast_clean.schemas import PaginationResultSchema, PaginationSchema
+from fast_clean.schemas import (
+    CursorPaginationResultSchema,
+    CursorPaginationSchema,
+    PaginationResultSchema,
+    PaginationSchema,
+)
 
+from .cursor import decode_cursor, encode_cursor, get_cursor_fields
+from .instrumentation import tag_queries
+from .projection import Projection, apply_projection, get_projection_fields
+from .search import IlikeSearchBackend, SearchBackendProtocol
+from .statements import StatementCache, get_projection_key
 from .type_vars import (
     CreateSchemaBaseType,
     CreateSchemaIntType,
@@ -37,6 +53,7 @@ from .type_vars import (
     ReadSchemaBaseType,
     ReadSchemaIntType,
     ReadSchemaType,
+    SchemaType,
     UpdateSchemaBaseType,
     UpdateSchemaIntType,
     UpdateSchemaType,
@@ -73,9 +90,22 @@ class DbCrudRepositoryBase(
     create_models_mapping: dict[type[CreateSchemaBaseType], type[ModelBaseType]]
     update_models_mapping: dict[type[UpdateSchemaBaseType], type[ModelBaseType]]
     model_identities_mapping: dict[Any, type[ModelBaseType]] = {}
+    read_schema_adapters_mapping: dict[type[ModelBaseType], TypeAdapter[list[ReadSchemaBaseType]]] = {}
+    statement_cache: StatementCache = StatementCache()
 
     model_type: type[ModelBaseType]
 
+    estimated_count_threshold: int = 10_000
+    max_bind_params: int = 65_535
+    copy_threshold: int = 10_000
+    ids_chunk_size: int = 10_000
+    core_read: bool = False
+    trusted_read: bool = False
+    polymorphic_loading: PolymorphicLoadingEnum = PolymorphicLoadingEnum.SELECTIN
+    polymorphic_joined_threshold: int = 100
+    search_backend: SearchBackendProtocol = IlikeSearchBackend()
+    statement_cache_size: int = 1024
+
     def __init__(self, session_manager: SessionManagerProtocol):
         if self.__dict__.get('__abstract__', False):
             raise TypeError(f"Can't instantiate abstract class {type(self).__name__}")
@@ -110,6 +140,8 @@ class DbCrudRepositoryBase(
         cls.create_models_mapping = {}
         cls.update_models_mapping = {}
         cls.model_identities_mapping = {}
+        cls.read_schema_adapters_mapping = {}
+        cls.statement_cache = StatementCache(cls.statement_cache_size)
         types: Sequence[
             tuple[type[ModelBaseType], type[ReadSchemaBaseType], type[CreateSchemaBaseType], type[UpdateSchemaBaseType]]
         ] = [*cls.__subtypes__, get_args(base_repository_generic)[:4]]
@@ -119,6 +151,7 @@ class DbCrudRepositoryBase(
             cls.create_models_mapping[create_schema_type] = model_type
             cls.update_models_mapping[update_schema_type] = model_type
             cls.model_identities_mapping[model_type.__mapper__.polymorphic_identity] = model_type
+            cls.read_schema_adapters_mapping[model_type] = TypeAdapter(list[read_schema_type])  # type: ignore[valid-type]
 
         cls.model_type, *_ = cast(
             tuple[
@@ -132,17 +165,51 @@ class DbCrudRepositoryBase(
 
         return super().__init_subclass__()
 
-    async def get(self: Self, id: IdType) -> ReadSchemaBaseType:
+    @overload
+    async def get(
+        self: Self, id: IdType, *, polymorphic_loading: PolymorphicLoadingEnum | None = None
+    ) -> ReadSchemaBaseType: ...
+
+    @overload
+    async def get(
+        self: Self,
+        id: IdType,
+        *,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: type[SchemaType],
+    ) -> SchemaType: ...
+
+    @overload
+    async def get(
+        self: Self, id: IdType, *, polymorphic_loading: PolymorphicLoadingEnum | None = None, projection: Set[str]
+    ) -> dict[str, Any]: ...
+
+    @tag_queries
+    async def get(
+        self: Self,
+        id: IdType,
+        *,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: Projection | None = None,
+    ) -> Any:
         """
         Получаем модель по идентификатору.
+
+        При передаче проекции выбираются только ее поля без загрузки модели SQLAlchemy.
         """
-        async with self.session_manager.get_session() as s:
-            statement = self.select().where(self.model_type.id == id)
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.statement_cache.get(
+                ('get', *self.get_select_key(projection, polymorphic_loading, 1)),
+                lambda: self.select_projection(projection, polymorphic_loading, 1).where(
+                    self.model_type.id == sa.bindparam('id')
+                ),
+            )
+            row = (await s.execute(statement, {'id': id})).one_or_none()
+            if row is None:
                 raise ModelNotFoundError(self.model_type, model_id=id)
-            return self.model_validate(model)
+            return self.validate_rows([row], projection)[0]
 
+    @tag_queries
     async def get_or_none(self: Self, id: IdType) -> ReadSchemaBaseType | None:
         """
         Получаем модель или None по идентификатору.
@@ -151,25 +218,149 @@ class DbCrudRepositoryBase(
             return await self.get(id)
         return None
 
-    async def get_by_ids(self: Self, ids: Sequence[IdType], *, exact: bool = False) -> list[ReadSchemaBaseType]:
+    @overload
+    async def get_by_ids(
+        self: Self,
+        ids: Sequence[IdType],
+        *,
+        exact: bool = False,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+    ) -> list[ReadSchemaBaseType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self,
+        ids: Sequence[IdType],
+        *,
+        exact: bool = False,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: type[SchemaType],
+    ) -> list[SchemaType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self,
+        ids: Sequence[IdType],
+        *,
+        exact: bool = False,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: Set[str],
+    ) -> list[dict[str, Any]]: ...
+
+    @tag_queries
+    async def get_by_ids(
+        self: Self,
+        ids: Sequence[IdType],
+        *,
+        exact: bool = False,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: Projection | None = None,
+    ) -> list[Any]:
         """
         Получаем список моделей по идентификаторам.
+
+        Идентификаторы передаются одним параметром-массивом, поэтому запрос не зависит от их количества.
+        Более `ids_chunk_size` идентификаторов запрашиваются пачками, строки каждой пачки
+        преобразуются в схемы до получения следующей.
         """
-        async with self.session_manager.get_session() as s:
-            statement = self.select().where(self.model_type.id.in_(ids))
-            models = (await s.execute(statement)).scalars().all()
-            self.check_get_by_ids_exact(ids, models, exact)
-            return [self.model_validate(model) for model in models]
+        size = min(len(ids), self.ids_chunk_size)
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.statement_cache.get(
+                ('get_by_ids', *self.get_select_key(projection, polymorphic_loading, size)),
+                lambda: self.select_projection(projection, polymorphic_loading, size).where(
+                    self.get_ids_expr(self.model_type)
+                ),
+            )
+            models: list[Any] = []
+            model_ids: list[IdType] = []
+            for ids_chunk in self.chunk_ids(ids):
+                rows = (await s.execute(statement, {'ids': ids_chunk})).all()
+                model_ids.extend(self.get_row_ids(rows, projection))
+                models.extend(self.validate_rows(rows, projection))
+            self.check_get_by_ids_exact(ids, model_ids, exact)
+            return models
 
+    @tag_queries
     async def get_all(self: Self) -> list[ReadSchemaBaseType]:
         """
         Получаем все модели.
         """
-        async with self.session_manager.get_session() as s:
-            statement = self.select()
-            models = (await s.execute(statement)).scalars().all()
-            return [self.model_validate(model) for model in models]
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.statement_cache.get(
+                ('get_all', *self.get_select_key(None, None, None)), lambda: self.select_projection(None)
+            )
+            rows = (await s.execute(statement)).all()
+            return self.validate_rows(rows, None)
+
+    @overload
+    def stream_all(self: Self, *, batch_size: int = 1000) -> AsyncIterator[list[ReadSchemaBaseType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: type[SchemaType]
+    ) -> AsyncIterator[list[SchemaType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: Set[str]
+    ) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    @tag_queries
+    async def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: Projection | None = None
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Получаем все модели пачками с помощью курсора на стороне сервера.
+        """
+        async for models in self.stream_filter(batch_size=batch_size, projection=cast(Any, projection)):
+            yield models
+
+    @overload
+    def stream_filter(
+        self: Self,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[ReadSchemaBaseType]]: ...
+
+    @overload
+    def stream_filter(
+        self: Self,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        *,
+        batch_size: int = 1000,
+        projection: type[SchemaType],
+    ) -> AsyncIterator[list[SchemaType]]: ...
+
+    @overload
+    def stream_filter(
+        self: Self,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        *,
+        batch_size: int = 1000,
+        projection: Set[str],
+    ) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    @tag_queries
+    async def stream_filter(
+        self: Self,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        *,
+        batch_size: int = 1000,
+        projection: Projection | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Получаем модели с фильтрами пачками с помощью курсора на стороне сервера.
+
+        В памяти одновременно находится не более `batch_size` моделей.
+        """
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.filter_statement(self.select_projection(projection), None, None, select_filter)
+            result = await s.stream(statement.execution_options(yield_per=batch_size))
+            async for rows in result.partitions():
+                yield self.validate_rows(rows, projection)
 
+    @tag_queries
     async def paginate(
         self: Self,
         pagination: PaginationSchema,
@@ -177,6 +368,8 @@ class DbCrudRepositoryBase(
         search: str | None = None,
         search_by: Iterable[str] | None = None,
         sorting: Iterable[str] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
     ) -> PaginationResultSchema[ReadSchemaBaseType]:
         """
         Получаем список моделей с пагинацией, поиском и сортировкой.
@@ -186,8 +379,94 @@ class DbCrudRepositoryBase(
             search=search,
             search_by=search_by,
             sorting=sorting,
+            count_strategy=count_strategy,
+            polymorphic_loading=polymorphic_loading,
+        )
+
+    @tag_queries
+    async def paginate_by_cursor(
+        self: Self,
+        pagination: CursorPaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией по курсору, поиском и сортировкой.
+        """
+        return await self.paginate_by_cursor_with_filter(
+            pagination,
+            search=search,
+            search_by=search_by,
+            sorting=sorting,
+            polymorphic_loading=polymorphic_loading,
         )
 
+    @tag_queries
+    async def count(
+        self: Self,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+    ) -> int:
+        """
+        Получаем количество моделей с поиском и фильтрами.
+
+        Модели не загружаются, количество подсчитывается одним запросом `count(*)`.
+        """
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.make_aggregate_statement(search, search_by, select_filter, func.count())
+            return (await s.execute(statement)).scalar_one()
+
+    @tag_queries
+    async def exists(
+        self: Self,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+    ) -> bool:
+        """
+        Проверяем наличие моделей с поиском и фильтрами запросом `EXISTS`.
+        """
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.make_aggregate_statement(search, search_by, select_filter, sa.literal(1))
+            return (await s.execute(sa.select(statement.exists()))).scalar_one()
+
+    @tag_queries
+    async def aggregate(
+        self: Self,
+        aggregates: Mapping[str, tuple[AggregateFunctionEnum, str]],
+        *,
+        group_by: Sequence[str] = (),
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Получаем агрегаты полей моделей с группировкой, поиском и фильтрами.
+
+        `aggregates` сопоставляет названию результата агрегатную функцию и поле. Каждая строка результата
+        содержит поля группировки и агрегаты, строки отсортированы по полям группировки. Без группировки
+        возвращается одна строка. Как и в SQL, значения None не учитываются агрегатными функциями.
+        """
+        group_by_columns = [self.get_aggregate_column(field).label(field) for field in group_by]
+        aggregate_columns = [
+            getattr(func, function)(self.get_aggregate_column(field)).label(label)
+            for label, (function, field) in aggregates.items()
+        ]
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.make_aggregate_statement(
+                search, search_by, select_filter, *group_by_columns, *aggregate_columns
+            )
+            if group_by_columns:
+                statement = statement.group_by(*group_by_columns).order_by(*group_by_columns)
+            return [dict(mapping) for mapping in (await s.execute(statement)).mappings()]
+
+    @tag_queries
     async def create(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Создаем модель.
@@ -200,6 +479,7 @@ class DbCrudRepositoryBase(
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(self.model_type, ModelActionEnum.INSERT) from integrity_error
 
+    @tag_queries
     async def bulk_create(self: Self, create_objects: list[CreateSchemaBaseType]) -> list[ReadSchemaBaseType]:
         """
         Создаем несколько моделей.
@@ -208,16 +488,17 @@ class DbCrudRepositoryBase(
             return []
         async with self.session_manager.get_session() as s:
             try:
-                created_models: list[ReadSchemaBaseType] = []
-                for model_type, type_create_objects in groupby(
-                    create_objects, key=lambda co: self.create_models_mapping[type(co)]
-                ):
-                    create_dicts = [self.dump_create_object(create_object) for create_object in type_create_objects]
-                    created_models.extend(await self.bulk_create_with_model_type(model_type, create_dicts, s))
-                return created_models
+                created_models: list[ReadSchemaBaseType | None] = [None] * len(create_objects)
+                for model_type, indexes in self.group_by_model_type(create_objects, self.create_models_mapping).items():
+                    create_dicts = [self.dump_create_object(create_objects[i]) for i in indexes]
+                    type_created_models = await self.bulk_create_with_model_type(model_type, create_dicts, s)
+                    for i, created_model in zip(indexes, type_created_models, strict=True):
+                        created_models[i] = created_model
+                return cast(list[ReadSchemaBaseType], created_models)
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(self.model_type, ModelActionEnum.INSERT) from integrity_error
 
+    @tag_queries
     async def update(self: Self, update_object: UpdateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Обновляем модель.
@@ -230,22 +511,49 @@ class DbCrudRepositoryBase(
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(self.model_type, ModelActionEnum.UPDATE) from integrity_error
 
+    @tag_queries
     async def bulk_update(self: Self, update_objects: list[UpdateSchemaBaseType]) -> None:
         """
         Обновляем несколько моделей.
         """
+        await self.bulk_update_models(update_objects, returning=False)
+
+    @tag_queries
+    async def bulk_update_returning(self: Self, update_objects: list[UpdateSchemaBaseType]) -> list[ReadSchemaBaseType]:
+        """
+        Обновляем несколько моделей и получаем обновленные модели.
+        """
+        return await self.bulk_update_models(update_objects, returning=True)
+
+    @tag_queries
+    async def bulk_update_models(
+        self: Self, update_objects: list[UpdateSchemaBaseType], *, returning: bool
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Обновляем несколько моделей и при необходимости получаем обновленные модели в исходном порядке.
+
+        Обновляются только явно установленные поля схем.
+        """
         if len(update_objects) == 0:
-            return
+            return []
         async with self.session_manager.get_session() as s:
             try:
-                for model_type, type_update_objects in groupby(
-                    update_objects, key=lambda co: self.update_models_mapping[type(co)]
-                ):
-                    update_dicts = [update_object.model_dump() for update_object in type_update_objects]
-                    await self.bulk_update_with_model_type(model_type, update_dicts, s)
+                updated_models: list[ReadSchemaBaseType | None] = [None] * len(update_objects)
+                for model_type, indexes in self.group_by_model_type(update_objects, self.update_models_mapping).items():
+                    update_dicts = [update_objects[i].model_dump(exclude_unset=True) for i in indexes]
+                    type_updated_models = {
+                        model.id: model
+                        for model in await self.bulk_update_with_model_type(model_type, update_dicts, s, returning)
+                    }
+                    for i in indexes:
+                        updated_models[i] = type_updated_models.get(update_objects[i].id)
+                if not returning:
+                    await sync_pipeline(s)
+                return [model for model in updated_models if model is not None]
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(self.model_type, ModelActionEnum.UPDATE) from integrity_error
 
+    @tag_queries
     async def upsert(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Создаем или обновляем модель.
@@ -258,40 +566,338 @@ class DbCrudRepositoryBase(
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(self.model_type, ModelActionEnum.UPSERT) from integrity_error
 
+    @tag_queries
+    async def bulk_upsert(
+        self: Self, create_objects: list[CreateSchemaBaseType], *, index_elements: Sequence[str] | None = None
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Создаем или обновляем несколько моделей.
+
+        По умолчанию конфликт определяется по первичному ключу, `index_elements` позволяет
+        использовать уникальный индекс по другим полям.
+        """
+        if len(create_objects) == 0:
+            return []
+        async with self.session_manager.get_session() as s:
+            try:
+                upserted_models: list[ReadSchemaBaseType | None] = [None] * len(create_objects)
+                for model_type, indexes in self.group_by_model_type(create_objects, self.create_models_mapping).items():
+                    create_dicts = [self.dump_create_object(create_objects[i]) for i in indexes]
+                    type_upserted_models = await self.bulk_upsert_with_model_type(
+                        model_type, create_dicts, s, index_elements
+                    )
+                    for i, upserted_model in zip(indexes, type_upserted_models, strict=True):
+                        upserted_models[i] = upserted_model
+                return cast(list[ReadSchemaBaseType], upserted_models)
+            except IntegrityError as integrity_error:
+                raise ModelIntegrityError(self.model_type, ModelActionEnum.UPSERT) from integrity_error
+
+    @tag_queries
     async def delete(self: Self, ids: Sequence[IdType]) -> None:
         """
         Удаляем модели.
+
+        Строки наследников удаляются с отложенными результатами, поэтому в режиме конвейера
+        они отправляются вместе с удалением строк родительской модели.
         """
         if len(ids) == 0:
             return
         async with self.session_manager.get_session() as s:
             try:
-                model_types: list[type[ModelBaseType]] = [self.model_type]
-                if self.model_type.__mapper__.polymorphic_on is not None:
-                    types_statement = (
-                        sa.select(self.model_type.__mapper__.polymorphic_on)
-                        .where(self.model_type.id.in_(ids))
-                        .distinct()
-                    )
-                    types = (await s.execute(types_statement)).scalars().all()
-                    for t in types:
-                        model_types.append(self.model_identities_mapping[t])
-                for model_type in model_types[::-1]:
-                    statement = sa.delete(model_type).where(model_type.id.in_(ids))
-                    await s.execute(statement)
+                for ids_chunk in self.chunk_ids(ids):
+                    model_types: set[type[ModelBaseType]] = {self.model_type}
+                    if self.model_type.__mapper__.polymorphic_on is not None:
+                        types_statement = (
+                            sa.select(self.model_type.__mapper__.polymorphic_on)
+                            .where(self.get_ids_expr(self.model_type))
+                            .distinct()
+                        )
+                        types = (await s.execute(types_statement, {'ids': ids_chunk})).scalars().all()
+                        for t in types:
+                            model_types.add(self.model_identities_mapping[t])
+                    *child_model_types, model_type = sorted(model_types, key=lambda mt: len(mt.__mro__), reverse=True)
+                    async with deferred_results(s):
+                        for child_model_type in child_model_types:
+                            statement = (
+                                sa.delete(child_model_type)
+                                .where(self.get_ids_expr(child_model_type))
+                                .execution_options(synchronize_session=False)
+                            )
+                            await s.execute(statement, {'ids': ids_chunk})
+                    statement = sa.delete(model_type).where(self.get_ids_expr(model_type))
+                    await s.execute(statement, {'ids': ids_chunk})
+            except IntegrityError as integrity_error:
+                raise ModelIntegrityError(self.model_type, ModelActionEnum.DELETE) from integrity_error
+
+    @tag_queries
+    async def delete_where(
+        self: Self, select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]]
+    ) -> int:
+        """
+        Удаляем модели, подходящие под фильтр запроса, и получаем количество удаленных моделей.
+
+        Модели удаляются одним запросом без получения идентификаторов: идентификаторы выбираются в CTE,
+        а строки каждого уровня наследования, начиная с наследников, удаляются запросом `DELETE ... USING`.
+        Все уровни видят один снимок данных, поэтому фильтр может использовать колонки наследников.
+        """
+        target = self.make_target_cte(select_filter)
+        *child_tables, root_table = self.get_inheritance_tables(self.model_type.__mapper__.self_and_descendants)
+        statement = (
+            sa.delete(root_table)
+            .where(root_table.c.id == target.c.id)
+            .add_cte(
+                *(
+                    sa.delete(table).where(table.c.id == target.c.id).cte(f'delete_{table.name}')
+                    for table in child_tables
+                )
+            )
+        )
+        async with self.session_manager.get_session() as s:
+            try:
+                return cast(sa.CursorResult[Any], await s.execute(statement)).rowcount
             except IntegrityError as integrity_error:
                 raise ModelIntegrityError(self.model_type, ModelActionEnum.DELETE) from integrity_error
 
+    @tag_queries
+    async def update_where(
+        self: Self,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]],
+        values: Mapping[str, Any],
+    ) -> int:
+        """
+        Обновляем поля моделей, подходящих под фильтр запроса, и получаем количество обновленных моделей.
+
+        Модели обновляются одним запросом без получения идентификаторов: идентификаторы выбираются в CTE,
+        а поля каждого уровня наследования обновляются запросом `UPDATE ... FROM`.
+        """
+        table_values: dict[sa.Table, dict[str, Any]] = defaultdict(dict)
+        for field, value in values.items():
+            column_property = self.model_type.__mapper__.column_attrs.get(field)
+            if column_property is None or field == 'id':
+                raise ValueError(f'Field {field} can not be updated')
+            column = column_property.columns[0]
+            table_values[cast(sa.Table, column.table)][column.name] = value
+        if not table_values:
+            return 0
+        target = self.make_target_cte(select_filter)
+        *child_tables, root_table = [
+            table for table in self.get_inheritance_tables([self.model_type.__mapper__]) if table in table_values
+        ]
+        statement = (
+            sa.update(root_table)
+            .where(root_table.c.id == target.c.id)
+            .values(table_values[root_table])
+            .add_cte(
+                *(
+                    sa.update(table)
+                    .where(table.c.id == target.c.id)
+                    .values(table_values[table])
+                    .cte(f'update_{table.name}')
+                    for table in child_tables
+                )
+            )
+        )
+        async with self.session_manager.get_session() as s:
+            try:
+                return cast(sa.CursorResult[Any], await s.execute(statement)).rowcount
+            except IntegrityError as integrity_error:
+                raise ModelIntegrityError(self.model_type, ModelActionEnum.UPDATE) from integrity_error
+
     @classmethod
-    def select(cls) -> sa.Select[tuple[ModelBaseType]]:
+    def select(
+        cls, polymorphic_loading: PolymorphicLoadingEnum | None = None, size: int | None = None
+    ) -> sa.Select[tuple[ModelBaseType]]:
         """
         Выбираем базовую модели или наследника со всеми полями при наличии.
+
+        При `JOINED` таблицы наследников присоединяются внешним соединением и модели загружаются
+        одним запросом, при `SELECTIN` поля наследников загружаются дополнительным запросом
+        на каждый тип. При `AUTO` соединение используется, если ожидаемое количество моделей
+        `size` известно и не превышает `polymorphic_joined_threshold`.
+        """
+        if not cls.model_subtypes:
+            return sa.select(cls.model_type)
+        match cls.get_polymorphic_loading(polymorphic_loading, size):
+            case PolymorphicLoadingEnum.JOINED:
+                return sa.select(with_polymorphic(cls.model_type, list(cls.model_subtypes)))
+            case _:
+                return sa.select(cls.model_type).options(selectin_polymorphic(cls.model_type, cls.model_subtypes))
+
+    @classmethod
+    def get_polymorphic_loading(
+        cls, polymorphic_loading: PolymorphicLoadingEnum | None, size: int | None
+    ) -> PolymorphicLoadingEnum:
         """
-        statement = sa.select(cls.model_type)
-        if cls.model_subtypes:
-            return statement.options(selectin_polymorphic(cls.model_type, cls.model_subtypes))
+        Получаем способ загрузки полей наследников.
+        """
+        polymorphic_loading = polymorphic_loading or cls.polymorphic_loading
+        if polymorphic_loading == PolymorphicLoadingEnum.AUTO:
+            if size is not None and size <= cls.polymorphic_joined_threshold:
+                return PolymorphicLoadingEnum.JOINED
+            return PolymorphicLoadingEnum.SELECTIN
+        return polymorphic_loading
+
+    @classmethod
+    def get_select_key(
+        cls, projection: Projection | None, polymorphic_loading: PolymorphicLoadingEnum | None, size: int | None
+    ) -> tuple[Hashable, ...]:
+        """
+        Получаем ключ запроса выборки для кеша шаблонов запросов.
+        """
+        return get_projection_key(projection), cls.core_read, cls.get_polymorphic_loading(polymorphic_loading, size)
+
+    @classmethod
+    def select_projection(
+        cls,
+        projection: Projection | None,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        size: int | None = None,
+    ) -> sa.Select[Any]:
+        """
+        Выбираем только поля проекции без загрузки моделей SQLAlchemy.
+
+        Поля наследников выбираются с помощью соединения их таблиц, для моделей других типов
+        значения таких полей равны None. Идентификатор выбирается всегда.
+        """
+        if projection is None:
+            return cls.select_core() if cls.core_read else cls.select(polymorphic_loading, size)
+        fields = get_projection_fields(projection)
+        columns: list[sa.ColumnElement[Any]] = []
+        for field in [*fields, *([] if 'id' in fields else ['id'])]:
+            column = next(
+                (
+                    model_type.__mapper__.column_attrs[field].columns[0]
+                    for model_type in [cls.model_type, *cls.model_subtypes]
+                    if field in model_type.__mapper__.column_attrs
+                ),
+                None,
+            )
+            if column is None:
+                raise ProjectionFieldNotFoundError(field)
+            columns.append(column.label(field))
+        statement = sa.select(*columns)
+        if any(column.table is not cls.model_type.__table__ for column in statement.selected_columns):
+            return statement.select_from(with_polymorphic(cls.model_type, list(cls.model_subtypes)))
         return statement
 
+    @classmethod
+    def select_core(cls) -> sa.Select[Any]:
+        """
+        Выбираем все поля базовой модели и наследников без загрузки моделей SQLAlchemy.
+
+        Таблицы наследников присоединяются к таблицам базовой модели и ее родителей внешним
+        соединением.
+        """
+        columns_mapping = cls.get_core_columns_mapping()
+        from_clause: sa.FromClause = cls.model_type.__mapper__.persist_selectable
+        for model_type in sorted(cls.model_subtypes, key=lambda mt: len(mt.__mro__)):
+            from_clause = from_clause.outerjoin(model_type.__table__)
+        columns: dict[str, sa.ColumnElement[Any]] = {}
+        for model_type, model_columns in columns_mapping.items():
+            for key, label in model_columns.items():
+                if label not in columns:
+                    columns[label] = model_type.__mapper__.column_attrs[key].columns[0].label(label)
+        return sa.select(*columns.values()).select_from(from_clause)
+
+    @classmethod
+    def get_core_columns_mapping(cls) -> dict[type[ModelBaseType], dict[str, str]]:
+        """
+        Получаем названия колонок запроса для полей каждого типа модели.
+
+        Поля базовой модели называются по имени атрибута, поля наследников - с префиксом
+        названия таблицы, чтобы одноименные поля разных наследников не совпадали.
+        """
+        base_keys = set(cls.model_type.__mapper__.column_attrs.keys())
+        columns_mapping: dict[type[ModelBaseType], dict[str, str]] = {}
+        for model_type in [cls.model_type, *cls.model_subtypes]:
+            columns_mapping[model_type] = {}
+            for key, column_attr in model_type.__mapper__.column_attrs.items():
+                table_name = column_attr.columns[0].table.name
+                columns_mapping[model_type][key] = key if key in base_keys else f'{table_name}_{key}'
+        return columns_mapping
+
+    @classmethod
+    def validate_rows(cls, rows: Sequence[sa.Row[Any]], projection: Projection | None) -> list[Any]:
+        """
+        Приводим строки результата запроса к схемам или проекции.
+        """
+        if projection is not None:
+            return apply_projection((dict(row._mapping) for row in rows), projection)
+        if cls.core_read:
+            return cls.validate_mappings([row._mapping for row in rows])
+        models = [row[0] for row in rows]
+        return cls.validate_many([type(model) for model in models], models, from_attributes=True)
+
+    @classmethod
+    def validate_mappings(cls, mappings: Sequence[sa.RowMapping]) -> list[ReadSchemaBaseType]:
+        """
+        Приводим строки запроса `select_core` к схемам.
+
+        Тип модели определяется по значению поля полиморфной идентичности.
+        """
+        columns_mapping = cls.get_core_columns_mapping()
+        mapper = cls.model_type.__mapper__
+        polymorphic_key = (
+            mapper.get_property_by_column(mapper.polymorphic_on).key if mapper.polymorphic_on is not None else None
+        )
+        model_types: list[type[ModelBaseType]] = []
+        values: list[dict[str, Any]] = []
+        for mapping in mappings:
+            model_type = cls.model_type
+            if cls.model_subtypes and polymorphic_key is not None:
+                model_type = cls.model_identities_mapping[mapping[polymorphic_key]]
+            model_types.append(model_type)
+            values.append({key: mapping[label] for key, label in columns_mapping[model_type].items()})
+        return cls.validate_many(model_types, values)
+
+    @classmethod
+    def validate_many(
+        cls, model_types: Sequence[type[ModelBaseType]], values: Sequence[Any], *, from_attributes: bool = False
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Приводим значения разных типов моделей к схемам с сохранением порядка.
+        """
+        type_indexes: dict[type[ModelBaseType], list[int]] = defaultdict(list)
+        for i, model_type in enumerate(model_types):
+            type_indexes[model_type].append(i)
+        read_schemas: list[ReadSchemaBaseType | None] = [None] * len(values)
+        for model_type, indexes in type_indexes.items():
+            type_read_schemas = cls.validate_list(
+                model_type, [values[i] for i in indexes], from_attributes=from_attributes
+            )
+            for i, read_schema in zip(indexes, type_read_schemas, strict=True):
+                read_schemas[i] = read_schema
+        return cast(list[ReadSchemaBaseType], read_schemas)
+
+    @classmethod
+    def validate_list(
+        cls, model_type: type[ModelBaseType], values: Sequence[Any], *, from_attributes: bool = False
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Приводим значения одного типа модели к схемам.
+
+        Значения проверяются одним вызовом `TypeAdapter`. При `trusted_read` значения считаются
+        корректными, поскольку получены из собственной базы данных, и схемы создаются без проверки.
+        """
+        if not cls.trusted_read:
+            return cls.read_schema_adapters_mapping[model_type].validate_python(values, from_attributes=from_attributes)
+        read_schema_type = cls.model_types_mapping[model_type]
+        if from_attributes:
+            values = [
+                {field: getattr(value, field) for field in read_schema_type.model_fields if hasattr(value, field)}
+                for value in values
+            ]
+        return [cast(ReadSchemaBaseType, read_schema_type.model_construct(**value)) for value in values]
+
+    @classmethod
+    def get_row_ids(cls, rows: Sequence[sa.Row[Any]], projection: Projection | None) -> list[IdType]:
+        """
+        Получаем идентификаторы моделей из строк результата запроса.
+        """
+        if projection is None and not cls.core_read:
+            return [row[0].id for row in rows]
+        return [row.id for row in rows]
+
     @classmethod
     def model_validate(cls, model: ModelBaseType) -> ReadSchemaBaseType:
         """
@@ -309,7 +915,12 @@ class DbCrudRepositoryBase(
     ) -> list[ReadSchemaBaseType]:
         """
         Создаем модели с помощью типа.
+
+        Уровни наследования вставляются одним запросом с цепочкой CTE, см. `insert_with_model_type`.
+        Пачки от `copy_threshold` моделей загружаются по уровням с помощью `COPY`.
         """
+        if len(create_dicts) < cls.copy_threshold:
+            return cls.validate_list(model_type, await cls.insert_with_model_type(model_type, create_dicts, session))
         parent_dicts = await cls.bulk_create_parent_model(model_type, create_dicts, session)
         values: list[dict[str, Any]] = []
         for create_dict, parent_dict in zip(create_dicts, parent_dicts, strict=True):
@@ -317,16 +928,278 @@ class DbCrudRepositoryBase(
             if 'id' in parent_dict:
                 value['id'] = parent_dict['id']
             values.append(value)
-        statement = sa.insert(model_type).values(values).returning(*model_type.__table__.columns.values())
-        model_dicts = (await session.execute(statement)).mappings().all()
-        read_schema_type = cls.model_types_mapping[model_type]
-        return [
-            cast(
-                ReadSchemaBaseType,
-                read_schema_type.model_validate({**parent_dict, **model_dict}),
-            )
-            for parent_dict, model_dict in zip(parent_dicts, model_dicts, strict=True)
+        model_dicts = await cls.insert_values(model_type, values, session)
+        return cls.validate_list(
+            model_type,
+            [{**parent_dict, **model_dict} for parent_dict, model_dict in zip(parent_dicts, model_dicts, strict=True)],
+        )
+
+    @classmethod
+    async def insert_with_model_type(
+        cls, model_type: type[ModelBaseType], create_dicts: list[dict[str, Any]], session: AsyncSession
+    ) -> list[sa.RowMapping]:
+        """
+        Вставляем модели всех уровней наследования одним запросом на пачку.
+
+        Значения передаются в CTE `input` вместе с порядковым номером, там же вычисляется идентификатор
+        корневой модели. Каждый уровень вставляется своим CTE `INSERT ... SELECT ... RETURNING`,
+        а итоговый запрос соединяет вставленные строки уровней в порядке исходных значений.
+        Пачки ограничиваются по количеству параметров: порядковый номер и все поля всех уровней,
+        включая значения по умолчанию на стороне Python.
+        """
+        tables = [cast(sa.Table, mt.__table__) for mt in cls.get_model_type_chain(model_type)]
+        columns: dict[str, sa.Column[Any]] = {}
+        for table in tables:
+            for column in table.columns:
+                columns.setdefault(column.name, column)
+        values = [cls.fill_python_defaults(tables, create_dict) for create_dict in create_dicts]
+        names = [name for name in columns if any(name in value for value in values)]
+        model_dicts: list[sa.RowMapping] = []
+        for chunk_values in cls.chunk_values(values, len(names) + 1):
+            model_dicts.extend(await cls.insert_values_with_model_type(tables, columns, names, chunk_values, session))
+        return model_dicts
+
+    @classmethod
+    async def insert_values_with_model_type(
+        cls,
+        tables: Sequence[sa.Table],
+        columns: Mapping[str, sa.Column[Any]],
+        names: Sequence[str],
+        values: list[dict[str, Any]],
+        session: AsyncSession,
+    ) -> list[sa.RowMapping]:
+        """
+        Вставляем пачку значений во все уровни наследования одним запросом с цепочкой CTE.
+        """
+        input_values = sa.values(
+            sa.column('ordinal', sa.Integer()),
+            *(sa.column(name, columns[name].type) for name in names),
+            name='input_values',
+        ).data([(ordinal, *(value.get(name) for name in names)) for ordinal, value in enumerate(values)])
+        input_columns = [
+            sa.cast(input_values.c[name], columns[name].type).label(name) for name in names if name != 'id'
         ]
+        id_default = cls.get_id_default_expr(tables[0])
+        id_expr: sa.ColumnElement[Any] = id_default if id_default is not None else sa.null()
+        if 'id' in names:
+            id_value = sa.cast(input_values.c.id, columns['id'].type)
+            id_expr = id_value if id_default is None else func.coalesce(id_value, id_default)
+        input_cte = sa.select(input_values.c.ordinal, id_expr.label('id'), *input_columns).cte('input')
+        insert_ctes: list[sa.CTE] = []
+        for table in tables:
+            insert_columns: dict[str, sa.ColumnElement[Any]] = {
+                name: input_cte.c[name] for name in ['id', *names] if name in table.columns
+            }
+            for column in table.columns:
+                if column.name not in insert_columns and column.default is not None:
+                    if column.default.is_clause_element:
+                        insert_columns[column.name] = cast(Any, column.default).arg
+            insert_ctes.append(
+                sa.insert(table)
+                .from_select(list(insert_columns), sa.select(*insert_columns.values()), include_defaults=False)
+                .returning(*table.columns)
+                .cte(f'insert_{table.name}')
+            )
+        statement = cls.select_inheritance_rows(insert_ctes).join(input_cte, input_cte.c.id == insert_ctes[0].c.id)
+        return list((await session.execute(statement.order_by(input_cte.c.ordinal))).mappings().all())
+
+    @classmethod
+    def get_model_type_chain(cls, model_type: type[ModelBaseType]) -> list[type[ModelBaseType]]:
+        """
+        Получаем типы моделей от корневого родителя до модели.
+        """
+        model_types = [model_type]
+        while (parent_model_type := cls.get_parent_model_type(model_types[0])) is not None:
+            model_types.insert(0, parent_model_type)
+        return model_types
+
+    @staticmethod
+    def fill_python_defaults(tables: Sequence[sa.Table], create_dict: dict[str, Any]) -> dict[str, Any]:
+        """
+        Заполняем значения по умолчанию, вычисляемые на стороне Python.
+
+        Значения вычисляются для каждой модели, т.к. `INSERT ... SELECT` вычисляет их один раз на запрос.
+        """
+        create_dict = dict(create_dict)
+        for table in tables:
+            for column in table.columns:
+                default = column.default
+                if column.name in create_dict or default is None:
+                    continue
+                if default.is_scalar:
+                    create_dict[column.name] = cast(Any, default).arg
+                elif default.is_callable:
+                    create_dict[column.name] = cast(Any, default).arg(None)
+        return create_dict
+
+    @staticmethod
+    def get_id_default_expr(table: sa.Table) -> sa.ColumnElement[Any] | None:
+        """
+        Получаем выражение идентификатора корневой модели, вычисляемого базой данных.
+        """
+        server_default = table.c.id.server_default
+        if isinstance(server_default, sa.DefaultClause) and isinstance(server_default.arg, sa.ColumnElement):
+            return server_default.arg
+        if server_default is None and isinstance(table.c.id.type, sa.Integer):
+            return func.nextval(func.pg_get_serial_sequence(table.fullname, 'id'))
+        return None
+
+    @staticmethod
+    def select_inheritance_rows(ctes: Sequence[sa.CTE]) -> sa.Select[Any]:
+        """
+        Получаем запрос, соединяющий строки уровней наследования, возвращенные CTE.
+        """
+        root_cte, *child_ctes = ctes
+        from_clause: sa.FromClause = root_cte
+        for cte in child_ctes:
+            from_clause = from_clause.join(cte, cte.c.id == root_cte.c.id)
+        return sa.select(
+            *root_cte.c, *(column for cte in child_ctes for column in cte.c if column.name != 'id')
+        ).select_from(from_clause)
+
+    @classmethod
+    async def insert_values(
+        cls, model_type: type[ModelBaseType], values: list[dict[str, Any]], session: AsyncSession
+    ) -> list[sa.RowMapping]:
+        """
+        Вставляем значения в таблицу модели.
+
+        Большие пачки загружаются с помощью `COPY`, остальные разбиваются на запросы с учетом
+        ограничения PostgreSQL на количество параметров.
+        """
+        if len(values) >= cls.copy_threshold:
+            connection = (await (await session.connection()).get_raw_connection()).driver_connection
+            if isinstance(connection, psycopg.AsyncConnection):
+                return await cls.copy_values(model_type, values, session, connection)
+        table = cast(sa.Table, model_type.__table__)
+        model_dicts: list[sa.RowMapping] = []
+        for chunk_values in cls.chunk_values(values, cls.count_insert_params(table, values)):
+            statement = sa.insert(model_type).values(chunk_values).returning(*table.columns)
+            model_dicts.extend((await session.execute(statement)).mappings().all())
+        return model_dicts
+
+    @staticmethod
+    def get_ids_expr(model_type: type[ModelBaseType]) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие вхождения идентификатора модели в параметр-массив `ids`.
+        """
+        return model_type.id == sa.any_(sa.bindparam('ids', type_=postgresql.ARRAY(model_type.id.type)))
+
+    @classmethod
+    def chunk_ids(cls, ids: Sequence[IdType]) -> Iterator[list[IdType]]:
+        """
+        Разбиваем идентификаторы на пачки по `ids_chunk_size`.
+
+        Повторяющиеся идентификаторы удаляются, чтобы модель не была получена в нескольких пачках.
+        """
+        if len(ids) <= cls.ids_chunk_size:
+            yield list(ids)
+            return
+        unique_ids = list(dict.fromkeys(ids))
+        for i in range(0, len(unique_ids), cls.ids_chunk_size):
+            yield unique_ids[i : i + cls.ids_chunk_size]
+
+    @classmethod
+    def chunk_values(cls, values: list[dict[str, Any]], value_params: int) -> Iterator[list[dict[str, Any]]]:
+        """
+        Разбиваем значения на пачки с учетом ограничения на количество параметров запроса.
+
+        `value_params` - количество параметров, связываемых в запросе для одного значения.
+        """
+        chunk_size = max(1, cls.max_bind_params // max(value_params, 1))
+        for i in range(0, len(values), chunk_size):
+            yield values[i : i + chunk_size]
+
+    @staticmethod
+    def chunk_unique_values(
+        values: list[dict[str, Any]], index_elements: Sequence[str]
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Разбиваем значения на пачки без повторяющихся ключей конфликта.
+
+        Значения с отсутствующими полями ключа не конфликтуют между собой, т.к. NULL
+        в уникальном индексе не совпадает с другими значениями.
+        """
+        chunk: list[dict[str, Any]] = []
+        keys: set[tuple[Any, ...]] = set()
+        for value in values:
+            key = tuple(value.get(element) for element in index_elements)
+            if None not in key:
+                if key in keys:
+                    yield chunk
+                    chunk, keys = [], set()
+                keys.add(key)
+            chunk.append(value)
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def count_insert_params(table: sa.Table, values: Sequence[dict[str, Any]]) -> int:
+        """
+        Получаем количество параметров одной строки запроса `INSERT ... VALUES`.
+
+        Помимо полей значений учитываются столбцы со значениями по умолчанию, вычисляемыми
+        на стороне Python, т.к. SQLAlchemy связывает их для каждой строки.
+        """
+        names = {name for value in values for name in value}
+        for column in table.columns:
+            if column.default is not None and (column.default.is_scalar or column.default.is_callable):
+                names.add(column.name)
+        return len(names)
+
+    @classmethod
+    async def copy_values(
+        cls,
+        model_type: type[ModelBaseType],
+        values: list[dict[str, Any]],
+        session: AsyncSession,
+        connection: psycopg.AsyncConnection[Any],
+    ) -> list[sa.RowMapping]:
+        """
+        Вставляем значения в таблицу модели с помощью `COPY` через временную таблицу.
+
+        Временная таблица позволяет вернуть вставленные строки в порядке исходных значений.
+        Значения по умолчанию, вычисляемые на стороне Python, заполняются до загрузки.
+        """
+        table = cast(sa.Table, model_type.__table__)
+        values = [cls.fill_python_defaults([table], value) for value in values]
+        column_names = list(values[0])
+        dialect = session.get_bind().dialect
+        processors = [table.columns[name].type.dialect_impl(dialect).bind_processor(dialect) for name in column_names]
+        temp_table = sa.table(
+            f'copy_{uuid.uuid4().hex}', *(sa.column(name) for name in column_names), sa.column('copy_ordinal')
+        )
+        temp_table_identifier = sql.Identifier(temp_table.name)
+        columns_sql = sql.SQL(', ').join(map(sql.Identifier, column_names))
+        async with connection.cursor() as cursor:
+            await cursor.execute(
+                sql.SQL('CREATE TEMP TABLE {} AS SELECT {}, 0::bigint AS copy_ordinal FROM {} WITH NO DATA').format(
+                    temp_table_identifier,
+                    columns_sql,
+                    sql.Identifier(*filter(None, [table.schema, table.name])),
+                )
+            )
+            copy_sql = sql.SQL('COPY {} ({}, copy_ordinal) FROM STDIN').format(temp_table_identifier, columns_sql)
+            async with cursor.copy(copy_sql) as copy:
+                for ordinal, value in enumerate(values):
+                    row = [
+                        processor(value[name]) if processor else value[name]
+                        for name, processor in zip(column_names, processors, strict=True)
+                    ]
+                    await copy.write_row([*row, ordinal])
+        statement = (
+            sa.insert(table)
+            .from_select(
+                column_names,
+                sa.select(*(temp_table.c[name] for name in column_names)).order_by(temp_table.c.copy_ordinal),
+                include_defaults=False,
+            )
+            .returning(*table.columns.values())
+        )
+        model_dicts = list((await session.execute(statement)).mappings().all())
+        async with connection.cursor() as cursor:
+            await cursor.execute(sql.SQL('DROP TABLE {}').format(temp_table_identifier))
+        return model_dicts
 
     @classmethod
     async def bulk_create_parent_model(
@@ -348,57 +1221,112 @@ class DbCrudRepositoryBase(
     ) -> ReadSchemaBaseType:
         """
         Обновляем модель с помощью типа.
-        """
-        parent_dict = await cls.update_parent_model(model_type, update_dict, session)
-        statement = (
-            sa.update(model_type)
-            .where(model_type.id == update_dict['id'])
-            .values({k: v for k, v in update_dict.items() if k in model_type.__table__.columns if k != 'id'})
-            .returning(*model_type.__table__.columns.values())
-        )
-        model_dict = (await session.execute(statement)).mappings().one()
-        read_schema_type = cls.model_types_mapping[model_type]
-        return cast(
-            ReadSchemaBaseType,
-            read_schema_type.model_validate({**parent_dict, **model_dict}),
-        )
 
-    @classmethod
-    async def update_parent_model(
-        cls, model_type: type[ModelBaseType], update_dict: dict[str, Any], session: AsyncSession
-    ) -> dict[str, Any]:
-        """
-        Обновляем родительскую модель с помощью типа.
+        Уровни наследования обновляются одним запросом: каждый уровень обновляется своим CTE
+        `UPDATE ... RETURNING`, а уровни без обновляемых полей читаются в CTE `SELECT`.
         """
-        parent_model_type = cls.get_parent_model_type(model_type)
-        if parent_model_type is None:
-            return {}
-        return (await cls.update_with_model_type(parent_model_type, update_dict, session)).model_dump()
+        ctes: list[sa.CTE] = []
+        for parent_model_type in cls.get_model_type_chain(model_type):
+            table = cast(sa.Table, parent_model_type.__table__)
+            values = {k: v for k, v in update_dict.items() if k in table.columns if k != 'id'}
+            level_statement: sa.Select[Any] | sa.Update = (
+                sa.update(table).where(table.c.id == update_dict['id']).values(values).returning(*table.columns)
+                if values
+                else sa.select(*table.columns).where(table.c.id == update_dict['id'])
+            )
+            ctes.append(level_statement.cte(f'update_{table.name}'))
+        model_dict = (await session.execute(cls.select_inheritance_rows(ctes))).mappings().one()
+        read_schema_type = cls.model_types_mapping[model_type]
+        return cast(ReadSchemaBaseType, read_schema_type.model_validate(model_dict))
 
     @classmethod
     async def bulk_update_with_model_type(
-        cls, model_type: type[ModelBaseType], update_dicts: list[dict[str, Any]], session: AsyncSession
-    ) -> None:
+        cls,
+        model_type: type[ModelBaseType],
+        update_dicts: list[dict[str, Any]],
+        session: AsyncSession,
+        returning: bool = False,
+    ) -> list[ReadSchemaBaseType]:
         """
-        Создаем модели с помощью типа.
+        Обновляем модели с помощью типа.
         """
-        await cls.bulk_update_parent_model(model_type, update_dicts, session)
+        parent_dicts = await cls.bulk_update_parent_model(model_type, update_dicts, session, returning)
         values: list[dict[str, Any]] = []
         for update_dict in update_dicts:
             values.append({k: v for k, v in update_dict.items() if k in model_type.__table__.columns})
-        statement = sa.update(model_type)
-        await session.execute(statement, values)
+        model_dicts = await cls.update_values(model_type, values, session, returning)
+        if not returning:
+            return []
+        return cls.validate_list(
+            model_type,
+            [
+                {**parent_dict, **model_dicts[update_dict['id']]}
+                for update_dict, parent_dict in zip(update_dicts, parent_dicts, strict=True)
+                if update_dict['id'] in model_dicts
+            ],
+        )
 
     @classmethod
     async def bulk_update_parent_model(
-        cls, model_type: type[ModelBaseType], update_dicts: list[dict[str, Any]], session: AsyncSession
-    ) -> None:
+        cls,
+        model_type: type[ModelBaseType],
+        update_dicts: list[dict[str, Any]],
+        session: AsyncSession,
+        returning: bool = False,
+    ) -> list[dict[str, Any]]:
         """
         Обновляем родительские модели с помощью типа.
         """
         parent_model_type = cls.get_parent_model_type(model_type)
-        if parent_model_type is not None:
-            await cls.bulk_update_with_model_type(parent_model_type, update_dicts, session)
+        if parent_model_type is None:
+            return [{} for _ in update_dicts]
+        parent_models = await cls.bulk_update_with_model_type(parent_model_type, update_dicts, session, returning)
+        if not returning:
+            return [{} for _ in update_dicts]
+        parent_dicts = {ps.id: ps.model_dump() for ps in parent_models}
+        return [parent_dicts.get(update_dict['id'], {}) for update_dict in update_dicts]
+
+    @classmethod
+    async def update_values(
+        cls, model_type: type[ModelBaseType], values: list[dict[str, Any]], session: AsyncSession, returning: bool
+    ) -> dict[Any, sa.RowMapping]:
+        """
+        Обновляем значения в таблице модели.
+
+        Значения с одинаковым набором полей обновляются одним запросом `UPDATE ... FROM (VALUES ...)`.
+        Столбцы `VALUES` явно приводятся к типам столбцов таблицы, иначе PostgreSQL определяет
+        тип столбца, все значения которого `NULL`, как `text`.
+        Результаты запросов без `returning` откладываются, см. `deferred_results`.
+        """
+        table = cast(sa.Table, model_type.__table__)
+        grouped_values: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+        for value in values:
+            grouped_values[tuple(value)].append(value)
+        model_dicts: dict[Any, sa.RowMapping] = {}
+        for names, group_values in grouped_values.items():
+            set_names = [name for name in names if name != 'id']
+            if not set_names:
+                if returning:
+                    statement = sa.select(*table.columns).where(table.c.id.in_([value['id'] for value in group_values]))
+                    model_dicts.update({row['id']: row for row in (await session.execute(statement)).mappings()})
+                continue
+            for chunk_values in cls.chunk_values(group_values, len(names)):
+                values_table = sa.values(
+                    *(sa.column(name, table.c[name].type) for name in names), name='update_values'
+                ).data([tuple(value[name] for name in names) for value in chunk_values])
+                value_columns = {name: sa.cast(values_table.c[name], table.c[name].type) for name in names}
+                update_statement = (
+                    sa.update(table)
+                    .where(table.c.id == value_columns['id'])
+                    .values({name: value_columns[name] for name in set_names})
+                )
+                if returning:
+                    rows = (await session.execute(update_statement.returning(*table.columns))).mappings()
+                    model_dicts.update({row['id']: row for row in rows})
+                else:
+                    async with deferred_results(session):
+                        await session.execute(update_statement)
+        return model_dicts
 
     @classmethod
     async def upsert_with_model_type(
@@ -406,37 +1334,105 @@ class DbCrudRepositoryBase(
     ) -> ReadSchemaBaseType:
         """
         Создаем или обновляем модель с помощью типа.
+
+        Уровни наследования создаются или обновляются одним запросом: корневая модель вставляется
+        в CTE `INSERT ... ON CONFLICT DO UPDATE RETURNING`, а наследники получают ее идентификатор
+        из предыдущего CTE. Значения по умолчанию, вычисляемые на стороне Python, заполняются
+        для каждого уровня, но при конфликте обновляются только переданные поля.
         """
-        parent_dict = await cls.upsert_parent_model(model_type, create_dict, session)
-        primary_keys = {key.name for key in cast(Any, sa.inspect(model_type)).primary_key}
-        values = {k: v for k, v in create_dict.items() if k in model_type.__table__.columns}
-        statement = (
-            insert(model_type)
-            .values(values)
-            .on_conflict_do_update(
+        ctes: list[sa.CTE] = []
+        for parent_model_type in cls.get_model_type_chain(model_type):
+            table = cast(sa.Table, parent_model_type.__table__)
+            primary_keys = {key.name for key in cast(Any, sa.inspect(parent_model_type)).primary_key}
+            update_keys = [k for k in create_dict if k in table.columns and k not in primary_keys]
+            values = {k: v for k, v in cls.fill_python_defaults([table], create_dict).items() if k in table.columns}
+            if ctes:
+                values['id'] = ctes[0].c.id
+                insert_statement = insert(table).from_select(
+                    list(values),
+                    sa.select(
+                        *(
+                            value if k == 'id' else sa.literal(value, table.c[k].type).label(k)
+                            for k, value in values.items()
+                        )
+                    ),
+                    include_defaults=False,
+                )
+            else:
+                insert_statement = insert(table).values(values)
+            level_statement = insert_statement.on_conflict_do_update(
                 index_elements=primary_keys,
-                set_={k: v for k, v in values.items() if k not in primary_keys},
-            )
-            .returning(*model_type.__table__.columns.values())
-        )
-        model_dict = (await session.execute(statement)).mappings().one()
+                set_={k: insert_statement.excluded[k] for k in update_keys},
+            ).returning(*table.columns)
+            ctes.append(level_statement.cte(f'upsert_{table.name}'))
+        model_dict = (await session.execute(cls.select_inheritance_rows(ctes))).mappings().one()
         read_schema_type = cls.model_types_mapping[model_type]
-        return cast(
-            ReadSchemaBaseType,
-            read_schema_type.model_validate({**parent_dict, **model_dict}),
+        return cast(ReadSchemaBaseType, read_schema_type.model_validate(model_dict))
+
+    @classmethod
+    async def bulk_upsert_with_model_type(
+        cls,
+        model_type: type[ModelBaseType],
+        create_dicts: list[dict[str, Any]],
+        session: AsyncSession,
+        index_elements: Sequence[str] | None = None,
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Создаем или обновляем модели с помощью типа.
+
+        PostgreSQL не позволяет одному запросу `ON CONFLICT DO UPDATE` изменить строку дважды,
+        поэтому значения с повторяющимися ключами конфликта отправляются разными запросами
+        в исходном порядке, и последнее из них остается в базе данных.
+        """
+        parent_dicts = await cls.bulk_upsert_parent_model(model_type, create_dicts, session, index_elements)
+        table_columns = model_type.__table__.columns
+        if not index_elements or any(element not in table_columns for element in index_elements):
+            index_elements = [key.name for key in cast(Any, sa.inspect(model_type)).primary_key]
+        values: list[dict[str, Any]] = []
+        for create_dict, parent_dict in zip(create_dicts, parent_dicts, strict=True):
+            value = {k: v for k, v in create_dict.items() if k in table_columns}
+            if 'id' in parent_dict:
+                value['id'] = parent_dict['id']
+            values.append(value)
+        model_dicts: list[sa.RowMapping] = []
+        table = cast(sa.Table, model_type.__table__)
+        chunks = (
+            unique_chunk_values
+            for chunk_values in cls.chunk_values(values, cls.count_insert_params(table, values))
+            for unique_chunk_values in cls.chunk_unique_values(chunk_values, index_elements)
+        )
+        for chunk_values in chunks:
+            insert_statement = insert(model_type).values(chunk_values)
+            excluded = insert_statement.excluded
+            set_ = {k: excluded[k] for k in chunk_values[0] if k not in index_elements}
+            statement = insert_statement.on_conflict_do_update(
+                index_elements=index_elements,
+                set_=set_ or {k: excluded[k] for k in index_elements},
+            ).returning(*table_columns.values())
+            model_dicts.extend((await session.execute(statement)).mappings().all())
+        return cls.validate_list(
+            model_type,
+            [{**parent_dict, **model_dict} for parent_dict, model_dict in zip(parent_dicts, model_dicts, strict=True)],
         )
 
     @classmethod
-    async def upsert_parent_model(
-        cls, model_type: type[ModelBaseType], create_dict: dict[str, Any], session: AsyncSession
-    ) -> dict[str, Any]:
+    async def bulk_upsert_parent_model(
+        cls,
+        model_type: type[ModelBaseType],
+        create_dicts: list[dict[str, Any]],
+        session: AsyncSession,
+        index_elements: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """
-        Создаем или обновляем родительскую модель с помощью типа.
+        Создаем или обновляем родительские модели с помощью типа.
         """
         parent_model_type = cls.get_parent_model_type(model_type)
         if parent_model_type is None:
-            return {}
-        return (await cls.upsert_with_model_type(parent_model_type, create_dict, session)).model_dump()
+            return [{} for _ in create_dicts]
+        return [
+            ps.model_dump()
+            for ps in await cls.bulk_upsert_with_model_type(parent_model_type, create_dicts, session, index_elements)
+        ]
 
     @staticmethod
     def dump_create_object(create_object: CreateSchemaBaseType) -> dict[str, Any]:
@@ -448,6 +1444,41 @@ class DbCrudRepositoryBase(
             del create_dict['id']
         return create_dict
 
+    @staticmethod
+    def group_by_model_type(
+        objects: Sequence[SchemaType], models_mapping: dict[type[SchemaType], type[ModelBaseType]]
+    ) -> dict[type[ModelBaseType], list[int]]:
+        """
+        Группируем индексы схем по типу модели независимо от их порядка.
+        """
+        model_type_indexes: dict[type[ModelBaseType], list[int]] = defaultdict(list)
+        for i, obj in enumerate(objects):
+            model_type_indexes[models_mapping[type(obj)]].append(i)
+        return model_type_indexes
+
+    def make_target_cte(
+        self: Self, select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]]
+    ) -> sa.CTE:
+        """
+        Получаем CTE идентификаторов моделей, подходящих под фильтр запроса.
+        """
+        return self.make_aggregate_statement(None, None, select_filter, self.model_type.id.expression).cte('target')
+
+    @classmethod
+    def get_inheritance_tables(cls, mappers: Iterable[sa.orm.Mapper[Any]]) -> list[sa.Table]:
+        """
+        Получаем таблицы уровней наследования моделей и их родителей.
+
+        Таблицы упорядочены от наследников к корневой модели.
+        """
+        tables: list[sa.Table] = []
+        inheritance_mappers = {m for mapper in mappers for m in mapper.iterate_to_root()}
+        for mapper in sorted(inheritance_mappers, key=lambda m: len(m.class_.__mro__), reverse=True):
+            table = cast(sa.Table, mapper.local_table)
+            if table not in tables:
+                tables.append(table)
+        return tables
+
     @classmethod
     def get_parent_model_type(cls, model_type: type[ModelBaseType]) -> type[ModelBaseType] | None:
         """
@@ -458,16 +1489,14 @@ class DbCrudRepositoryBase(
         return model_type.__bases__[0]
 
     @classmethod
-    def check_get_by_ids_exact(cls, ids: Sequence[IdType], models: Sequence[ModelBaseType], exact: bool) -> None:
+    def check_get_by_ids_exact(cls, ids: Sequence[IdType], model_ids: Collection[IdType], exact: bool) -> None:
         """
         Проверяем, что по идентификаторам получены все модели.
         """
-        if exact and len(ids) != len(models):
-            raise ModelNotFoundError(
-                cls.model_type,
-                model_id=set(ids) - {cast(IdType, model.id) for model in models},
-            )
+        if exact and len(ids) != len(model_ids):
+            raise ModelNotFoundError(cls.model_type, model_id=set(ids) - set(model_ids))
 
+    @overload
     async def paginate_with_filter(
         self: Self,
         pagination: PaginationSchema,
@@ -476,31 +1505,275 @@ class DbCrudRepositoryBase(
         search_by: Iterable[str] | None = None,
         sorting: Iterable[str] | None = None,
         select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
-    ) -> PaginationResultSchema[ReadSchemaBaseType]:
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+    ) -> PaginationResultSchema[ReadSchemaBaseType]: ...
+
+    @overload
+    async def paginate_with_filter(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: type[SchemaType],
+    ) -> PaginationResultSchema[SchemaType]: ...
+
+    @overload
+    async def paginate_with_filter(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: Set[str],
+    ) -> PaginationResultSchema[dict[str, Any]]: ...
+
+    @tag_queries
+    async def paginate_with_filter(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+        projection: Projection | None = None,
+    ) -> PaginationResultSchema[Any]:
         """
         Получаем список моделей с пагинацией, поиском, сортировкой и фильтрами.
+
+        Точное количество вычисляется оконной функцией в том же запросе, что и страница.
+        Оценка количества заменяется точным подсчетом, если она меньше `estimated_count_threshold`.
+        Поиск выполняется способом `search_backend`, без сортировки модели упорядочиваются
+        по релевантности, если способ поиска ее поддерживает.
         """
-        search_by = search_by or []
-        sorting = sorting or []
-        async with self.session_manager.get_session() as s:
-            statement = self.select()
-            if select_filter:
-                statement = select_filter(statement)
-            if search:
-                search_where: sa.ColumnElement[Any] = sa.false()
-                for sb in search_by:
-                    search_where = sa.or_(search_where, getattr(self.model_type, sb).ilike(f'%{search}%'))
-                statement = statement.where(search_where)
-            order_by_expr = self.get_order_by_expr(sorting)
-            models = (
-                (await s.execute(statement.limit(pagination.limit).offset(pagination.offset).order_by(*order_by_expr)))
-                .scalars()
-                .all()
+        sorting = list(sorting or ())
+        filtered = select_filter is not None or bool(search)
+        select_key = self.get_select_key(projection, polymorphic_loading, pagination.limit)
+
+        def make_statement() -> sa.Select[Any]:
+            return self.filter_statement(
+                self.select_projection(projection, polymorphic_loading, pagination.limit),
+                search,
+                search_by,
+                select_filter,
+            )
+
+        def make_page_statement() -> sa.Select[Any]:
+            order_by_expr = self.get_order_by_expr(sorting) or self.get_search_order_by_expr(search, search_by)
+            page_statement = (
+                statement.order_by(*order_by_expr).offset(sa.bindparam('offset')).limit(sa.bindparam('limit'))
+            )
+            if count_strategy == CountStrategyEnum.EXACT:
+                return page_statement.add_columns(func.count().over())
+            return page_statement
+
+        async with self.session_manager.get_session(read_only=True) as s:
+            if filtered:
+                statement = make_statement()
+                page_statement = make_page_statement()
+            else:
+                statement = self.statement_cache.get(('paginate', *select_key), make_statement)
+                page_statement = self.statement_cache.get(
+                    ('paginate_page', *select_key, tuple(sorting), count_strategy == CountStrategyEnum.EXACT),
+                    make_page_statement,
+                )
+            rows: Sequence[sa.Row[Any]]
+            count: int | None = None
+            match count_strategy:
+                case CountStrategyEnum.EXACT:
+                    parameters = {'offset': pagination.offset, 'limit': pagination.limit}
+                    rows = (await s.execute(page_statement, parameters)).all()
+                    if rows:
+                        count = rows[0][-1]
+                    elif pagination.offset > 0:
+                        count_statement = statement.with_only_columns(func.count(self.model_type.id))
+                        count = (await s.execute(count_statement)).scalar_one()
+                    else:
+                        count = 0
+                    has_next = pagination.offset + len(rows) < (count or 0)
+                case CountStrategyEnum.ESTIMATED | CountStrategyEnum.NONE:
+                    parameters = {'offset': pagination.offset, 'limit': pagination.limit + 1}
+                    rows = (await s.execute(page_statement, parameters)).all()
+                    has_next = len(rows) > pagination.limit
+                    rows = rows[: pagination.limit]
+                    if count_strategy == CountStrategyEnum.ESTIMATED:
+                        count = await self.estimate_count(s, statement if filtered else None)
+                        if count < self.estimated_count_threshold:
+                            count_statement = statement.with_only_columns(func.count(self.model_type.id))
+                            count = (await s.execute(count_statement)).scalar_one()
+                            count_strategy = CountStrategyEnum.EXACT
+                        else:
+                            count = max(count, pagination.offset + len(rows) + int(has_next))
+            return PaginationResultSchema(
+                objects=self.validate_rows(rows, projection),
+                count=count,
+                count_strategy=count_strategy,
+                has_next=has_next,
+            )
+
+    async def estimate_count(self: Self, session: AsyncSession, statement: sa.Select[Any] | None = None) -> int:
+        """
+        Получаем оценку количества моделей без полного сканирования таблицы.
+
+        Для запроса без фильтров используется статистика `pg_class.reltuples`, иначе оценка
+        количества строк из плана выполнения запроса.
+        """
+        if statement is None:
+            table_name = postgresql.dialect().identifier_preparer.format_table(self.model_type.__table__)
+            reltuples_statement = sa.text('SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)')
+            reltuples = (await session.execute(reltuples_statement, {'table_name': table_name})).scalar_one_or_none()
+            return int(reltuples or 0)
+        plan = (await session.execute(Explain(statement))).scalar_one()
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    @tag_queries
+    async def paginate_by_cursor_with_filter(
+        self: Self,
+        pagination: CursorPaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None = None,
+        polymorphic_loading: PolymorphicLoadingEnum | None = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией по курсору, поиском, сортировкой и фильтрами.
+
+        Вместо смещения используется условие по ключам сортировки и идентификатору последней
+        модели предыдущей страницы, поэтому время получения страницы не зависит от ее номера.
+        """
+        read_schema_type = self.model_types_mapping[self.model_type]
+        fields = get_cursor_fields(sorting or [], read_schema_type)
+        async with self.session_manager.get_session(read_only=True) as s:
+            statement = self.filter_statement(
+                self.select_projection(None, polymorphic_loading, pagination.limit + 1),
+                search,
+                search_by,
+                select_filter,
             )
-            objects = [self.model_validate(model) for model in models]
-            count_statement = statement.with_only_columns(func.count(self.model_type.id))
-            count = (await s.execute(count_statement)).scalar_one()
-            return PaginationResultSchema(count=count, objects=objects)
+            if pagination.cursor is not None:
+                values = decode_cursor(pagination.cursor, fields, read_schema_type)
+                statement = statement.where(self.get_cursor_expr(fields, values))
+            order_by_expr = self.get_order_by_expr([f'-{field}' if desc else field for field, desc in fields])
+            rows = (await s.execute(statement.order_by(*order_by_expr).limit(pagination.limit + 1))).all()
+            objects: list[ReadSchemaBaseType] = self.validate_rows(rows[: pagination.limit], None)
+            next_cursor = encode_cursor(objects[-1], fields) if len(rows) > pagination.limit else None
+            return CursorPaginationResultSchema(objects=objects, next_cursor=next_cursor)
+
+    def filter_statement(
+        self: Self,
+        statement: sa.Select[Any],
+        search: str | None,
+        search_by: Iterable[str] | None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None,
+    ) -> sa.Select[Any]:
+        """
+        Применяем к запросу фильтры и поиск.
+        """
+        if select_filter:
+            statement = select_filter(statement)
+        if search:
+            statement = statement.where(self.search_backend.where(self.get_search_columns(search_by), search))
+        return statement
+
+    def make_aggregate_statement(
+        self: Self,
+        search: str | None,
+        search_by: Iterable[str] | None,
+        select_filter: Callable[[sa.Select[tuple[ModelBaseType]]], sa.Select[tuple[ModelBaseType]]] | None,
+        *columns: sa.ColumnElement[Any],
+    ) -> sa.Select[Any]:
+        """
+        Получаем запрос агрегатов моделей с поиском и фильтрами.
+
+        Фильтры применяются к запросу моделей, после чего выбираемые колонки заменяются агрегатами
+        с сохранением таблиц запроса.
+        """
+        statement = self.filter_statement(sa.select(self.model_type), search, search_by, select_filter)
+        return statement.with_only_columns(*columns, maintain_column_froms=True).order_by(None)
+
+    def get_aggregate_column(self: Self, field: str) -> sa.orm.InstrumentedAttribute[Any]:
+        """
+        Получаем колонку поля агрегации.
+        """
+        column = getattr(self.model_type, field, None)
+        if not isinstance(column, sa.orm.InstrumentedAttribute) or not isinstance(
+            column.property, sa.orm.ColumnProperty
+        ):
+            raise AggregateFieldNotFoundError(field)
+        return column
+
+    def get_search_columns(self: Self, search_by: Iterable[str] | None) -> list[sa.ColumnElement[Any]]:
+        """
+        Получаем колонки поиска.
+        """
+        return [getattr(self.model_type, sb) for sb in search_by or []]
+
+    def get_search_order_by_expr(
+        self: Self, search: str | None, search_by: Iterable[str] | None
+    ) -> list[sa.UnaryExpression[Any]]:
+        """
+        Получаем выражение сортировки по релевантности поиска.
+
+        Модели с одинаковой релевантностью сортируются по идентификатору.
+        """
+        columns = self.get_search_columns(search_by)
+        if not search or not columns:
+            return []
+        rank = self.search_backend.rank(columns, search)
+        if rank is None:
+            return []
+        return [rank.desc(), self.model_type.id.asc()]
+
+    def get_cursor_expr(
+        self: Self, fields: Sequence[tuple[str, bool]], values: Sequence[Any]
+    ) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие выборки моделей, следующих за курсором.
+
+        При одинаковом направлении сортировки по необнуляемым полям используется сравнение кортежей,
+        которое позволяет базе данных воспользоваться составным индексом. Как и в сортировке
+        PostgreSQL по умолчанию, NULL считается больше любого значения.
+        """
+        columns: list[sa.ColumnElement[Any]] = [getattr(self.model_type, field) for field, _ in fields]
+        descending = {desc for _, desc in fields}
+        nullable = any(getattr(column.expression, 'nullable', True) for column in columns)
+        if len(descending) == 1 and not nullable and all(value is not None for value in values):
+            literals = [sa.literal(value, column.type) for column, value in zip(columns, values, strict=True)]
+            left, right = sa.tuple_(*columns), sa.tuple_(*literals)
+            return left < right if descending.pop() else left > right
+        cursor_expr: sa.ColumnElement[bool] | None = None
+        for column, value, (_, desc) in reversed(list(zip(columns, values, fields, strict=True))):
+            compare_expr = self.get_cursor_compare_expr(column, value, desc)
+            if cursor_expr is None:
+                cursor_expr = compare_expr
+            else:
+                equal_expr = column.is_(None) if value is None else column == sa.literal(value, column.type)
+                cursor_expr = sa.or_(compare_expr, sa.and_(equal_expr, cursor_expr))
+        return cast(sa.ColumnElement[bool], cursor_expr)
+
+    @staticmethod
+    def get_cursor_compare_expr(column: sa.ColumnElement[Any], value: Any, desc: bool) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие строгого следования значения поля за значением курсора с учетом NULL.
+        """
+        if value is None:
+            return column.is_not(None) if desc else sa.false()
+        literal = sa.literal(value, column.type)
+        return column < literal if desc else sa.or_(column > literal, column.is_(None))
 
     def get_order_by_expr(self: Self, sorting: Iterable[str]) -> list[sa.UnaryExpression[Any]]:
         """
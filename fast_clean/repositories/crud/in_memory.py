@@ -5,14 +5,29 @@
 import contextlib
 import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Sequence
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence, Set
 from itertools import groupby
-from typing import Callable, Generic, Self, cast, get_args
+from typing import Any, Callable, Generic, Self, cast, get_args, overload
 
-from fast_clean.enums import ModelActionEnum
-from fast_clean.exceptions import ModelIntegrityError, ModelNotFoundError
-from fast_clean.schemas import PaginationResultSchema, PaginationSchema
+from pydantic import TypeAdapter
 
+from fast_clean.enums import AggregateFunctionEnum, CountStrategyEnum, ModelActionEnum
+from fast_clean.exceptions import (
+    AggregateFieldNotFoundError,
+    ModelIntegrityError,
+    ModelNotFoundError,
+    ProjectionFieldNotFoundError,
+)
+from fast_clean.schemas import (
+    CursorPaginationResultSchema,
+    CursorPaginationSchema,
+    PaginationResultSchema,
+    PaginationSchema,
+)
+
+from .cursor import decode_cursor, encode_cursor, get_cursor_fields
+from .projection import Projection, apply_projection, get_projection_fields
 from .type_vars import (
     CreateSchemaBaseType,
     CreateSchemaIntType,
@@ -21,6 +36,7 @@ from .type_vars import (
     ReadSchemaBaseType,
     ReadSchemaIntType,
     ReadSchemaType,
+    SchemaType,
     UpdateSchemaBaseType,
     UpdateSchemaIntType,
     UpdateSchemaType,
@@ -40,6 +56,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
     create_to_read_schemas_mapping: dict[type[CreateSchemaBaseType], type[ReadSchemaBaseType]]
     create_to_update_schemas_mapping: dict[type[CreateSchemaBaseType], type[UpdateSchemaBaseType]]
     update_to_read_schemas_mapping: dict[type[UpdateSchemaBaseType], type[ReadSchemaBaseType]]
+    read_schema_adapters_mapping: dict[type[ReadSchemaBaseType], TypeAdapter[list[ReadSchemaBaseType]]]
 
     read_schema_type: type[ReadSchemaBaseType]
 
@@ -74,6 +91,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         cls.create_to_read_schemas_mapping = {}
         cls.create_to_update_schemas_mapping = {}
         cls.update_to_read_schemas_mapping = {}
+        cls.read_schema_adapters_mapping = {}
         types: Sequence[tuple[type[ReadSchemaBaseType], type[CreateSchemaBaseType], type[UpdateSchemaBaseType]]] = [
             *cls.__subtypes__,
             get_args(base_repository_generic)[:3],
@@ -82,6 +100,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
             cls.create_to_read_schemas_mapping[create_schema_type] = read_schema_type
             cls.create_to_update_schemas_mapping[create_schema_type] = update_schema_type
             cls.update_to_read_schemas_mapping[update_schema_type] = read_schema_type
+            cls.read_schema_adapters_mapping[read_schema_type] = TypeAdapter(list[read_schema_type])  # type: ignore[valid-type]
 
         cls.read_schema_type, *_ = cast(
             tuple[
@@ -107,14 +126,23 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         read_schema_type = read_schema_type or self.read_schema_type
         return read_schema_type.__name__.replace('Schema', '')
 
-    async def get(self: Self, id: IdType) -> ReadSchemaBaseType:
+    @overload
+    async def get(self: Self, id: IdType) -> ReadSchemaBaseType: ...
+
+    @overload
+    async def get(self: Self, id: IdType, *, projection: type[SchemaType]) -> SchemaType: ...
+
+    @overload
+    async def get(self: Self, id: IdType, *, projection: Set[str]) -> dict[str, Any]: ...
+
+    async def get(self: Self, id: IdType, *, projection: Projection | None = None) -> Any:
         """
         Получаем модель по идентификатору.
         """
         model = self.models.get(id)
         if model is None:
             raise ModelNotFoundError(self.get_model_name(), model_id=id)
-        return model
+        return self.project([model], projection)[0]
 
     async def get_or_none(self: Self, id: IdType) -> ReadSchemaBaseType | None:
         """
@@ -124,7 +152,22 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
             return await self.get(id)
         return None
 
-    async def get_by_ids(self: Self, ids: Sequence[IdType], *, exact: bool = False) -> list[ReadSchemaBaseType]:
+    @overload
+    async def get_by_ids(self: Self, ids: Sequence[IdType], *, exact: bool = False) -> list[ReadSchemaBaseType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdType], *, exact: bool = False, projection: type[SchemaType]
+    ) -> list[SchemaType]: ...
+
+    @overload
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdType], *, exact: bool = False, projection: Set[str]
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_by_ids(
+        self: Self, ids: Sequence[IdType], *, exact: bool = False, projection: Projection | None = None
+    ) -> list[Any]:
         """
         Получаем список моделей по идентификаторам.
         """
@@ -134,7 +177,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
             if model is not None:
                 models.append(model)
         self.check_get_by_ids_exact(ids, models, exact)
-        return models
+        return self.project(models, projection)
 
     async def get_all(self: Self) -> list[ReadSchemaBaseType]:
         """
@@ -142,6 +185,68 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         """
         return list(self.models.values())
 
+    @overload
+    def stream_all(self: Self, *, batch_size: int = 1000) -> AsyncIterator[list[ReadSchemaBaseType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: type[SchemaType]
+    ) -> AsyncIterator[list[SchemaType]]: ...
+
+    @overload
+    def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: Set[str]
+    ) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    async def stream_all(
+        self: Self, *, batch_size: int = 1000, projection: Projection | None = None
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Получаем все модели пачками.
+        """
+        async for models in self.stream_filter(batch_size=batch_size, projection=cast(Any, projection)):
+            yield models
+
+    @overload
+    def stream_filter(
+        self: Self,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[ReadSchemaBaseType]]: ...
+
+    @overload
+    def stream_filter(
+        self: Self,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        *,
+        batch_size: int = 1000,
+        projection: type[SchemaType],
+    ) -> AsyncIterator[list[SchemaType]]: ...
+
+    @overload
+    def stream_filter(
+        self: Self,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        *,
+        batch_size: int = 1000,
+        projection: Set[str],
+    ) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    async def stream_filter(
+        self: Self,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        *,
+        batch_size: int = 1000,
+        projection: Projection | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Получаем модели с фильтрами пачками.
+        """
+        models = self.filter_models(None, None, select_filter)
+        for i in range(0, len(models), batch_size):
+            yield self.project(models[i : i + batch_size], projection)
+
     async def paginate(
         self: Self,
         pagination: PaginationSchema,
@@ -149,6 +254,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         search: str | None = None,
         search_by: Iterable[str] | None = None,
         sorting: Iterable[str] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
     ) -> PaginationResultSchema[ReadSchemaBaseType]:
         """
         Получаем список моделей с пагинацией, поиском и сортировкой.
@@ -158,8 +264,84 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
             search=search,
             search_by=search_by,
             sorting=sorting,
+            count_strategy=count_strategy,
         )
 
+    async def paginate_by_cursor(
+        self: Self,
+        pagination: CursorPaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией по курсору, поиском и сортировкой.
+        """
+        return self.paginate_by_cursor_with_filter(
+            pagination,
+            search=search,
+            search_by=search_by,
+            sorting=sorting,
+        )
+
+    async def count(
+        self: Self,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+    ) -> int:
+        """
+        Получаем количество моделей с поиском и фильтрами.
+        """
+        return len(self.filter_models(search, search_by, select_filter))
+
+    async def exists(
+        self: Self,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+    ) -> bool:
+        """
+        Проверяем наличие моделей с поиском и фильтрами.
+        """
+        return len(self.filter_models(search, search_by, select_filter)) > 0
+
+    async def aggregate(
+        self: Self,
+        aggregates: Mapping[str, tuple[AggregateFunctionEnum, str]],
+        *,
+        group_by: Sequence[str] = (),
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Получаем агрегаты полей моделей с группировкой, поиском и фильтрами.
+
+        Результат совпадает с результатом репозитория базы данных: доступны только поля базовой схемы,
+        строки отсортированы по полям группировки, значения None идут последними и не учитываются
+        агрегатными функциями.
+        """
+        for field in {*group_by, *(field for _, field in aggregates.values())}:
+            if field not in self.read_schema_type.model_fields:
+                raise AggregateFieldNotFoundError(field)
+        groups: dict[tuple[Any, ...], list[ReadSchemaBaseType]] = defaultdict(list)
+        for model in self.filter_models(search, search_by, select_filter):
+            groups[tuple(getattr(model, field, None) for field in group_by)].append(model)
+        if not group_by and not groups:
+            groups[()] = []
+        result: list[dict[str, Any]] = []
+        for key in sorted(groups, key=lambda k: [(value is None, value) for value in k]):
+            row = dict(zip(group_by, key, strict=True))
+            for label, (function, field) in aggregates.items():
+                values = [value for model in groups[key] if (value := getattr(model, field, None)) is not None]
+                row[label] = self.aggregate_values(function, values)
+            result.append(row)
+        return result
+
     async def create(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Создаем модель.
@@ -172,9 +354,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         """
         Создаем несколько моделей.
         """
-        models: list[ReadSchemaBaseType] = []
-        for create_object in create_objects:
-            models.append(self.make_model(create_object))
+        models = self.make_models(create_objects)
         for model in models:
             self.models[cast(IdType, model.id)] = model
         return models
@@ -206,6 +386,12 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         for update_object in update_objects:
             await self.update(update_object)
 
+    async def bulk_update_returning(self: Self, update_objects: list[UpdateSchemaBaseType]) -> list[ReadSchemaBaseType]:
+        """
+        Обновляем несколько моделей и получаем обновленные модели.
+        """
+        return [await self.update(update_object) for update_object in update_objects]
+
     async def upsert(self: Self, create_object: CreateSchemaBaseType) -> ReadSchemaBaseType:
         """
         Создаем или обновляем модель.
@@ -221,6 +407,30 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         )
         return self.models[cast(IdType, create_object.id)]
 
+    async def bulk_upsert(
+        self: Self, create_objects: list[CreateSchemaBaseType], *, index_elements: Sequence[str] | None = None
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Создаем или обновляем несколько моделей.
+        """
+        models: list[ReadSchemaBaseType] = []
+        for create_object in create_objects:
+            if index_elements:
+                existing_model = next(
+                    (
+                        model
+                        for model in self.models.values()
+                        if all(getattr(model, e) == getattr(create_object, e) for e in index_elements)
+                    ),
+                    None,
+                )
+                if existing_model is not None:
+                    create_object = cast(
+                        CreateSchemaBaseType, create_object.model_copy(update={'id': existing_model.id})
+                    )
+            models.append(await self.upsert(create_object))
+        return models
+
     async def delete(self: Self, ids: Sequence[IdType]) -> None:
         """
         Удаляем модели.
@@ -244,6 +454,7 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
                 model_id=set(ids) - {cast(IdType, model.id) for model in models},
             )
 
+    @overload
     def paginate_with_filter(
         self: Self,
         pagination: PaginationSchema,
@@ -252,26 +463,159 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         search_by: Iterable[str] | None = None,
         sorting: Iterable[str] | None = None,
         select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
-    ) -> PaginationResultSchema[ReadSchemaBaseType]:
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+    ) -> PaginationResultSchema[ReadSchemaBaseType]: ...
+
+    @overload
+    def paginate_with_filter(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        projection: type[SchemaType],
+    ) -> PaginationResultSchema[SchemaType]: ...
+
+    @overload
+    def paginate_with_filter(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        projection: Set[str],
+    ) -> PaginationResultSchema[dict[str, Any]]: ...
+
+    def paginate_with_filter(
+        self: Self,
+        pagination: PaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+        count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+        projection: Projection | None = None,
+    ) -> PaginationResultSchema[Any]:
         """
         Получаем список моделей с пагинацией, поиском, сортировкой и фильтрами.
+
+        Количество моделей в памяти всегда подсчитывается точно.
         """
-        search_by = search_by or []
         sorting = sorting or []
+        models = self.filter_models(search, search_by, select_filter)
+        models = self.sort(models, sorting)
+        if count_strategy == CountStrategyEnum.ESTIMATED:
+            count_strategy = CountStrategyEnum.EXACT
+        return PaginationResultSchema(
+            objects=self.project(models[pagination.offset : pagination.offset + pagination.limit], projection),
+            count=len(models) if count_strategy == CountStrategyEnum.EXACT else None,
+            count_strategy=count_strategy,
+            has_next=pagination.offset + pagination.limit < len(models),
+        )
+
+    def paginate_by_cursor_with_filter(
+        self: Self,
+        pagination: CursorPaginationSchema,
+        *,
+        search: str | None = None,
+        search_by: Iterable[str] | None = None,
+        sorting: Iterable[str] | None = None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaBaseType]:
+        """
+        Получаем список моделей с пагинацией по курсору, поиском, сортировкой и фильтрами.
+        """
+        fields = get_cursor_fields(sorting or [], self.read_schema_type)
+        models = self.filter_models(search, search_by, select_filter)
+        models = self.sort(models, [f'-{field}' if desc else field for field, desc in fields])
+        if pagination.cursor is not None:
+            values = decode_cursor(pagination.cursor, fields, self.read_schema_type)
+            models = [model for model in models if self.is_after_cursor(model, fields, values)]
+        objects = models[: pagination.limit]
+        next_cursor = encode_cursor(objects[-1], fields) if len(models) > pagination.limit else None
+        return CursorPaginationResultSchema(objects=objects, next_cursor=next_cursor)
+
+    def filter_models(
+        self: Self,
+        search: str | None,
+        search_by: Iterable[str] | None,
+        select_filter: Callable[[ReadSchemaBaseType], bool] | None,
+    ) -> list[ReadSchemaBaseType]:
+        """
+        Получаем модели с учетом фильтров и поиска.
+        """
         models = list(filter(select_filter, self.models.values()) if select_filter else self.models.values())
         if search:
             search_models: list[ReadSchemaBaseType] = []
             for model in models:
-                for sb in search_by:
+                for sb in search_by or []:
                     if search in getattr(model, sb):
                         search_models.append(model)
             models = search_models
-        models = self.sort(models, sorting)
-        return PaginationResultSchema(
-            objects=models[pagination.offset : pagination.offset + pagination.limit],
-            count=len(models),
+        return models
+
+    def project(self: Self, models: Sequence[ReadSchemaBaseType], projection: Projection | None) -> list[Any]:
+        """
+        Приводим модели к проекции.
+
+        Для моделей, в схемах которых нет поля проекции, значение поля равно None.
+        """
+        if projection is None:
+            return list(models)
+        fields = get_projection_fields(projection)
+        read_schema_types = {self.read_schema_type, *self.create_to_read_schemas_mapping.values()}
+        for field in fields:
+            if all(field not in read_schema_type.model_fields for read_schema_type in read_schema_types):
+                raise ProjectionFieldNotFoundError(field)
+        return apply_projection(
+            ({field: getattr(model, field, None) for field in fields} for model in models), projection
         )
 
+    @classmethod
+    def is_after_cursor(
+        cls, model: ReadSchemaBaseType, fields: Sequence[tuple[str, bool]], values: Sequence[Any]
+    ) -> bool:
+        """
+        Проверяем, что модель следует за курсором.
+        """
+        for (field, desc), value in zip(fields, values, strict=True):
+            model_value = getattr(model, field)
+            if model_value != value:
+                model_key, key = cls.get_sort_key(model_value), cls.get_sort_key(value)
+                return model_key < key if desc else model_key > key
+        return False
+
+    @staticmethod
+    def get_sort_key(value: Any) -> tuple[bool, Any]:
+        """
+        Получаем ключ сортировки значения поля.
+
+        Как и в PostgreSQL, None считается больше любого значения.
+        """
+        return value is None, value
+
+    @staticmethod
+    def aggregate_values(function: AggregateFunctionEnum, values: list[Any]) -> Any:
+        """
+        Применяем агрегатную функцию к значениям поля.
+        """
+        match function:
+            case AggregateFunctionEnum.COUNT:
+                return len(values)
+            case AggregateFunctionEnum.SUM:
+                return sum(values) if values else None
+            case AggregateFunctionEnum.MIN:
+                return min(values, default=None)
+            case AggregateFunctionEnum.MAX:
+                return max(values, default=None)
+
     @classmethod
     def sort(cls, models: list[ReadSchemaBaseType], sorting: Iterable[str]) -> list[ReadSchemaBaseType]:
         """
@@ -281,9 +625,9 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
             return models
         st, *sorting = sorting
         if st[0] == '-':
-            sorted_models = sorted(models, key=lambda model: getattr(model, st[1:]), reverse=True)
+            sorted_models = sorted(models, key=lambda model: cls.get_sort_key(getattr(model, st[1:])), reverse=True)
         else:
-            sorted_models = sorted(models, key=lambda model: getattr(model, st))
+            sorted_models = sorted(models, key=lambda model: cls.get_sort_key(getattr(model, st)))
         result: list[ReadSchemaBaseType] = []
         for _, group_models in groupby(sorted_models, lambda model: getattr(model, st[1:] if st[0] == '-' else st)):
             result.extend(cls.sort(list(group_models), sorting))
@@ -293,14 +637,31 @@ class InMemoryCrudRepositoryBase(ABC, Generic[ReadSchemaBaseType, CreateSchemaBa
         """
         Создаем модель без сохранения.
         """
-        create_dict = create_object.model_dump()
-        if create_dict['id'] is None:
-            create_dict['id'] = self.generate_id()
-        read_schema_type = self.create_to_read_schemas_mapping[type(create_object)]
-        model = cast(ReadSchemaBaseType, read_schema_type.model_validate(create_dict))
-        if model.id in self.models:
-            raise ModelIntegrityError(self.get_model_name(read_schema_type), ModelActionEnum.INSERT)
-        return model
+        return self.make_models([create_object])[0]
+
+    def make_models(self: Self, create_objects: Sequence[CreateSchemaBaseType]) -> list[ReadSchemaBaseType]:
+        """
+        Создаем модели без сохранения.
+
+        Модели одного типа проверяются одним вызовом `TypeAdapter`.
+        """
+        type_indexes: dict[type[ReadSchemaBaseType], list[int]] = defaultdict(list)
+        for i, create_object in enumerate(create_objects):
+            type_indexes[self.create_to_read_schemas_mapping[type(create_object)]].append(i)
+        models: list[ReadSchemaBaseType | None] = [None] * len(create_objects)
+        for read_schema_type, indexes in type_indexes.items():
+            create_dicts: list[dict[str, Any]] = []
+            for i in indexes:
+                create_dict = create_objects[i].model_dump()
+                if create_dict['id'] is None:
+                    create_dict['id'] = self.generate_id()
+                create_dicts.append(create_dict)
+            type_models = self.read_schema_adapters_mapping[read_schema_type].validate_python(create_dicts)
+            for i, model in zip(indexes, type_models, strict=True):
+                if model.id in self.models:
+                    raise ModelIntegrityError(self.get_model_name(read_schema_type), ModelActionEnum.INSERT)
+                models[i] = model
+        return cast(list[ReadSchemaBaseType], models)
 
 
 class InMemoryCrudRepositoryInt(
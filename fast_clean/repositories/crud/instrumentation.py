@@ -0,0 +1,75 @@
+"""
+Модуль, содержащий разметку запросов к базе данных методами репозитория.
+
+Методы репозитория сохраняют в контекстной переменной класс репозитория и название метода,
+поэтому обработчики событий движка SQLAlchemy могут определить, каким методом выполнен запрос.
+"""
+
+import functools
+import inspect
+from collections.abc import AsyncIterator, Callable
+from contextvars import ContextVar
+from typing import Any, NamedTuple, TypeVar, cast
+
+FuncType = TypeVar('FuncType', bound=Callable[..., Any])
+
+
+class QueryTag(NamedTuple):
+    """
+    Метка запроса к базе данных.
+    """
+
+    repository: str
+    method: str
+
+
+query_tag_var: ContextVar[QueryTag | None] = ContextVar('query_tag', default=None)
+
+
+def get_query_tag() -> QueryTag | None:
+    """
+    Получаем метку текущего запроса к базе данных.
+    """
+    return query_tag_var.get()
+
+
+def tag_queries(func: FuncType) -> FuncType:
+    """
+    Размечаем запросы метода репозитория.
+
+    Если метод вызван из другого размеченного метода, сохраняется метка внешнего метода.
+    Для асинхронных генераторов метка устанавливается только на время получения очередного
+    элемента, чтобы не изменять контекст вызывающего кода.
+    """
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def async_gen_wrapper(self: Any, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            tag = query_tag_var.get() or QueryTag(type(self).__name__, func.__name__)
+            iterator = func(self, *args, **kwargs)
+            try:
+                while True:
+                    token = query_tag_var.set(tag)
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        query_tag_var.reset(token)
+                    yield item
+            finally:
+                await iterator.aclose()
+
+        return cast(FuncType, async_gen_wrapper)
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if query_tag_var.get() is not None:
+            return await func(self, *args, **kwargs)
+        token = query_tag_var.set(QueryTag(type(self).__name__, func.__name__))
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            query_tag_var.reset(token)
+
+    return cast(FuncType, wrapper)
@@ -0,0 +1,113 @@
+"""
+Модуль, содержащий загрузчик моделей, объединяющий получение моделей по идентификатору в один запрос.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, Self, cast
+
+from fast_clean.exceptions import ModelNotFoundError
+
+if TYPE_CHECKING:
+    from . import CrudRepositoryBaseProtocol
+
+
+class CrudDataLoader:
+    """
+    Загрузчик моделей в рамках одного запроса.
+
+    Вызовы `get` и `get_or_none`, выполненные за одну итерацию цикла событий, объединяются
+    в один вызов `get_by_ids` для каждого репозитория. Повторяющиеся идентификаторы запрашиваются
+    один раз. Подходит для любого репозитория, реализующего `CrudRepositoryBaseProtocol`.
+
+    Репозитории одного запроса обычно используют общую сессию, которая не допускает конкурентного
+    использования, поэтому вызовы `get_by_ids` выполняются последовательно.
+    """
+
+    def __init__(self) -> None:
+        self.batches: dict[
+            int, tuple[CrudRepositoryBaseProtocol[Any, Any, Any, Any], dict[Hashable, asyncio.Future[Any]]]
+        ] = {}
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.lock = asyncio.Lock()
+
+    async def get(self: Self, repository: CrudRepositoryBaseProtocol[Any, Any, Any, Any], id: Any) -> Any:
+        """
+        Получаем модель по идентификатору.
+        """
+        model = await self.get_or_none(repository, id)
+        if model is None:
+            raise ModelNotFoundError(getattr(repository, 'model_type', type(repository).__name__), model_id=id)
+        return model
+
+    async def get_or_none(self: Self, repository: CrudRepositoryBaseProtocol[Any, Any, Any, Any], id: Any) -> Any:
+        """
+        Получаем модель или None по идентификатору.
+        """
+        loop = asyncio.get_running_loop()
+        if not self.batches:
+            loop.call_soon(self.dispatch)
+        _, batch = self.batches.setdefault(self.get_repository_key(repository), (repository, {}))
+        future = batch.get(id)
+        if future is None:
+            future = batch[id] = loop.create_future()
+        return await asyncio.shield(future)
+
+    def dispatch(self: Self) -> None:
+        """
+        Запускаем загрузку идентификаторов, накопленных за итерацию цикла событий, в одной задаче.
+        """
+        batches = list(self.batches.values())
+        self.batches.clear()
+        task = asyncio.get_running_loop().create_task(self.load_batches(batches))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def load_batches(
+        self: Self,
+        batches: list[tuple[CrudRepositoryBaseProtocol[Any, Any, Any, Any], dict[Hashable, asyncio.Future[Any]]]],
+    ) -> None:
+        """
+        Загружаем пачки репозиториев последовательно.
+
+        Блокировка не дает пересекаться загрузкам разных итераций цикла событий.
+        """
+        try:
+            async with self.lock:
+                for repository, batch in batches:
+                    await self.load(repository, batch)
+        except asyncio.CancelledError:
+            for _, batch in batches:
+                for future in batch.values():
+                    future.cancel()
+            raise
+
+    @staticmethod
+    async def load(
+        repository: CrudRepositoryBaseProtocol[Any, Any, Any, Any], batch: dict[Hashable, asyncio.Future[Any]]
+    ) -> None:
+        """
+        Загружаем модели одним запросом и передаем их ожидающим вызовам.
+        """
+        try:
+            models = await repository.get_by_ids(cast(Any, list(batch)))
+        except Exception as exception:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exception)
+            return
+        models_mapping = {model.id: model for model in models}
+        for id, future in batch.items():
+            if not future.done():
+                future.set_result(models_mapping.get(id))
+
+    @staticmethod
+    def get_repository_key(repository: CrudRepositoryBaseProtocol[Any, Any, Any, Any]) -> int:
+        """
+        Получаем ключ репозитория.
+
+        Репозитории сравниваются по экземпляру, т.к. разные экземпляры могут использовать разные сессии.
+        """
+        return id(repository)
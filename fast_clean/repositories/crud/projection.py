@@ -0,0 +1,42 @@
+"""
+Модуль, содержащий функционал проекций для получения части полей моделей.
+
+Проекция задается множеством названий полей или схемой Pydantic с частью полей схемы
+для чтения. В первом случае модели возвращаются в виде словарей, во втором - в виде схем.
+"""
+
+import functools
+from collections.abc import Iterable, Mapping, Set
+from typing import Any, TypeAlias
+
+from pydantic import BaseModel, TypeAdapter
+
+Projection: TypeAlias = Set[str] | type[BaseModel]
+
+
+def get_projection_fields(projection: Projection) -> list[str]:
+    """
+    Получаем названия полей проекции.
+    """
+    if isinstance(projection, Set):
+        return sorted(projection)
+    return list(projection.model_fields)
+
+
+@functools.cache
+def get_projection_adapter(projection: type[BaseModel]) -> TypeAdapter[list[BaseModel]]:
+    """
+    Получаем кэшированный адаптер для проверки списка схем проекции.
+    """
+    return TypeAdapter(list[projection])  # type: ignore[valid-type]
+
+
+def apply_projection(values: Iterable[Mapping[str, Any]], projection: Projection) -> list[Any]:
+    """
+    Приводим значения полей к проекции.
+    """
+    fields = get_projection_fields(projection)
+    dicts = [{field: value[field] for field in fields} for value in values]
+    if isinstance(projection, Set):
+        return dicts
+    return get_projection_adapter(projection).validate_python(dicts)
@@ -0,0 +1,158 @@
+"""
+Модуль, содержащий способы поиска моделей в базе данных.
+
+Представлено три реализации:
+- Ilike - поиск подстроки с помощью `ilike`;
+- Trigram - поиск по сходству триграмм `pg_trgm`;
+- FullText - полнотекстовый поиск с помощью `tsvector` и `websearch_to_tsquery`.
+
+Для каждого способа можно создать подходящие GIN индексы с помощью
+`fast_clean.contrib.sqlalchemy_utils.create_search_indexes`.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Protocol, Self
+
+import sqlalchemy as sa
+from sqlalchemy.sql.expression import func
+
+
+class SearchBackendProtocol(Protocol):
+    """
+    Протокол способа поиска моделей.
+    """
+
+    extensions: Sequence[str]
+    index_suffix: str
+
+    def where(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие поиска по колонкам.
+        """
+        ...
+
+    def rank(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[Any] | None:
+        """
+        Получаем выражение релевантности модели или None, если способ не поддерживает ранжирование.
+        """
+        ...
+
+    def get_index_expression(self: Self, column_name: str) -> sa.TextClause:
+        """
+        Получаем выражение GIN индекса колонки.
+        """
+        ...
+
+
+class IlikeSearchBackend:
+    """
+    Поиск подстроки с помощью `ilike`.
+
+    Без индекса приводит к полному сканированию таблицы, индекс `gin_trgm_ops` позволяет
+    выполнять поиск по индексу.
+    """
+
+    extensions: Sequence[str] = ('pg_trgm',)
+    index_suffix: str = 'trgm'
+
+    def where(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие поиска по колонкам.
+        """
+        return sa.or_(sa.false(), *(column.ilike(f'%{search}%') for column in columns))
+
+    def rank(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[Any] | None:
+        """
+        Получаем выражение релевантности модели.
+
+        Поиск подстроки не поддерживает ранжирование.
+        """
+        return None
+
+    def get_index_expression(self: Self, column_name: str) -> sa.TextClause:
+        """
+        Получаем выражение GIN индекса колонки.
+        """
+        return sa.text(f'{column_name} gin_trgm_ops')
+
+
+class TrigramSearchBackend(IlikeSearchBackend):
+    """
+    Поиск по сходству триграмм `pg_trgm`.
+
+    Модель находится, если строка поиска похожа на одно из слов колонки больше, чем
+    `pg_trgm.word_similarity_threshold`. Модели ранжируются по наибольшему сходству.
+    """
+
+    def where(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие поиска по колонкам.
+        """
+        return sa.or_(sa.false(), *(sa.literal(search).op('<%')(column) for column in columns))
+
+    def rank(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[Any] | None:
+        """
+        Получаем выражение релевантности модели.
+        """
+        return func.greatest(*(func.coalesce(func.word_similarity(search, column), 0) for column in columns))
+
+
+class FullTextSearchBackend:
+    """
+    Полнотекстовый поиск с помощью `tsvector` и `websearch_to_tsquery`.
+
+    Строка поиска поддерживает синтаксис поисковых систем: кавычки, `or` и `-`.
+    Модели ранжируются по сумме `ts_rank` колонок.
+    """
+
+    extensions: Sequence[str] = ()
+    index_suffix: str = 'fts'
+
+    def __init__(self, config: str = 'simple') -> None:
+        self.config = config
+
+    def where(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[bool]:
+        """
+        Получаем условие поиска по колонкам.
+        """
+        query = self.make_query(search)
+        return sa.or_(sa.false(), *(self.make_vector(column).op('@@')(query) for column in columns))
+
+    def rank(self: Self, columns: Sequence[sa.ColumnElement[Any]], search: str) -> sa.ColumnElement[Any] | None:
+        """
+        Получаем выражение релевантности модели.
+        """
+        query = self.make_query(search)
+        return sum(
+            (func.ts_rank(self.make_vector(column), query) for column in columns[1:]),
+            func.ts_rank(self.make_vector(columns[0]), query),
+        )
+
+    def get_index_expression(self: Self, column_name: str) -> sa.TextClause:
+        """
+        Получаем выражение GIN индекса колонки.
+
+        Выражение совпадает с выражением условия поиска, чтобы индекс использовался в запросах.
+        """
+        return sa.text(f'to_tsvector({self.make_config().text}, {column_name})')
+
+    def make_config(self: Self) -> sa.TextClause:
+        """
+        Получаем конфигурацию полнотекстового поиска.
+
+        Конфигурация передается константой, т.к. выражение индекса не может содержать параметры.
+        """
+        config = self.config.replace("'", "''")
+        return sa.text(f"'{config}'::regconfig")
+
+    def make_vector(self: Self, column: sa.ColumnElement[Any]) -> sa.ColumnElement[Any]:
+        """
+        Получаем документ колонки.
+        """
+        return func.to_tsvector(self.make_config(), column)
+
+    def make_query(self: Self, search: str) -> sa.ColumnElement[Any]:
+        """
+        Получаем запрос по строке поиска.
+        """
+        return func.websearch_to_tsquery(self.make_config(), search)
@@ -0,0 +1,69 @@
+"""
+Модуль, содержащий кеш шаблонов запросов репозитория.
+
+Шаблон запроса создается один раз и переиспользуется с новыми значениями параметров, поэтому
+запрос не строится заново, а ключ кеша компиляции SQLAlchemy вычисляется только при первом выполнении.
+"""
+
+from collections.abc import Callable, Hashable, Set
+from typing import Self, TypeVar, cast
+
+import sqlalchemy as sa
+
+from .projection import Projection
+
+StatementType = TypeVar('StatementType', bound=sa.Executable)
+
+
+class StatementCache:
+    """
+    Кеш шаблонов запросов со счетчиками попаданий и промахов.
+
+    Количество шаблонов ограничено `max_size`, после заполнения кеша новые шаблоны
+    создаются при каждом обращении.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.statements: dict[Hashable, sa.Executable] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self: Self, key: Hashable, factory: Callable[[], StatementType]) -> StatementType:
+        """
+        Получаем шаблон запроса по ключу или создаем его.
+        """
+        statement = self.statements.get(key)
+        if statement is not None:
+            self.hits += 1
+            return cast(StatementType, statement)
+        self.misses += 1
+        statement = factory()
+        if len(self.statements) < self.max_size:
+            self.statements[key] = statement
+        return statement
+
+    @property
+    def hit_rate(self: Self) -> float:
+        """
+        Доля попаданий в кеш.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self: Self) -> None:
+        """
+        Очищаем кеш и счетчики.
+        """
+        self.statements.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def get_projection_key(projection: Projection | None) -> Hashable:
+    """
+    Получаем ключ проекции для кеша шаблонов запросов.
+    """
+    if isinstance(projection, Set):
+        return frozenset(projection)
+    return projection
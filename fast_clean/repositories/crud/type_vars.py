@@ -5,6 +5,8 @@
 import uuid
 from typing import TypeVar
 
+from pydantic import BaseModel
+
 from fast_clean.db import BaseInt, BaseUUID
 from fast_clean.schemas import (
     CreateSchema,
@@ -21,6 +23,7 @@ ReadSchemaBaseType = TypeVar('ReadSchemaBaseType', bound=ReadSchemaInt | ReadSch
 UpdateSchemaBaseType = TypeVar('UpdateSchemaBaseType', bound=UpdateSchemaInt | UpdateSchema)
 IdType = TypeVar('IdType', bound=int | uuid.UUID)
 IdTypeContravariant = TypeVar('IdTypeContravariant', bound=int | uuid.UUID, contravariant=True)
+SchemaType = TypeVar('SchemaType', bound=BaseModel)
 
 
 ModelIntType = TypeVar('ModelIntType', bound=BaseInt)
@@ -8,6 +8,8 @@ from .exceptions import ValidationErrorSchema as ValidationErrorSchema
 from .pagination import (
     AppliedPaginationResponseSchema as AppliedPaginationResponseSchema,
 )
+from .pagination import CursorPaginationResultSchema as CursorPaginationResultSchema
+from .pagination import CursorPaginationSchema as CursorPaginationSchema
 from .pagination import PaginationRequestSchema as PaginationRequestSchema
 from .pagination import PaginationResponseSchema as PaginationResponseSchema
 from .pagination import PaginationResultSchema as PaginationResultSchema
@@ -4,10 +4,12 @@
 
 from __future__ import annotations
 
-from typing import Generic, Self, TypeVar
+from typing import Any, Generic, Self, TypeVar
 
 from pydantic import BaseModel, Field
 
+from fast_clean.enums import CountStrategyEnum
+
 from .request_response import ResponseSchema
 
 
@@ -29,11 +31,27 @@ class PaginationRequestSchema(BaseModel):
 class AppliedPaginationResponseSchema(ResponseSchema):
     """
     Схема ответа примененной пагинации.
+
+    При подсчете `CountStrategyEnum.NONE` количество не передается, а наличие следующей
+    страницы определяется по `has_next`.
     """
 
     page: int
     page_size: int
-    count: int
+    count: int | None
+    has_next: bool | None = None
+
+    @classmethod
+    def from_result(cls, pagination: PaginationRequestSchema, result: PaginationResultSchema[Any]) -> Self:
+        """
+        Создаем схему ответа по запросу и результату пагинации.
+        """
+        return cls(
+            page=pagination.page,
+            page_size=pagination.page_size,
+            count=result.count,
+            has_next=result.has_next,
+        )
 
 
 class PaginationResponseSchema(ResponseSchema):
@@ -59,7 +77,30 @@ T = TypeVar('T')
 class PaginationResultSchema(BaseModel, Generic[T]):
     """
     Схема результата пагинации.
+
+    При подсчете `CountStrategyEnum.NONE` количество не вычисляется, а наличие следующей
+    страницы определяется по `has_next`.
+    """
+
+    objects: list[T]
+    count: int | None
+    count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT
+    has_next: bool | None = None
+
+
+class CursorPaginationSchema(BaseModel):
+    """
+    Схема пагинации с помощью курсора.
+    """
+
+    limit: int
+    cursor: str | None = None
+
+
+class CursorPaginationResultSchema(BaseModel, Generic[T]):
+    """
+    Схема результата пагинации с помощью курсора.
     """
 
     objects: list[T]
-    count: int
+    next_cursor: str | None
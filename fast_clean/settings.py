@@ -29,8 +29,28 @@ class CoreDbSettingsSchema(BaseModel):
 
     pool_pre_ping: bool = True
     disable_prepared_statements: bool = True
+    prepare_threshold: int = 5
+    prepared_max: int = 100
+    pgbouncer: bool = False
+    pipeline: bool = False
     scheme: str = 'public'
 
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_recycle: int = -1
+    pool_timeout: float = 30.0
+    pool_use_lifo: bool = False
+    pool_prewarm: int = 0
+
+    replica_dsns: Annotated[list[str], Field(default_factory=list)]
+    replica_max_lag: float | None = None
+    replica_lag_check_interval: float = 5.0
+    read_your_writes_window: float | None = None
+
+    slow_query_threshold: float | None = None
+    slow_query_sample_rate: float = 1.0
+    slow_query_explain: bool = False
+
     @property
     def dsn(self: Self) -> str:
         """
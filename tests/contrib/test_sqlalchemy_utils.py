@@ -1,10 +1,14 @@
+import io
 from enum import StrEnum, auto
 from unittest.mock import Mock
 
 import pytest
 import sqlalchemy_utils
 from alembic.autogenerate.api import AutogenContext
-from fast_clean.contrib.sqlalchemy_utils.utils import render_item
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from fast_clean.contrib.sqlalchemy_utils.utils import create_search_indexes, drop_search_indexes, render_item
+from fast_clean.repositories import FullTextSearchBackend, SearchBackendProtocol, TrigramSearchBackend
 from sqlalchemy import LargeBinary, String
 
 
@@ -79,3 +83,34 @@ class TestRenderItemUnsupported:
         context = mock_autogen_context()
         result = render_item('table', 'some_table', context)
         assert result is False
+
+
+# Тесты для индексов поиска
+class TestSearchIndexes:
+    @pytest.mark.parametrize(
+        'search_backend, expected',
+        [
+            (
+                TrigramSearchBackend(),
+                [
+                    'CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+                    'CREATE INDEX ix_model_str_column_trgm ON model USING gin (str_column gin_trgm_ops);',
+                ],
+            ),
+            (
+                FullTextSearchBackend('russian'),
+                [
+                    'CREATE INDEX ix_model_str_column_fts ON model '
+                    "USING gin (to_tsvector('russian'::regconfig, str_column));",
+                ],
+            ),
+        ],
+    )
+    def test_create_search_indexes(self, search_backend: SearchBackendProtocol, expected: list[str]):
+        buffer = io.StringIO()
+        context = MigrationContext.configure(dialect_name='postgresql', opts={'as_sql': True, 'output_buffer': buffer})
+        with Operations.context(context):
+            create_search_indexes('model', ['str_column'], search_backend)
+            drop_search_indexes('model', ['str_column'], search_backend)
+        statements = [line.strip() for line in buffer.getvalue().split('\n\n') if line.strip()]
+        assert statements == [*expected, f'DROP INDEX ix_model_str_column_{search_backend.index_suffix};']
@@ -126,17 +126,21 @@ async def create_models(session: AsyncSession, models_to_create: list[CrudParent
 
 @asynccontextmanager
 async def make_db_crud_repository(
-    settings: SettingsSchema, models_to_create: list[CrudParentModelReadSchema]
+    settings: SettingsSchema, models_to_create: list[CrudParentModelReadSchema], pipeline: bool = False
 ) -> AsyncIterator[ModelDbRepository]:
     """
     Создаем репозиторий для выполнения операций над моделями в базе данных.
+
+    В режиме конвейера модели сохраняются, чтобы методы репозитория выполнялись в своих транзакциях.
     """
     async_engine = make_async_engine(settings.db.dsn)
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     try:
-        async with make_async_session_factory(settings.db.dsn)() as session:
+        async with make_async_session_factory(settings.db.dsn, pipeline=pipeline)() as session:
             await create_models(session, models_to_create)
+            if pipeline:
+                await session.commit()
             yield ModelDbRepository(SessionManagerImpl(session))
     finally:
         async with async_engine.begin() as conn:
@@ -158,10 +162,24 @@ async def crud_repository(
         case 'db':
             async with make_db_crud_repository(settings, models_to_create) as repository:
                 yield repository
+        case 'db_pipeline':
+            async with make_db_crud_repository(settings, models_to_create, pipeline=True) as repository:
+                yield repository
         case _:
             raise NotImplementedError()
 
 
+@pytest.fixture
+async def db_crud_repository(
+    settings: SettingsSchema, request: pytest.FixtureRequest
+) -> AsyncIterator[ModelDbRepository]:
+    """
+    Получаем репозиторий для выполнения CRUD операций над моделями в базе данных.
+    """
+    async with make_db_crud_repository(settings, request.param) as repository:
+        yield repository
+
+
 @pytest.fixture
 async def settings_repository(request: pytest.FixtureRequest) -> AsyncIterator[SettingsRepositoryProtocol]:
     """
@@ -19,7 +19,7 @@ class CrudParentModel(BaseUUID):
 
     __tablename__ = 'crud_parent_model'
 
-    str_column: Mapped[str] = mapped_column(String(length=100), nullable=False)
+    str_column: Mapped[str] = mapped_column(String(length=100), nullable=False, unique=True)
     int_column: Mapped[int] = mapped_column(Integer, nullable=False)
     type: Mapped[CrudModelTypeEnum] = mapped_column(ChoiceType(CrudModelTypeEnum, impl=String()))
 
@@ -38,6 +38,7 @@ class CrudChildAModel(CrudParentModel):
 
     id: Mapped[uuid.UUID] = mapped_column(ForeignKey('crud_parent_model.id'), primary_key=True)
     float_column: Mapped[float] = mapped_column(Float, nullable=False)
+    default_column: Mapped[int] = mapped_column(Integer, nullable=False, default=42)
 
     __mapper_args__ = {
         'polymorphic_identity': CrudModelTypeEnum.CHILD_A,
@@ -57,3 +58,22 @@ class CrudChildBModel(CrudParentModel):
     __mapper_args__ = {
         'polymorphic_identity': CrudModelTypeEnum.CHILD_B,
     }
+
+
+class CrudWideModel(BaseUUID):
+    """
+    Тестовая модель с большим количеством столбцов для тестирования вставки больших пачек.
+    """
+
+    __tablename__ = 'crud_wide_model'
+
+    str_column: Mapped[str] = mapped_column(String(length=100), nullable=False)
+    int_column_0: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    int_column_1: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    int_column_2: Mapped[int] = mapped_column(Integer, nullable=False, default=2)
+    int_column_3: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    int_column_4: Mapped[int] = mapped_column(Integer, nullable=False, default=lambda: 4)
+    int_column_5: Mapped[int] = mapped_column(Integer, nullable=False, default=lambda: 5)
+    int_column_6: Mapped[int] = mapped_column(Integer, nullable=False, default=lambda: 6)
+    int_column_7: Mapped[int] = mapped_column(Integer, nullable=False, default=lambda: 7)
+    nullable_column: Mapped[int | None] = mapped_column(Integer, nullable=True)
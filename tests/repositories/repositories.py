@@ -10,7 +10,7 @@ from fast_clean.repositories.crud import (
     InMemoryCrudRepository,
 )
 
-from .models import CrudChildAModel, CrudChildBModel, CrudParentModel
+from .models import CrudChildAModel, CrudChildBModel, CrudParentModel, CrudWideModel
 from .schemas import (
     CrudChildAModelCreateSchema,
     CrudChildAModelReadSchema,
@@ -21,6 +21,9 @@ from .schemas import (
     CrudParentModelCreateSchema,
     CrudParentModelReadSchema,
     CrudParentModelUpdateSchema,
+    CrudWideModelCreateSchema,
+    CrudWideModelReadSchema,
+    CrudWideModelUpdateSchema,
 )
 
 
@@ -61,3 +64,29 @@ class ModelDbRepository(
         (CrudChildAModel, CrudChildAModelReadSchema, CrudChildAModelCreateSchema, CrudChildAModelUpdateSchema),
         (CrudChildBModel, CrudChildBModelReadSchema, CrudChildBModelCreateSchema, CrudChildBModelUpdateSchema),
     )
+
+
+class ChildAModelDbRepository(
+    DbCrudRepository[
+        CrudChildAModel, CrudChildAModelReadSchema, CrudChildAModelCreateSchema, CrudChildAModelUpdateSchema
+    ]
+):
+    """
+    Репозиторий для выполнения операций над моделями наследника A в базе данных.
+    """
+
+
+class WideModelDbRepository(
+    DbCrudRepository[CrudWideModel, CrudWideModelReadSchema, CrudWideModelCreateSchema, CrudWideModelUpdateSchema]
+):
+    """
+    Репозиторий для выполнения операций над моделями с большим количеством столбцов в базе данных.
+    """
+
+
+class WideModelInMemoryRepository(
+    InMemoryCrudRepository[CrudWideModelReadSchema, CrudWideModelCreateSchema, CrudWideModelUpdateSchema]
+):
+    """
+    Репозиторий для выполнения операций над моделями с большим количеством столбцов в памяти.
+    """
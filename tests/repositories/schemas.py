@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import uuid
 from typing import Literal
 
 from fast_clean.schemas import CreateSchema, ReadSchema, UpdateSchema
@@ -95,6 +96,51 @@ class CrudChildBModelUpdateSchema(CrudParentModelUpdateSchema):
     bool_column: bool
 
 
+class CrudParentModelShortReadSchema(BaseModel):
+    """
+    Схема для чтения части полей родительской тестовой модели.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: uuid.UUID
+    str_column: str
+
+
+class CrudWideModelCreateSchema(CreateSchema):
+    """
+    Схема для создания тестовой модели с большим количеством столбцов.
+    """
+
+    str_column: str
+
+
+class CrudWideModelReadSchema(ReadSchema):
+    """
+    Схема для чтения тестовой модели с большим количеством столбцов.
+    """
+
+    str_column: str
+    int_column_0: int
+    int_column_1: int
+    int_column_2: int
+    int_column_3: int
+    int_column_4: int
+    int_column_5: int
+    int_column_6: int
+    int_column_7: int
+    nullable_column: int | None = None
+
+
+class CrudWideModelUpdateSchema(UpdateSchema):
+    """
+    Схема для обновления тестовой модели с большим количеством столбцов.
+    """
+
+    str_column: str | None = None
+    nullable_column: int | None = None
+
+
 class FileSchema(BaseModel):
     """
     Схема данных файла.
@@ -43,6 +43,15 @@ class TestCacheRepositories:
             assert await cache_repository.get(key) == expected_value
         assert await cache_repository.get('unknown_key') is None
 
+    @classmethod
+    async def test_get_many(cls, cache_repository: CacheRepositoryProtocol) -> None:
+        """
+        Тестируем метод `get_many`.
+        """
+        keys = [*CACHE_DATA.keys(), 'unknown_key']
+        assert await cache_repository.get_many(keys) == [*CACHE_DATA.values(), None]
+        assert await cache_repository.get_many([]) == []
+
     @classmethod
     async def test_set(cls, cache_repository: CacheRepositoryProtocol) -> None:
         """
@@ -98,6 +107,7 @@ class TestCacheRepositories:
         assert await cache_repository.get(STR_KEY) == STR_VALUE
         assert 1 == await cache_repository.clear(key=STR_KEY)
         assert await cache_repository.get(STR_KEY) is None
+        assert 0 == await cache_repository.clear(key=STR_KEY)
         for key, expected_value in NAMESPACE_CACHE_DATA.items():
             assert await cache_repository.get(key) == expected_value
         assert 2 == await cache_repository.clear(namespace=NAMESPACE)
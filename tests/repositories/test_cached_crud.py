@@ -0,0 +1,152 @@
+"""
+Модуль, содержащий тесты репозитория CRUD операций над моделями с кешированием чтения.
+"""
+
+import uuid
+from typing import cast
+
+import pytest
+from fast_clean.db import SessionManagerImpl
+from fast_clean.repositories import CachedCrudRepository, CacheRepositoryProtocol, InMemoryCacheRepository
+from fast_clean.repositories.crud import CachedCrudRepositoryFactory
+from pytest_mock import MockerFixture
+
+from .repositories import ModelDbRepository, ModelRepositoryProtocol
+from .schemas import (
+    CrudChildAModelReadSchema,
+    CrudChildBModelReadSchema,
+    CrudParentModelCreateSchema,
+    CrudParentModelReadSchema,
+    CrudParentModelUpdateSchema,
+)
+from .test_crud import CHILD_A_MODELS, MODELS, PARENT_MODELS
+
+READ_SCHEMA_TYPES: list[type[CrudParentModelReadSchema]] = [
+    CrudParentModelReadSchema,
+    CrudChildAModelReadSchema,
+    CrudChildBModelReadSchema,
+]
+TTL = 30
+
+
+async def make_cached_crud_repository(
+    crud_repository: ModelRepositoryProtocol,
+) -> CachedCrudRepository[
+    CrudParentModelReadSchema, CrudParentModelCreateSchema, CrudParentModelUpdateSchema, uuid.UUID
+]:
+    """
+    Создаем репозиторий с кешированием чтения.
+
+    Хранилище кеша в памяти общее для всех экземпляров, поэтому используется уникальное пространство имен.
+    Модели в базе данных сохраняются, т.к. внутри транзакции кеш не используется.
+    """
+    if isinstance(crud_repository, ModelDbRepository):
+        await cast(SessionManagerImpl, crud_repository.session_manager).session.commit()
+    cache_repository = cast(CacheRepositoryProtocol, InMemoryCacheRepository())
+    return CachedCrudRepositoryFactory(cache_repository).make(
+        crud_repository, READ_SCHEMA_TYPES, ttl=TTL, namespace=f'crud:{uuid.uuid4()}'
+    )
+
+
+@pytest.mark.parametrize('crud_repository', [('in_memory', MODELS), ('db', MODELS)], indirect=True)
+class TestCachedCrudRepository:
+    """
+    Тесты репозитория для выполнения CRUD операций над моделями с кешированием чтения.
+    """
+
+    @staticmethod
+    async def test_get(crud_repository: ModelRepositoryProtocol, mocker: MockerFixture) -> None:
+        """
+        Тестируем метод `get`.
+        """
+        cached_repository = await make_cached_crud_repository(crud_repository)
+        set_ = mocker.spy(cached_repository.cache_repository, 'set')
+        for expected_model in MODELS:
+            assert await cached_repository.get(expected_model.id) == expected_model
+        assert all(call.kwargs['expire'] == TTL for call in set_.call_args_list)
+        get = mocker.spy(crud_repository, 'get')
+        for expected_model in MODELS:
+            actual_model = await cached_repository.get(expected_model.id)
+            assert actual_model == expected_model
+            assert type(actual_model) is type(expected_model)
+        get.assert_not_called()
+        assert await cached_repository.get_or_none(uuid.uuid4()) is None
+
+    @staticmethod
+    async def test_get_by_ids(crud_repository: ModelRepositoryProtocol, mocker: MockerFixture) -> None:
+        """
+        Тестируем метод `get_by_ids`.
+        """
+        cached_repository = await make_cached_crud_repository(crud_repository)
+        await cached_repository.get(CHILD_A_MODELS[0].id)
+        get_by_ids = mocker.spy(crud_repository, 'get_by_ids')
+        expected_models = [CHILD_A_MODELS[0], *PARENT_MODELS[:3]]
+        model_ids = [model.id for model in expected_models]
+        assert await cached_repository.get_by_ids(model_ids) == expected_models
+        get_by_ids.assert_called_once_with(model_ids[1:], exact=False)
+        assert await cached_repository.get_by_ids(model_ids) == expected_models
+        get_by_ids.assert_called_once()
+
+    @staticmethod
+    async def test_update(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем удаление модели из кеша в методе `update`.
+        """
+        cached_repository = await make_cached_crud_repository(crud_repository)
+        model = PARENT_MODELS[0]
+        await cached_repository.get(model.id)
+        await cached_repository.update(CrudParentModelUpdateSchema(id=model.id, int_column=42))
+        assert await cached_repository.get(model.id) == model.model_copy(update={'int_column': 42})
+
+    @staticmethod
+    async def test_delete(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем удаление модели из кеша в методе `delete`.
+        """
+        cached_repository = await make_cached_crud_repository(crud_repository)
+        model = PARENT_MODELS[0]
+        await cached_repository.get(model.id)
+        await cached_repository.delete([model.id])
+        assert await cached_repository.get_or_none(model.id) is None
+
+    @staticmethod
+    async def test_write_uncached(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем изменение и удаление моделей, отсутствующих в кеше.
+        """
+        cached_repository = await make_cached_crud_repository(crud_repository)
+        model = PARENT_MODELS[0]
+        await cached_repository.update(CrudParentModelUpdateSchema(id=model.id, int_column=42))
+        await cached_repository.bulk_update([CrudParentModelUpdateSchema(id=model.id, int_column=43)])
+        upserted_model = await cached_repository.upsert(
+            CrudParentModelCreateSchema(str_column='upserted model', int_column=44, type=model.type)
+        )
+        await cached_repository.bulk_upsert(
+            [CrudParentModelCreateSchema(str_column='bulk upserted model', int_column=45, type=model.type)]
+        )
+        await cached_repository.delete([model.id, upserted_model.id])
+        assert await cached_repository.get_or_none(model.id) is None
+        assert await cached_repository.get_or_none(upserted_model.id) is None
+
+
+@pytest.mark.parametrize('crud_repository', [('db', MODELS)], indirect=True)
+async def test_transaction(crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем кеширование внутри транзакции.
+
+    Внутри транзакции модели не кешируются, а удаляются из кеша после ее завершения.
+    """
+    cached_repository = await make_cached_crud_repository(crud_repository)
+    model = PARENT_MODELS[0]
+    await cached_repository.get(model.id)
+    with pytest.raises(RuntimeError):
+        async with crud_repository.session_manager.get_session():
+            await cached_repository.update(CrudParentModelUpdateSchema(id=model.id, int_column=42))
+            assert await cached_repository.get(model.id) == model.model_copy(update={'int_column': 42})
+            raise RuntimeError()
+    assert await cached_repository.get(model.id) == model
+    async with crud_repository.session_manager.get_session():
+        await cached_repository.update(CrudParentModelUpdateSchema(id=model.id, int_column=43))
+        assert await cached_repository.cache_repository.get(cached_repository.make_key(model.id)) is not None
+    assert await cached_repository.cache_repository.get(cached_repository.make_key(model.id)) is None
+    assert await cached_repository.get(model.id) == model.model_copy(update={'int_column': 43})
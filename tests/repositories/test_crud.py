@@ -2,15 +2,54 @@
 Модуль, содержащий тесты репозиториев CRUD операций над моделями.
 """
 
+import json
+import logging
 import uuid
 from collections.abc import Hashable, Iterable
-from typing import cast
+from typing import Any, cast
 
+import psycopg
 import pytest
-from fast_clean.exceptions import ModelIntegrityError, ModelNotFoundError
-from fast_clean.schemas import PaginationSchema
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from fast_clean.contrib.monitoring.queries import (
+    QUERY_DURATION,
+    QUERY_ROWS,
+    register_query_metrics,
+    unregister_query_metrics,
+)
+from fast_clean.contrib.sqlalchemy_utils import create_search_indexes
+from fast_clean.db import Explain, SessionManagerImpl
+from fast_clean.enums import AggregateFunctionEnum, CountStrategyEnum, PolymorphicLoadingEnum
+from fast_clean.exceptions import (
+    AggregateFieldNotFoundError,
+    InvalidCursorError,
+    ModelIntegrityError,
+    ModelNotFoundError,
+    ProjectionFieldNotFoundError,
+)
+from fast_clean.repositories import FullTextSearchBackend, SearchBackendProtocol, TrigramSearchBackend
+from fast_clean.repositories.crud.instrumentation import get_query_tag
+from fast_clean.repositories.crud.statements import StatementCache
+from fast_clean.schemas import (
+    AppliedPaginationResponseSchema,
+    CursorPaginationSchema,
+    PaginationRequestSchema,
+    PaginationSchema,
+)
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from .repositories import ModelRepositoryProtocol
+from .enums import CrudModelTypeEnum
+from .models import CrudChildAModel, CrudParentModel
+from .repositories import (
+    ChildAModelDbRepository,
+    ModelDbRepository,
+    ModelRepositoryProtocol,
+    WideModelDbRepository,
+    WideModelInMemoryRepository,
+)
 from .schemas import (
     CrudChildAModelCreateSchema,
     CrudChildAModelReadSchema,
@@ -20,7 +59,11 @@ from .schemas import (
     CrudChildBModelUpdateSchema,
     CrudParentModelCreateSchema,
     CrudParentModelReadSchema,
+    CrudParentModelShortReadSchema,
     CrudParentModelUpdateSchema,
+    CrudWideModelCreateSchema,
+    CrudWideModelReadSchema,
+    CrudWideModelUpdateSchema,
 )
 
 PARENT_MODELS = [
@@ -97,7 +140,7 @@ MODELS_TO_UPDATE: list[tuple[CrudParentModelReadSchema, CrudParentModelReadSchem
 
 @pytest.mark.parametrize(
     'crud_repository',
-    [('in_memory', MODELS), ('db', MODELS)],
+    [('in_memory', MODELS), ('db', MODELS), ('db_pipeline', MODELS)],
     indirect=True,
 )
 class TestCrudRepositories:
@@ -137,6 +180,32 @@ class TestCrudRepositories:
         assert isinstance(exc_info.value.model_id, Iterable)
         assert set(exc_info.value.model_id) == set(non_existent_ids)
 
+    @staticmethod
+    async def test_get_projection(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем методы получения моделей с проекцией.
+        """
+        for expected_model in MODELS:
+            assert await crud_repository.get(
+                expected_model.id, projection=CrudParentModelShortReadSchema
+            ) == CrudParentModelShortReadSchema(id=expected_model.id, str_column=expected_model.str_column)
+        models = [*PARENT_MODELS[:2], *CHILD_A_MODELS[:2]]
+        actual_dicts = await crud_repository.get_by_ids(
+            [model.id for model in models], projection={'int_column', 'float_column'}
+        )
+        expected_dicts = [
+            {'int_column': model.int_column, 'float_column': getattr(model, 'float_column', None)} for model in models
+        ]
+        assert {frozenset(d.items()) for d in actual_dicts} == {frozenset(d.items()) for d in expected_dicts}
+        batches = [
+            batch async for batch in crud_repository.stream_all(batch_size=7, projection=CrudParentModelShortReadSchema)
+        ]
+        assert {model for batch in batches for model in batch} == {
+            CrudParentModelShortReadSchema(id=model.id, str_column=model.str_column) for model in MODELS
+        }
+        with pytest.raises(ProjectionFieldNotFoundError):
+            await crud_repository.get(MODELS[0].id, projection={'unknown_column'})
+
     @staticmethod
     async def test_get_all(crud_repository: ModelRepositoryProtocol) -> None:
         """
@@ -144,6 +213,15 @@ class TestCrudRepositories:
         """
         assert set(await crud_repository.get_all()) == set(MODELS)
 
+    @staticmethod
+    async def test_stream_all(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `stream_all`.
+        """
+        batches = [batch async for batch in crud_repository.stream_all(batch_size=7)]
+        assert [len(batch) for batch in batches] == [7, 7, 7, 7, 3]
+        assert {model for batch in batches for model in batch} == set(MODELS)
+
     @staticmethod
     async def test_paginate_sorting(crud_repository: ModelRepositoryProtocol) -> None:
         """
@@ -172,6 +250,57 @@ class TestCrudRepositories:
         assert pagination_result.count == len(expected_models)
         assert set(pagination_result.objects) == expected_models
 
+    @staticmethod
+    async def test_paginate_count_strategy(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем способы подсчета количества в методе `paginate`.
+        """
+        for offset, expected_objects_count, expected_has_next in ((0, 7, True), (24, 7, False), (40, 0, False)):
+            pagination = PaginationSchema(limit=7, offset=offset)
+            exact_result = await crud_repository.paginate(pagination, count_strategy=CountStrategyEnum.EXACT)
+            assert exact_result.count == len(MODELS)
+            assert exact_result.count_strategy == CountStrategyEnum.EXACT
+            assert len(exact_result.objects) == expected_objects_count
+            assert exact_result.has_next == expected_has_next
+            estimated_result = await crud_repository.paginate(pagination, count_strategy=CountStrategyEnum.ESTIMATED)
+            assert estimated_result.count == len(MODELS)
+            assert estimated_result.count_strategy == CountStrategyEnum.EXACT
+            assert estimated_result.has_next == expected_has_next
+            none_result = await crud_repository.paginate(pagination, count_strategy=CountStrategyEnum.NONE)
+            assert none_result.count is None
+            assert none_result.count_strategy == CountStrategyEnum.NONE
+            assert len(none_result.objects) == expected_objects_count
+            assert none_result.has_next == expected_has_next
+            response = AppliedPaginationResponseSchema.from_result(
+                PaginationRequestSchema(page=offset // 7 + 1, page_size=7), none_result
+            )
+            assert response.count is None
+            assert response.has_next == expected_has_next
+
+    @staticmethod
+    async def test_paginate_by_cursor(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `paginate_by_cursor`.
+        """
+        expected_models_mapping: dict[tuple[str, ...], list[CrudParentModelReadSchema]] = {
+            ('-int_column',): sorted(MODELS, key=lambda model: (model.int_column, model.id), reverse=True),
+            ('-int_column', 'str_column'): sorted(MODELS, key=lambda model: (-model.int_column, model.str_column)),
+        }
+        for sorting, expected_models in expected_models_mapping.items():
+            actual_models: list[CrudParentModelReadSchema] = []
+            cursor: str | None = None
+            while True:
+                pagination_result = await crud_repository.paginate_by_cursor(
+                    CursorPaginationSchema(limit=7, cursor=cursor), sorting=sorting
+                )
+                actual_models.extend(pagination_result.objects)
+                cursor = pagination_result.next_cursor
+                if cursor is None:
+                    break
+            assert actual_models == expected_models
+        with pytest.raises(InvalidCursorError):
+            await crud_repository.paginate_by_cursor(CursorPaginationSchema(limit=7, cursor='invalid'))
+
     @classmethod
     async def test_create(cls, crud_repository: ModelRepositoryProtocol) -> None:
         """
@@ -204,6 +333,17 @@ class TestCrudRepositories:
         with pytest.raises(ModelIntegrityError):
             await crud_repository.bulk_create(create_schemas)
 
+    @classmethod
+    async def test_bulk_create_interleaved(cls, crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем сохранение исходного порядка в методе `bulk_create` при чередовании типов моделей.
+        """
+        models_to_create = [MODELS_TO_CREATE[i + j] for i in range(3) for j in (0, 3, 6)]
+        actual_models = await crud_repository.bulk_create(
+            [CREATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump()) for model in models_to_create]
+        )
+        assert actual_models == models_to_create
+
     @classmethod
     async def test_update(cls, crud_repository: ModelRepositoryProtocol) -> None:
         """
@@ -242,6 +382,25 @@ class TestCrudRepositories:
         assert actual_models == set(expected_updated_models)
         assert actual_models != set(original_models)
 
+    @classmethod
+    async def test_bulk_update_returning(cls, crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `bulk_update_returning`.
+        """
+        expected_updated_models = [models[1] for models in MODELS_TO_UPDATE][::-1]
+        actual_models = await crud_repository.bulk_update_returning(
+            [
+                UPDATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump())
+                for model in expected_updated_models
+            ]
+        )
+        assert actual_models == expected_updated_models
+        partial_model = CHILD_B_MODELS[-1]
+        actual_models = await crud_repository.bulk_update_returning(
+            [CrudChildBModelUpdateSchema(id=partial_model.id, bool_column=not partial_model.bool_column)]
+        )
+        assert actual_models == [partial_model.model_copy(update={'bool_column': not partial_model.bool_column})]
+
     @classmethod
     async def test_upsert_create(cls, crud_repository: ModelRepositoryProtocol) -> None:
         """
@@ -272,6 +431,90 @@ class TestCrudRepositories:
             assert actual_model != original_model
             assert actual_model == actual_updated_model
 
+    @classmethod
+    async def test_bulk_upsert(cls, crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `bulk_upsert`.
+        """
+        expected_models = [
+            model
+            for models in zip(MODELS_TO_CREATE, (models[1] for models in MODELS_TO_UPDATE), strict=False)
+            for model in models
+        ]
+        actual_models = await crud_repository.bulk_upsert(
+            [CREATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump()) for model in expected_models]
+        )
+        assert actual_models == expected_models
+        assert set(await crud_repository.get_by_ids([model.id for model in expected_models])) == set(expected_models)
+
+    @classmethod
+    async def test_bulk_upsert_index_elements(cls, crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `bulk_upsert` с конфликтом по уникальному полю.
+        """
+        expected_models = [
+            expected_model.model_copy(update={'str_column': original_model.str_column})
+            for original_model, expected_model in MODELS_TO_UPDATE
+        ]
+        actual_models = await crud_repository.bulk_upsert(
+            [
+                CREATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump(exclude={'id'}))
+                for model in expected_models
+            ],
+            index_elements=['str_column'],
+        )
+        assert actual_models == expected_models
+
+    @classmethod
+    async def test_bulk_upsert_duplicates(cls, crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `bulk_upsert` с повторяющимися ключами конфликта.
+        """
+        expected_models = [
+            *(updated_model for _, updated_model in MODELS_TO_UPDATE),
+            *(original_model for original_model, _ in MODELS_TO_UPDATE),
+        ]
+        actual_models = await crud_repository.bulk_upsert(
+            [CREATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump()) for model in expected_models]
+        )
+        assert actual_models == expected_models
+        assert set(await crud_repository.get_by_ids([model.id for model, _ in MODELS_TO_UPDATE])) == {
+            model for model, _ in MODELS_TO_UPDATE
+        }
+
+    @staticmethod
+    async def test_count(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем методы `count` и `exists`.
+        """
+        assert await crud_repository.count() == len(MODELS)
+        assert await crud_repository.count(search='parent', search_by=['str_column']) == len(PARENT_MODELS)
+        assert await crud_repository.exists(search='child a', search_by=['str_column'])
+        assert not await crud_repository.exists(search='not found', search_by=['str_column'])
+
+    @staticmethod
+    async def test_aggregate(crud_repository: ModelRepositoryProtocol) -> None:
+        """
+        Тестируем метод `aggregate`.
+        """
+        aggregates = {
+            'count': (AggregateFunctionEnum.COUNT, 'id'),
+            'total': (AggregateFunctionEnum.SUM, 'int_column'),
+            'min': (AggregateFunctionEnum.MIN, 'int_column'),
+            'max': (AggregateFunctionEnum.MAX, 'int_column'),
+        }
+        assert await crud_repository.aggregate(aggregates, group_by=['type']) == [
+            {'type': CrudModelTypeEnum.CHILD_A, 'count': 10, 'total': 45, 'min': 0, 'max': 9},
+            {'type': CrudModelTypeEnum.CHILD_B, 'count': 10, 'total': 45, 'min': 0, 'max': 9},
+            {'type': CrudModelTypeEnum.PARENT, 'count': 11, 'total': 54, 'min': 0, 'max': 9},
+        ]
+        assert await crud_repository.aggregate(aggregates) == [{'count': 31, 'total': 144, 'min': 0, 'max': 9}]
+        assert await crud_repository.aggregate(aggregates, search='not found', search_by=['str_column']) == [
+            {'count': 0, 'total': None, 'min': None, 'max': None}
+        ]
+        with pytest.raises(AggregateFieldNotFoundError):
+            await crud_repository.aggregate({'total': (AggregateFunctionEnum.SUM, 'float_column')})
+
     @classmethod
     async def test_delete(cls, crud_repository: ModelRepositoryProtocol) -> None:
         """
@@ -287,3 +530,523 @@ class TestCrudRepositories:
                 assert actual_model is None
             else:
                 assert actual_model == expected_model
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_paginate_estimated_count(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем оценку количества в методе `paginate_with_filter` репозитория базы данных.
+    """
+    async with db_crud_repository.session_manager.get_session() as s:
+        await s.execute(sa.text('ANALYZE crud_parent_model'))
+    mocker.patch.object(db_crud_repository, 'estimated_count_threshold', 0)
+    pagination_result = await db_crud_repository.paginate(
+        PaginationSchema(limit=7, offset=0), count_strategy=CountStrategyEnum.ESTIMATED
+    )
+    assert pagination_result.count == len(MODELS)
+    assert pagination_result.count_strategy == CountStrategyEnum.ESTIMATED
+    pagination_result = await db_crud_repository.paginate_with_filter(
+        PaginationSchema(limit=7, offset=0),
+        select_filter=lambda statement: statement.where(CrudParentModel.int_column > 4),
+        count_strategy=CountStrategyEnum.ESTIMATED,
+    )
+    assert pagination_result.count_strategy == CountStrategyEnum.ESTIMATED
+    assert cast(int, pagination_result.count) >= len(pagination_result.objects)
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+@pytest.mark.parametrize('copy_threshold, max_bind_params', [(1, 65_535), (10_000, 10)])
+async def test_db_bulk_create_large_batch(
+    db_crud_repository: ModelDbRepository, mocker: MockerFixture, copy_threshold: int, max_bind_params: int
+) -> None:
+    """
+    Тестируем вставку больших пачек с помощью `COPY` и разбиения на запросы в методе `bulk_create`.
+    """
+    mocker.patch.object(ModelDbRepository, 'copy_threshold', copy_threshold)
+    mocker.patch.object(ModelDbRepository, 'max_bind_params', max_bind_params)
+    create_schemas = [
+        CREATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump(exclude={'id'}))
+        for model in MODELS_TO_CREATE
+    ]
+    actual_models = await db_crud_repository.bulk_create(create_schemas)
+    assert [model.model_dump(exclude={'id'}) for model in actual_models] == [
+        model.model_dump(exclude={'id'}) for model in MODELS_TO_CREATE
+    ]
+    assert await db_crud_repository.get_by_ids([model.id for model in actual_models]) == actual_models
+
+
+@pytest.mark.parametrize('db_crud_repository', [[]], indirect=True)
+@pytest.mark.parametrize('copy_threshold', [1, 10_000])
+async def test_db_bulk_create_python_defaults(
+    db_crud_repository: ModelDbRepository, mocker: MockerFixture, copy_threshold: int
+) -> None:
+    """
+    Тестируем вставку пачки моделей со значениями по умолчанию на стороне Python в методе `bulk_create`.
+
+    Параметры значений по умолчанию учитываются при разбиении на запросы и заполняются перед `COPY`.
+    """
+    mocker.patch.object(WideModelDbRepository, 'copy_threshold', copy_threshold)
+    repository = WideModelDbRepository(db_crud_repository.session_manager)
+    actual_models = await repository.bulk_create(
+        [CrudWideModelCreateSchema(str_column=f'wide model{i}') for i in range(9000)]
+    )
+    assert [model.str_column for model in actual_models] == [f'wide model{i}' for i in range(9000)]
+    assert {(model.int_column_0, model.int_column_7) for model in actual_models} == {(0, 7)}
+    assert len({model.id for model in actual_models}) == 9000
+
+
+@pytest.mark.parametrize('db_crud_repository', [[]], indirect=True)
+async def test_db_bulk_create_child_large_batch(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем разбиение на запросы пачки наследников в методе `bulk_create`.
+
+    Количество параметров на модель учитывает порядковый номер и поля всех уровней наследования.
+    """
+    mocker.patch.object(ModelDbRepository, 'copy_threshold', 100_000)
+    execute = mocker.spy(cast(SessionManagerImpl, db_crud_repository.session_manager).session, 'execute')
+    actual_models = await db_crud_repository.bulk_create(
+        [
+            CrudChildAModelCreateSchema(str_column=f'child a model{i}', int_column=i, float_column=i)
+            for i in range(12_000)
+        ]
+    )
+    assert [model.str_column for model in actual_models] == [f'child a model{i}' for i in range(12_000)]
+    assert all(isinstance(model, CrudChildAModelReadSchema) for model in actual_models)
+    assert sum('INSERT' in str(call.args[0]) for call in execute.call_args_list) == 2
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_bulk_create_interleaved_round_trips(
+    db_crud_repository: ModelDbRepository, mocker: MockerFixture
+) -> None:
+    """
+    Тестируем количество запросов в методе `bulk_create` при чередовании типов моделей.
+    """
+    models_to_create = [MODELS_TO_CREATE[i + j] for i in range(3) for j in (0, 3, 6)]
+    execute = mocker.spy(cast(SessionManagerImpl, db_crud_repository.session_manager).session, 'execute')
+    await db_crud_repository.bulk_create(
+        [CREATE_SCHEMAS_MAPPING[type(model)].model_validate(model.model_dump()) for model in models_to_create]
+    )
+    assert execute.call_count == 3
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_write_with_model_type_round_trips(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем запись всех уровней наследования одним запросом к базе данных.
+    """
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    child_a_model, child_b_model = MODELS_TO_CREATE[3], MODELS_TO_CREATE[6]
+    updated_model = child_a_model.model_copy(update={'int_column': 100, 'float_column': 100.5})
+    sa.event.listen(session.bind.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        assert (
+            await db_crud_repository.create(CrudChildAModelCreateSchema.model_validate(child_a_model.model_dump()))
+            == child_a_model
+        )
+        assert (
+            await db_crud_repository.update(CrudChildAModelUpdateSchema.model_validate(updated_model.model_dump()))
+            == updated_model
+        )
+        assert (
+            await db_crud_repository.upsert(CrudChildBModelCreateSchema.model_validate(child_b_model.model_dump()))
+            == child_b_model
+        )
+    finally:
+        sa.event.remove(session.bind.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    assert len([statement for statement in statements if 'crud_' in statement]) == 3
+
+
+@pytest.mark.parametrize('crud_repository', [('db_pipeline', MODELS)], indirect=True)
+async def test_db_pipeline_round_trips(crud_repository: ModelRepositoryProtocol, mocker: MockerFixture) -> None:
+    """
+    Тестируем количество выходов из режима конвейера при удалении и обновлении моделей.
+    """
+    pipeline_exit = mocker.spy(psycopg.AsyncPipeline, '__aexit__')
+    await crud_repository.delete([CHILD_A_MODELS[0].id, CHILD_B_MODELS[0].id])
+    assert pipeline_exit.call_count == 2
+    assert await crud_repository.get_by_ids([CHILD_A_MODELS[0].id, CHILD_B_MODELS[0].id]) == []
+    pipeline_exit.reset_mock()
+    await crud_repository.bulk_update(
+        [CrudChildAModelUpdateSchema(id=model.id, int_column=100, float_column=0.5) for model in CHILD_A_MODELS[1:]]
+    )
+    assert pipeline_exit.call_count == 1
+    assert {model.int_column for model in await crud_repository.get_by_ids([CHILD_A_MODELS[1].id])} == {100}
+    with pytest.raises(ModelIntegrityError):
+        await crud_repository.bulk_update(
+            [
+                CrudChildAModelUpdateSchema(
+                    id=CHILD_A_MODELS[1].id, str_column=PARENT_MODELS[0].str_column, float_column=1.5
+                )
+            ]
+        )
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_bulk_update_round_trips(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем количество запросов в методе `bulk_update`.
+    """
+    execute = mocker.spy(cast(SessionManagerImpl, db_crud_repository.session_manager).session, 'execute')
+    await db_crud_repository.bulk_update(
+        [UPDATE_SCHEMAS_MAPPING[type(models[1])].model_validate(models[1].model_dump()) for models in MODELS_TO_UPDATE]
+    )
+    updates = [call for call in execute.call_args_list if isinstance(call.args[0], sa.Update)]
+    assert len(updates) == 5
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_upsert_child_default(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем заполнение значений по умолчанию наследника в методе `upsert`.
+    """
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+    model_to_create = next(model for model in MODELS_TO_CREATE if isinstance(model, CrudChildAModelReadSchema))
+    await db_crud_repository.upsert(CrudChildAModelCreateSchema.model_validate(model_to_create.model_dump()))
+    default_statement = sa.select(CrudChildAModel.default_column).where(CrudChildAModel.id == model_to_create.id)
+    assert await session.scalar(default_statement) == 42
+    await session.execute(
+        sa.update(CrudChildAModel).where(CrudChildAModel.id == model_to_create.id).values(default_column=1)
+    )
+    await db_crud_repository.upsert(CrudChildAModelCreateSchema.model_validate(model_to_create.model_dump()))
+    assert await session.scalar(default_statement) == 1
+
+
+@pytest.mark.parametrize('db_crud_repository', [[]], indirect=True)
+async def test_db_bulk_update_null(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем обновление поля значением `None` во всех моделях пачки в методе `bulk_update`.
+    """
+    repository = WideModelDbRepository(db_crud_repository.session_manager)
+    models = await repository.bulk_create([CrudWideModelCreateSchema(str_column=f'wide model{i}') for i in range(3)])
+    ids = [model.id for model in models]
+    await repository.bulk_update([CrudWideModelUpdateSchema(id=id, nullable_column=1) for id in ids])
+    assert {model.nullable_column for model in await repository.get_by_ids(ids)} == {1}
+    await repository.bulk_update([CrudWideModelUpdateSchema(id=id, nullable_column=None) for id in ids])
+    assert {model.nullable_column for model in await repository.get_by_ids(ids)} == {None}
+
+
+@pytest.mark.parametrize('db_crud_repository', [[]], indirect=True)
+async def test_paginate_by_cursor_null(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем пагинацию по курсору с сортировкой по полю, содержащему `None`.
+    """
+    db_repository = WideModelDbRepository(db_crud_repository.session_manager)
+    models = await db_repository.bulk_create([CrudWideModelCreateSchema(str_column=f'wide model{i}') for i in range(9)])
+    await db_repository.bulk_update(
+        [CrudWideModelUpdateSchema(id=model.id, nullable_column=[None, 1, 2][i % 3]) for i, model in enumerate(models)]
+    )
+    models = await db_repository.get_by_ids([model.id for model in models])
+    in_memory_repository = WideModelInMemoryRepository()
+    in_memory_repository.models = {model.id: model for model in models}
+    by_nullable = sorted(
+        models, key=lambda model: (model.nullable_column is None, model.nullable_column or 0, model.id)
+    )
+    by_str = sorted(models, key=lambda model: model.str_column)
+    expected_models_mapping: dict[tuple[str, ...], list[CrudWideModelReadSchema]] = {
+        ('nullable_column',): by_nullable,
+        ('-nullable_column',): by_nullable[::-1],
+        ('-nullable_column', 'str_column'): sorted(
+            by_str, key=lambda model: (model.nullable_column is None, model.nullable_column or 0), reverse=True
+        ),
+    }
+    for repository in (db_repository, in_memory_repository):
+        for sorting, expected_models in expected_models_mapping.items():
+            actual_models: list[CrudWideModelReadSchema] = []
+            cursor: str | None = None
+            while True:
+                pagination_result = await repository.paginate_by_cursor(
+                    CursorPaginationSchema(limit=2, cursor=cursor), sorting=sorting
+                )
+                actual_models.extend(pagination_result.objects)
+                cursor = pagination_result.next_cursor
+                if cursor is None:
+                    break
+            assert actual_models == expected_models
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_paginate_projection(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем проекцию в методе `paginate_with_filter` репозитория базы данных.
+    """
+    execute = mocker.spy(cast(SessionManagerImpl, db_crud_repository.session_manager).session, 'execute')
+    pagination_result = await db_crud_repository.paginate_with_filter(
+        PaginationSchema(limit=5, offset=0),
+        sorting=['str_column'],
+        select_filter=lambda statement: statement.where(CrudParentModel.int_column < 3),
+        projection=CrudParentModelShortReadSchema,
+    )
+    expected_models = sorted((model for model in MODELS if model.int_column < 3), key=lambda model: model.str_column)
+    assert pagination_result.count == len(expected_models)
+    assert pagination_result.objects == [
+        CrudParentModelShortReadSchema(id=model.id, str_column=model.str_column) for model in expected_models[:5]
+    ]
+    assert execute.call_count == 1
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+@pytest.mark.parametrize(
+    'polymorphic_loading, limit, expected_round_trips',
+    [
+        (PolymorphicLoadingEnum.SELECTIN, 50, 3),
+        (PolymorphicLoadingEnum.JOINED, 50, 1),
+        (PolymorphicLoadingEnum.AUTO, 50, 1),
+        (PolymorphicLoadingEnum.AUTO, 200, 3),
+    ],
+)
+async def test_db_polymorphic_loading(
+    db_crud_repository: ModelDbRepository,
+    mocker: MockerFixture,
+    polymorphic_loading: PolymorphicLoadingEnum,
+    limit: int,
+    expected_round_trips: int,
+) -> None:
+    """
+    Тестируем количество запросов при разных способах загрузки полей наследников.
+    """
+    mocker.patch.object(ModelDbRepository, 'polymorphic_joined_threshold', 100)
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: object) -> None:
+        statements.append(cast(str, args[2]))
+
+    engine = cast(AsyncEngine, session.bind).sync_engine
+    sa.event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        pagination_result = await db_crud_repository.paginate(
+            PaginationSchema(limit=limit, offset=0), sorting=['str_column'], polymorphic_loading=polymorphic_loading
+        )
+        assert len(statements) == expected_round_trips
+        assert pagination_result.objects == sorted(MODELS, key=lambda model: model.str_column)
+        session.expunge_all()
+        statements.clear()
+        assert (
+            await db_crud_repository.get(CHILD_A_MODELS[0].id, polymorphic_loading=polymorphic_loading)
+            == (CHILD_A_MODELS[0])
+        )
+        assert len(statements) == (2 if polymorphic_loading == PolymorphicLoadingEnum.SELECTIN else 1)
+    finally:
+        sa.event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+@pytest.mark.parametrize(
+    'search_backend, search, expected_models',
+    [
+        (TrigramSearchBackend(), 'childe', [*CHILD_A_MODELS, *CHILD_B_MODELS]),
+        (FullTextSearchBackend(), '"child a" -model5', [model for model in CHILD_A_MODELS if model.int_column != 5]),
+    ],
+)
+async def test_db_search_backend(
+    db_crud_repository: ModelDbRepository,
+    mocker: MockerFixture,
+    search_backend: SearchBackendProtocol,
+    search: str,
+    expected_models: list[CrudParentModelReadSchema],
+) -> None:
+    """
+    Тестируем поиск с помощью индексов триграмм и полнотекстового поиска.
+    """
+    mocker.patch.object(ModelDbRepository, 'search_backend', search_backend)
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+
+    def create_indexes(connection: sa.Connection) -> None:
+        with Operations.context(MigrationContext.configure(connection)):
+            create_search_indexes(CrudParentModel.__tablename__, ['str_column'], search_backend)
+
+    await (await session.connection()).run_sync(create_indexes)
+    pagination_result = await db_crud_repository.paginate(
+        PaginationSchema(limit=100, offset=0), search=search, search_by=['str_column']
+    )
+    assert {model.id for model in pagination_result.objects} == {model.id for model in expected_models}
+    assert pagination_result.count == len(expected_models)
+    await session.execute(sa.text('SET LOCAL enable_seqscan = off'))
+    statement = db_crud_repository.filter_statement(db_crud_repository.select(), search, ['str_column'], None)
+    plan = (await session.execute(Explain(statement))).scalar_one()
+    assert f'ix_crud_parent_model_str_column_{search_backend.index_suffix}' in json.dumps(plan)
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_statement_cache(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем переиспользование шаблонов запросов.
+
+    Первый запрос страницы передает сортировку итератором, который не должен влиять на шаблон.
+    """
+    statement_cache = StatementCache()
+    mocker.patch.object(ModelDbRepository, 'statement_cache', statement_cache)
+    for model in MODELS[:2]:
+        assert await db_crud_repository.get(model.id) == model
+        assert set(await db_crud_repository.get_by_ids([model.id, MODELS[-1].id])) == {model, MODELS[-1]}
+    for offset in (0, 5):
+        pagination_result = await db_crud_repository.paginate(
+            PaginationSchema(limit=5, offset=offset), sorting=iter(['-str_column']) if offset == 0 else ['-str_column']
+        )
+        expected_models = sorted(MODELS, key=lambda model: model.str_column, reverse=True)
+        assert pagination_result.objects == expected_models[offset : offset + 5]
+        assert pagination_result.count == len(MODELS)
+    await db_crud_repository.paginate(PaginationSchema(limit=5, offset=0), search='child', search_by=['str_column'])
+    assert (statement_cache.hits, statement_cache.misses) == (4, 4)
+    assert statement_cache.hit_rate == 0.5
+    assert len(statement_cache.statements) == 4
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_aggregate_select_filter(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем агрегаты с фильтром запроса одним запросом к базе данных.
+    """
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    def select_filter(statement: sa.Select[tuple[CrudParentModel]]) -> sa.Select[tuple[CrudParentModel]]:
+        return statement.where(CrudParentModel.int_column >= 5)
+
+    sa.event.listen(session.bind.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        assert await db_crud_repository.count(select_filter=select_filter) == 16
+        assert await db_crud_repository.exists(select_filter=select_filter)
+        assert await db_crud_repository.aggregate(
+            {'total': (AggregateFunctionEnum.SUM, 'int_column')}, select_filter=select_filter
+        ) == [{'total': 114}]
+    finally:
+        sa.event.remove(session.bind.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    assert len([statement for statement in statements if 'crud_parent_model' in statement]) == 3
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_delete_where(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем удаление моделей по фильтру запроса.
+    """
+
+    def select_filter(statement: sa.Select[tuple[CrudParentModel]]) -> sa.Select[tuple[CrudParentModel]]:
+        return statement.where(CrudParentModel.int_column >= 5)
+
+    assert await db_crud_repository.delete_where(select_filter) == 16
+    assert set(await db_crud_repository.get_all()) == {model for model in MODELS if model.int_column < 5}
+    assert await db_crud_repository.delete_where(select_filter) == 0
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_update_where(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем обновление моделей по фильтру запроса.
+    """
+
+    def select_filter(statement: sa.Select[tuple[CrudParentModel]]) -> sa.Select[tuple[CrudParentModel]]:
+        return statement.where(CrudParentModel.type == CrudModelTypeEnum.CHILD_A)
+
+    assert await db_crud_repository.update_where(select_filter, {'int_column': 100}) == len(CHILD_A_MODELS)
+    assert await db_crud_repository.aggregate(
+        {'total': (AggregateFunctionEnum.SUM, 'int_column')}, select_filter=select_filter
+    ) == [{'total': 100 * len(CHILD_A_MODELS)}]
+    assert await db_crud_repository.count(
+        select_filter=lambda statement: statement.where(CrudParentModel.int_column == 100)
+    ) == len(CHILD_A_MODELS)
+    with pytest.raises(ValueError):
+        await db_crud_repository.update_where(select_filter, {'id': uuid.uuid4()})
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_ids_chunks(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем получение и удаление моделей по идентификаторам пачками.
+    """
+    mocker.patch.object(ModelDbRepository, 'ids_chunk_size', 7)
+    statement_cache = StatementCache()
+    mocker.patch.object(ModelDbRepository, 'statement_cache', statement_cache)
+    ids = [model.id for model in MODELS]
+    models = await db_crud_repository.get_by_ids([*ids, *ids[:3]])
+    assert len(models) == len(MODELS)
+    assert set(models) == set(MODELS)
+    assert set(await db_crud_repository.get_by_ids(ids, exact=True)) == set(MODELS)
+    assert set(await db_crud_repository.get_by_ids(ids[:3])) == set(MODELS[:3])
+    with pytest.raises(ModelNotFoundError):
+        await db_crud_repository.get_by_ids([*ids, uuid.uuid4()], exact=True)
+    assert len(statement_cache.statements) == 1
+    await db_crud_repository.delete(ids[:20])
+    assert set(await db_crud_repository.get_by_ids(ids)) == set(MODELS[20:])
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_query_metrics(db_crud_repository: ModelDbRepository, caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Тестируем метрики запросов, размеченных методами репозитория, и журнал медленных запросов.
+    """
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+    register_query_metrics({'test': cast(AsyncEngine, session.bind)}, slow_query_threshold=0, slow_query_explain=True)
+    try:
+        with caplog.at_level(logging.WARNING, logger='fast_clean.contrib.monitoring.queries'):
+            assert await db_crud_repository.get_or_none(MODELS[0].id) == MODELS[0]
+            assert {model async for batch in db_crud_repository.stream_all(batch_size=7) for model in batch} == set(
+                MODELS
+            )
+    finally:
+        unregister_query_metrics('test')
+    get_labels = {'engine': 'test', 'repository': 'ModelDbRepository', 'method': 'get_or_none'}
+    stream_labels = {'engine': 'test', 'repository': 'ModelDbRepository', 'method': 'stream_all'}
+    assert QUERY_DURATION.get(get_labels)['count'] == 1
+    assert QUERY_ROWS.get(get_labels) == 1
+    assert QUERY_ROWS.get(stream_labels) != 0
+    get_record = next(record for record in caplog.records if getattr(record, 'method', None) == 'get_or_none')
+    assert 'actual time' in get_record.__dict__['plan']
+    assert get_query_tag() is None
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_core_read(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем чтение моделей без загрузки моделей SQLAlchemy.
+    """
+    mocker.patch.object(ModelDbRepository, 'core_read', True)
+    session = cast(SessionManagerImpl, db_crud_repository.session_manager).session
+    for expected_model in MODELS:
+        assert await db_crud_repository.get(expected_model.id) == expected_model
+    assert set(await db_crud_repository.get_by_ids([model.id for model in MODELS])) == set(MODELS)
+    assert set(await db_crud_repository.get_all()) == set(MODELS)
+    assert {model async for batch in db_crud_repository.stream_all(batch_size=7) for model in batch} == set(MODELS)
+    pagination_result = await db_crud_repository.paginate(PaginationSchema(limit=5, offset=5), sorting=['str_column'])
+    assert pagination_result.objects == sorted(MODELS, key=lambda model: model.str_column)[5:10]
+    cursor_pagination_result = await db_crud_repository.paginate_by_cursor(
+        CursorPaginationSchema(limit=5), sorting=['-int_column']
+    )
+    assert len(cursor_pagination_result.objects) == 5
+    assert len(session.identity_map) == 0
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_db_core_read_child(db_crud_repository: ModelDbRepository, mocker: MockerFixture) -> None:
+    """
+    Тестируем чтение моделей наследника без загрузки моделей SQLAlchemy.
+    """
+    mocker.patch.object(ChildAModelDbRepository, 'core_read', True)
+    repository = ChildAModelDbRepository(db_crud_repository.session_manager)
+    assert await repository.get(CHILD_A_MODELS[0].id) == CHILD_A_MODELS[0]
+    assert set(await repository.get_all()) == set(CHILD_A_MODELS)
+    assert await repository.count() == len(CHILD_A_MODELS)
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+@pytest.mark.parametrize('core_read', [False, True])
+async def test_db_trusted_read(db_crud_repository: ModelDbRepository, mocker: MockerFixture, core_read: bool) -> None:
+    """
+    Тестируем создание схем без проверки при чтении из базы данных.
+    """
+    mocker.patch.object(ModelDbRepository, 'core_read', core_read)
+    mocker.patch.object(ModelDbRepository, 'trusted_read', True)
+    validate_python = mocker.spy(db_crud_repository.read_schema_adapters_mapping[CrudParentModel], 'validate_python')
+    actual_models = await db_crud_repository.get_all()
+    assert set(actual_models) == set(MODELS)
+    assert {type(model) for model in actual_models} == {type(model) for model in MODELS}
+    validate_python.assert_not_called()
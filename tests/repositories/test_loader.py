@@ -0,0 +1,68 @@
+"""
+Модуль, содержащий тесты загрузчика моделей.
+"""
+
+import asyncio
+import uuid
+from typing import cast
+
+import pytest
+from fast_clean.db import SessionManagerImpl
+from fast_clean.exceptions import ModelNotFoundError
+from fast_clean.repositories import CrudDataLoader
+from pytest_mock import MockerFixture
+
+from .repositories import ModelDbRepository, ModelRepositoryProtocol
+from .test_crud import MODELS
+
+
+@pytest.mark.parametrize('crud_repository', [('in_memory', MODELS), ('db', MODELS)], indirect=True)
+class TestCrudDataLoader:
+    """
+    Тесты загрузчика моделей.
+    """
+
+    @staticmethod
+    async def test_get(crud_repository: ModelRepositoryProtocol, mocker: MockerFixture) -> None:
+        """
+        Тестируем объединение вызовов `get` в один вызов `get_by_ids`.
+        """
+        data_loader = CrudDataLoader()
+        get_by_ids = mocker.spy(crud_repository, 'get_by_ids')
+        model_ids = [model.id for model in MODELS]
+        actual_models = await asyncio.gather(*(data_loader.get(crud_repository, id) for id in [*model_ids, *model_ids]))
+        assert actual_models == [*MODELS, *MODELS]
+        get_by_ids.assert_called_once_with(model_ids)
+
+    @staticmethod
+    async def test_get_or_none(crud_repository: ModelRepositoryProtocol, mocker: MockerFixture) -> None:
+        """
+        Тестируем получение отсутствующих моделей.
+        """
+        data_loader = CrudDataLoader()
+        get_by_ids = mocker.spy(crud_repository, 'get_by_ids')
+        non_existent_id = uuid.uuid4()
+        assert await asyncio.gather(
+            data_loader.get_or_none(crud_repository, MODELS[0].id),
+            data_loader.get_or_none(crud_repository, non_existent_id),
+        ) == [MODELS[0], None]
+        with pytest.raises(ModelNotFoundError):
+            await data_loader.get(crud_repository, non_existent_id)
+        assert get_by_ids.call_count == 2
+
+
+@pytest.mark.parametrize('db_crud_repository', [MODELS], indirect=True)
+async def test_shared_session(db_crud_repository: ModelDbRepository) -> None:
+    """
+    Тестируем загрузку моделей из нескольких репозиториев с общей сессией.
+    """
+    session_manager = cast(SessionManagerImpl, db_crud_repository.session_manager)
+    await session_manager.session.commit()
+    repositories = [db_crud_repository, ModelDbRepository(session_manager)]
+    data_loader = CrudDataLoader()
+    for _ in range(2):
+        actual_models = await asyncio.gather(
+            *(data_loader.get(repository, model.id) for model in MODELS for repository in repositories),
+            *(data_loader.get(repository, MODELS[0].id) for repository in repositories),
+        )
+        assert actual_models == [*(model for model in MODELS for _ in repositories), MODELS[0], MODELS[0]]